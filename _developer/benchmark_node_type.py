@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+Benchmark of the memory used by the XML tree with dicts, "XmlNode" and
+"XmlNodeChildren" as well as "XmlNodeList" for repeated XML nodes. Prints
+the memory in use after a traced parse (Python 3.4 and newer) and the time
+of an untraced parse.
+
+Usage: python benchmark_node_type.py [SOURCE_DIRECTORY] [NODES]
+
+SOURCE_DIRECTORY defaults to the "src" directory of this checkout.
+"""
+
+# pylint: disable=import-error,invalid-name,wrong-import-position
+
+from os import path
+from time import time
+import gc
+import sys
+
+try: import tracemalloc
+except ImportError: tracemalloc = None
+
+_source_directory = (sys.argv[1] if (len(sys.argv) > 1) else path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, _source_directory)
+
+from dpt_xml import XmlNode, XmlNodeChildren, XmlNodeList, XmlResource
+
+def get_documents(nodes):
+    """
+Returns the benchmark documents.
+
+:param nodes: Number of repeated nodes per document
+
+:return: (list) List of document name, XML document and element count
+         tuples
+:since:  v1.1.0
+    """
+
+    return [ ( "mixed",
+               "<root>{0}</root>".format("".join("<item id='{0:d}'><name>n</name><price>1</price><tags><t>a</t><t>b</t></tags></item>".format(i) for i in range(nodes))),
+               1 + 6 * nodes
+             ),
+             ( "leafy",
+               "<root>{0}</root>".format("<r><a>1</a><b>2</b><c>3</c><d>4</d></r>" * nodes),
+               1 + 5 * nodes
+             )
+           ]
+#
+
+def get_xml_resource(node_type, children_type, mtree_type):
+    """
+Returns a new XmlResource instance configured with the given types.
+
+:param node_type: Dict implementation for new nodes
+:param children_type: Dict implementation for XML nodes with children
+:param mtree_type: Container type for repeated XML nodes
+
+:return: (object) XmlResource instance
+:since:  v1.1.0
+    """
+
+    _return = XmlResource(node_type = node_type)
+    _return.children_type = children_type
+    _return.mtree_type = mtree_type
+
+    return _return
+#
+
+def run(nodes):
+    """
+Parses the benchmark documents with all type combinations and prints the
+results.
+
+:param nodes: Number of repeated nodes per document
+
+:since: v1.1.0
+    """
+
+    variants = [ ( dict, None ), ( XmlNode, XmlNodeChildren ) ]
+
+    for name, data, elements in get_documents(nodes):
+        for node_type, children_type in variants:
+            for mtree_type in ( None, XmlNodeList ):
+                xml_resource = get_xml_resource(node_type, children_type, mtree_type)
+
+                timestamp = time()
+                xml_resource.parse(data)
+                duration = time() - timestamp
+
+                memory = "n/a"
+
+                if (tracemalloc is not None):
+                    xml_resource = None
+                    gc.collect()
+
+                    tracemalloc.start()
+
+                    xml_resource = get_xml_resource(node_type, children_type, mtree_type)
+                    xml_resource.parse(data)
+
+                    size = tracemalloc.get_traced_memory()[0]
+                    memory = "{0:.1f} MB, {1:.0f} B/element".format(size / 1048576.0, float(size) / elements)
+
+                    tracemalloc.stop()
+                #
+
+                print("{0:<6} {1:<8} {2:<11} parse {3:.3f}s, memory {4}".format(name,
+                                                                              node_type.__name__,
+                                                                              ("dict" if (mtree_type is None) else mtree_type.__name__),
+                                                                              duration,
+                                                                              memory
+                                                                             ))
+
+                xml_resource = None
+            #
+        #
+    #
+#
+
+if (__name__ == "__main__"): run(int(sys.argv[2]) if (len(sys.argv) > 2) else 20000)
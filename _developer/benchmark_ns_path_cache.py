@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+Benchmark of the predefined namespace path caches for documents with and
+without namespaces. Prints the parse time, the number of cached node paths
+and the memory in use after a second, traced parse (Python 3.4 and newer).
+
+Usage: python benchmark_ns_path_cache.py [SOURCE_DIRECTORY] [NODES]
+
+SOURCE_DIRECTORY defaults to the "src" directory of this checkout. Run it
+with the "src" directory of another revision to compare results.
+"""
+
+# pylint: disable=import-error,invalid-name,wrong-import-position
+
+from os import path
+from time import time
+import gc
+import sys
+
+try: import tracemalloc
+except ImportError: tracemalloc = None
+
+_source_directory = (sys.argv[1] if (len(sys.argv) > 1) else path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, _source_directory)
+
+from dpt_xml import XmlResource
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+"""
+Atom namespace URI
+"""
+
+def get_documents(nodes):
+    """
+Returns the benchmark documents.
+
+:param nodes: Number of repeated nodes per document
+
+:return: (list) List of document name and XML document tuples
+:since:  v1.1.0
+    """
+
+    return [ ( "regular", "<r>{0}</r>".format("".join("<item id='{0:d}'><a>1</a><b>2</b></item>".format(i) for i in range(nodes))) ),
+             ( "distinct", "<r>{0}</r>".format("".join("<g{0:d}><a{0:d}>1</a{0:d}><b>2</b></g{0:d}>".format(i) for i in range(nodes // 2))) ),
+             ( "atom", "<feed xmlns='{0}'>{1}</feed>".format(ATOM_NS, "".join("<entry><id>{0:d}</id><title>t</title></entry>".format(i) for i in range(nodes))) )
+           ]
+#
+
+def run(nodes):
+    """
+Parses the benchmark documents and prints the results.
+
+:param nodes: Number of repeated nodes per document
+
+:since: v1.1.0
+    """
+
+    for name, data in get_documents(nodes):
+        xml_resource = XmlResource()
+        xml_resource.register_ns("atom", ATOM_NS)
+
+        timestamp = time()
+        xml_resource.parse(data)
+        duration = time() - timestamp
+
+        memory = "n/a"
+
+        if (tracemalloc is not None):
+            xml_resource = None
+            gc.collect()
+
+            tracemalloc.start()
+
+            xml_resource = XmlResource()
+            xml_resource.register_ns("atom", ATOM_NS)
+            xml_resource.parse(data)
+
+            memory = "{0:.1f} MB".format(tracemalloc.get_traced_memory()[0] / 1048576.0)
+            tracemalloc.stop()
+        #
+
+        print("{0:<9} parse {1:.3f}s, cached node paths {2:d}, memory {3}".format(name,
+                                                                                 duration,
+                                                                                 len(xml_resource.data_ns_predefined_default),
+                                                                                 memory
+                                                                                ))
+    #
+#
+
+if (__name__ == "__main__"): run(int(sys.argv[2]) if (len(sys.argv) > 2) else 100000)
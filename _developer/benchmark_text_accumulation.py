@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+Benchmark of documents with large text nodes made up of many character data
+callbacks (entity references split the text) in tree and merged mode.
+
+Usage: python benchmark_text_accumulation.py [SOURCE_DIRECTORY] [CHUNKS]
+
+SOURCE_DIRECTORY defaults to the "src" directory of this checkout. Run it
+with the "src" directory of another revision to compare results.
+"""
+
+# pylint: disable=import-error,invalid-name,wrong-import-position
+
+from os import path
+from time import time
+import sys
+
+_source_directory = (sys.argv[1] if (len(sys.argv) > 1) else path.join(path.dirname(path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, _source_directory)
+
+from dpt_xml import XmlResource
+
+def get_document(chunks):
+    """
+Returns a document with two text nodes of the given number of chunks each.
+
+:param chunks: Number of entity separated chunks per text node
+
+:return: (str) XML document
+:since:  v1.1.0
+    """
+
+    body = "QUJD&amp;" * chunks
+    return "<a><att>{0}</att><b>{0}</b></a>".format(body)
+#
+
+def run(chunks):
+    """
+Parses the benchmark document in tree and merged mode and prints the time
+taken.
+
+:param chunks: Number of entity separated chunks per text node
+
+:since: v1.1.0
+    """
+
+    data = get_document(chunks)
+    print("Document size: {0:.1f} MB".format(len(data) / 1048576.0))
+
+    for treemode in ( True, False ):
+        xml_resource = XmlResource()
+        timestamp = time()
+
+        if (treemode): xml_resource.parse(data)
+        else: xml_resource.xml_to_merged_dict(data)
+
+        print("{0:<6} mode: {1:.3f}s".format(("tree" if (treemode) else "merged"), time() - timestamp))
+    #
+#
+
+if (__name__ == "__main__"): run(int(sys.argv[2]) if (len(sys.argv) > 2) else 200000)
@@ -17,11 +17,14 @@ setup.py
 """
 
 from os import makedirs, path
+from sys import version_info
 
 try:
     from setuptools import find_packages, setup
+    from setuptools.command.build_py import build_py
 except ImportError:
     from distutils import find_packages, setup
+    from distutils.command.build_py import build_py
 #
 
 _use_dist_mode = False
@@ -45,6 +48,48 @@ Returns the version currently in development.
     return "v1.0.2"
 #
 
+def get_build_py_class(build_py_class):
+    """
+Returns a "build_py" command class skipping modules not supported by the
+Python version in use.
+
+:param build_py_class: "build_py" command class to extend
+
+:return: (object) "build_py" command class
+:since:  v1.1.0
+    """
+
+    class _BuildPy(build_py_class):
+        """
+"build_py" command skipping modules not supported by the Python version in
+use.
+        """
+
+        def find_package_modules(self, package, package_dir):
+            """
+Returns the modules of the given package supported by the Python version
+in use.
+
+:param package: Package name
+:param package_dir: Package directory
+
+:return: (list) List of package, module and file name tuples
+:since:  v1.1.0
+            """
+
+            _return = build_py_class.find_package_modules(self, package, package_dir)
+
+            if (version_info[:2] < ( 3, 6 )):
+                _return = [ module_data for module_data in _return if module_data[1] != "xml_parser_async_mixin" ]
+            #
+
+            return _return
+        #
+    #
+
+    return _BuildPy
+#
+
 _setup = { "version": get_version()[1:],
            "data_files": [ ( "docs", [ "LICENSE", "README" ]) ],
            "test_suite": "tests"
@@ -53,6 +98,7 @@ _setup = { "version": get_version()[1:],
 if (_use_dist_mode):
     _setup['package_dir'] = { "": "src" }
     _setup['packages'] = find_packages("src")
+    _setup['cmdclass'] = { "build_py": get_build_py_class(build_py) }
 
     setup(**_setup)
 else:
@@ -72,7 +118,7 @@ else:
         _setup['packages'] = [ "dpt_xml" ]
 
         # Customize "cmdclass" to first run builder.py
-        _setup['cmdclass'] = { "build_py": BuildPy, "sdist": Sdist }
+        _setup['cmdclass'] = { "build_py": get_build_py_class(BuildPy), "sdist": Sdist }
 
         setup(**_setup)
     #
@@ -17,5 +17,16 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
+from .xml_columnar_document import XmlColumnarDocument
+from .xml_empty_mapping import XmlEmptyMapping
+from .xml_immutable_dict import XmlImmutableDict
+from .xml_names_table import XmlNamesTable
+from .xml_node import XmlNode
+from .xml_node_children import XmlNodeChildren
+from .xml_node_list import XmlNodeList
+from .xml_node_path import XmlNodePath
+from .xml_ns_scope import XmlNsScope
 from .xml_parser import XmlParser
 from .xml_resource import XmlResource
+from .xml_parser_pool import XmlParserPool
+from .xml_query import XmlQuery
@@ -45,6 +45,10 @@ implementations.
 
     # pylint: disable=unused-argument
 
+    DEFAULT_TEXT_BUFFER_SIZE = 65536
+    """
+Default size of the buffer used to join character data
+    """
     MODE_MERGED = 1
     """
 Non standard compliant merged parser mode
@@ -54,7 +58,15 @@ Non standard compliant merged parser mode
 Tree parsing mode
     """
 
-    __slots__ = [ "_log_handler", "_merged_mode", "parser", "_strict_mode" ]
+    __slots__ = [ "_encoding",
+                  "_exclude_paths_trie",
+                  "_include_paths_trie",
+                  "_log_handler",
+                  "_merged_mode",
+                  "parser",
+                  "_strict_mode",
+                  "text_buffer_size"
+                ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -72,6 +84,18 @@ Constructor __init__(XmlParserExpat)
 
         if (log_handler is not None): log_handler.debug("#echo(__FILEPATH__)# -{0!r}.__init__()- (#echo(__LINE__)#)", self)
 
+        self._encoding = None
+        """
+Encoding overriding the one declared by the XML document
+        """
+        self._exclude_paths_trie = None
+        """
+Node paths excluded from the XML tree as nested dicts of node names
+        """
+        self._include_paths_trie = None
+        """
+Node paths the XML tree is limited to as nested dicts of node names
+        """
         self._log_handler = None
         """
 The log handler is called whenever debug messages should be logged or errors
@@ -89,6 +113,50 @@ Container for the XML document
         """
 True to be standard conform
         """
+        self.text_buffer_size = AbstractXmlParser.DEFAULT_TEXT_BUFFER_SIZE
+        """
+Size of the buffer used to join character data before it is passed to the
+handlers; 0 to disable buffering
+        """
+    #
+
+    @property
+    def encoding(self):
+        """
+Returns the encoding overriding the one declared by the XML document.
+
+:return: (str) Encoding; None to use the declared one
+:since:  v1.1.0
+        """
+
+        return self._encoding
+    #
+
+    @encoding.setter
+    def encoding(self, encoding):
+        """
+Sets the encoding overriding the one declared by the XML document.
+
+:param encoding: Encoding; None to use the declared one
+
+:since: v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.encoding({1})- (#echo(__LINE__)#)", self, encoding)
+
+        self._encoding = encoding
+    #
+
+    @property
+    def is_parsing(self):
+        """
+Returns true if an incremental parsing operation is in progress.
+
+:return: (bool) True if data has been fed but not closed yet
+:since:  v1.1.0
+        """
+
+        return False
     #
 
     @property
@@ -176,6 +244,90 @@ Changes the parser mode regarding being strict standard compliant.
         else: self._strict_mode = False
     #
 
+    def close(self):
+        """
+Finishes an incremental parsing operation and returns the result in the
+format set by "mode" and "strict_standard_mode".
+
+:return: (dict) Multi-dimensional or merged XML tree; None on error
+:since:  v1.1.0
+        """
+
+        raise RuntimeError("Not implemented")
+    #
+
+    def feed(self, data):
+        """
+Parses the given chunk of XML data. The parser state is kept until
+"close()" is called.
+
+:param data: XML data chunk
+
+:since: v1.1.0
+        """
+
+        raise RuntimeError("Not implemented")
+    #
+
+    def get_streamed_nodes(self):
+        """
+Returns the nodes completed since the last call if a node stream is set.
+
+:return: (list) Completed XML nodes
+:since:  v1.1.0
+        """
+
+        raise RuntimeError("Not implemented")
+    #
+
+    def _is_node_path_projected(self, node_path):
+        """
+Returns true if the given node path is part of the XML tree based on the
+node paths included and excluded.
+
+:param node_path: XML node path
+
+:return: (bool) True if the node is added to the XML tree
+:since:  v1.1.0
+        """
+
+        _return = True
+
+        exclude_trie = self._exclude_paths_trie
+        include_trie = self._include_paths_trie
+
+        for node_name in node_path.split(" "):
+            if (include_trie is not None):
+                if (node_name in include_trie): include_trie = include_trie[node_name]
+                else: _return = False
+            #
+
+            if (exclude_trie is not None):
+                exclude_trie = exclude_trie.get(node_name)
+                if (exclude_trie is True): _return = False
+            #
+
+            if (not _return): break
+        #
+
+        return _return
+    #
+
+    def iter_nodes(self, chunks, node_path):
+        """
+Parses the given XML data chunks and yields each node matching the given
+path as soon as it is complete.
+
+:param chunks: Iterable of XML data chunks
+:param node_path: Path of the nodes to yield - delimiter is space
+
+:return: (object) Generator yielding XML nodes
+:since:  v1.1.0
+        """
+
+        raise RuntimeError("Not implemented")
+    #
+
     def parse(self, data):
         """
 Parses a given XML string and return the result in the format set by "mode"
@@ -187,4 +339,93 @@ and "strict_standard_mode".
 
         raise RuntimeError("Not implemented")
     #
+
+    def parse_columnar(self, data, document):
+        """
+Parses a given XML string into the array columns of the given document.
+
+:param data: XML data
+:param document: XmlColumnarDocument instance to fill
+
+:return: (object) XmlColumnarDocument instance
+:since:  v1.1.0
+        """
+
+        raise RuntimeError("Not implemented")
+    #
+
+    def reset(self):
+        """
+Resets the parser state and discards an incomplete incremental parsing
+operation.
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+
+    def set_node_projection(self, include_paths = None, exclude_paths = None):
+        """
+Limits the XML tree to the given node paths and their ancestors and
+removes the excluded node paths from it. Elements outside the projection
+are skipped while parsing.
+
+:param include_paths: List of node paths to include; None for all
+:param exclude_paths: List of node paths to exclude; None for none
+
+:since: v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.set_node_projection()- (#echo(__LINE__)#)", self)
+
+        self._include_paths_trie = (None if (include_paths is None) else AbstractXmlParser._get_paths_trie(include_paths, None))
+        self._exclude_paths_trie = (None if (exclude_paths is None or len(exclude_paths) < 1) else AbstractXmlParser._get_paths_trie(exclude_paths, True))
+    #
+
+    def set_node_stream(self, node_path = None):
+        """
+Sets the path of the nodes to be returned by "get_streamed_nodes()" instead
+of being added to the XML tree.
+
+:param node_path: Path of the nodes to stream - delimiter is space; None
+                  to disable streaming
+
+:since: v1.1.0
+        """
+
+        raise RuntimeError("Not implemented")
+    #
+
+    @staticmethod
+    def _get_paths_trie(node_paths, terminal):
+        """
+Returns the given node paths as nested dicts of node names. The last node
+name of each path refers to the given terminal value.
+
+:param node_paths: List of node paths - delimiter is space
+:param terminal: Value for the last node name of each path
+
+:return: (dict) Nested dicts of node names
+:since:  v1.1.0
+        """
+
+        _return = { }
+
+        for node_path in node_paths:
+            node_names = node_path.split(" ")
+            trie = _return
+
+            for node_name in node_names[:-1]:
+                if (node_name not in trie): trie[node_name] = { }
+
+                trie = trie[node_name]
+                if (type(trie) is not dict): break
+            #
+
+            if (type(trie) is dict): trie[node_names[-1]] = terminal
+        #
+
+        return _return
+    #
 #
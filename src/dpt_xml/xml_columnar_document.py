@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from array import array
+
+try: from array import typecodes as _ARRAY_TYPECODES
+except ImportError: _ARRAY_TYPECODES = ""
+
+_OFFSET_TYPECODE = ("q" if ("q" in _ARRAY_TYPECODES) else "l")
+"""
+Array type code used for offsets into the text buffer
+"""
+
+class XmlColumnarDocument(object):
+    """
+"XmlColumnarDocument" is a read-only XML document stored in parallel array
+columns instead of nested dicts. Elements are numbered in document order.
+Each element has its parent index (-1 for the root element), the index
+following its last descendant, its interned tag ID, the range of its value
+in a single text buffer and the range of its attributes in the attribute
+columns.
+
+Node paths are resolved on the element indexes. The "xml.item" tree of an
+element is only created by "get_node()" and "get_subtree()". Registered XML
+namespaces are not translated; node names are used as given in the
+document.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    CHILD_INDEXES_CACHE_SIZE = 256
+    """
+Maximum number of cached lists of child element indexes
+    """
+
+    __slots__ = [ "attribute_ends",
+                  "attribute_names",
+                  "attribute_starts",
+                  "attribute_value_lengths",
+                  "attribute_value_offsets",
+                  "_child_indexes_cache",
+                  "ends",
+                  "_name_ids",
+                  "names",
+                  "parents",
+                  "parser",
+                  "tags",
+                  "text",
+                  "_text_chunks",
+                  "_text_length",
+                  "value_lengths",
+                  "value_offsets"
+                ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, parser):
+        """
+Constructor __init__(XmlColumnarDocument)
+
+:param parser: XmlResource instance used to compile node paths and to
+               create XML trees
+
+:since: v1.1.0
+        """
+
+        # global: _OFFSET_TYPECODE
+
+        self.attribute_ends = array("i")
+        """
+Index following the last attribute of each element
+        """
+        self.attribute_names = array("i")
+        """
+Name ID of each attribute
+        """
+        self.attribute_starts = array("i")
+        """
+Index of the first attribute of each element
+        """
+        self.attribute_value_lengths = array(_OFFSET_TYPECODE)
+        """
+Length of each attribute value in the text buffer
+        """
+        self.attribute_value_offsets = array(_OFFSET_TYPECODE)
+        """
+Offset of each attribute value in the text buffer
+        """
+        self._child_indexes_cache = { }
+        """
+Cache of child element indexes keyed by the parent index and name ID
+        """
+        self.ends = array("i")
+        """
+Index following the last descendant of each element
+        """
+        self._name_ids = { }
+        """
+Name IDs of the interned tag and attribute names
+        """
+        self.names = [ ]
+        """
+Interned tag and attribute names
+        """
+        self.parents = array("i")
+        """
+Parent index of each element; -1 for the root element
+        """
+        self.parser = parser
+        """
+XmlResource instance used to compile node paths and to create XML trees
+        """
+        self.tags = array("i")
+        """
+Tag name ID of each element
+        """
+        self.text = ""
+        """
+Text buffer containing all values
+        """
+        self._text_chunks = [ ]
+        """
+Values added to the text buffer while parsing
+        """
+        self._text_length = 0
+        """
+Length of the text buffer while parsing
+        """
+        self.value_lengths = array(_OFFSET_TYPECODE)
+        """
+Length of each element value in the text buffer
+        """
+        self.value_offsets = array(_OFFSET_TYPECODE)
+        """
+Offset of each element value in the text buffer
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of elements
+:since:  v1.1.0
+        """
+
+        return len(self.tags)
+    #
+
+    def _add_text(self, value):
+        """
+Adds the given value to the text buffer.
+
+:param value: Value
+
+:return: (int) Offset of the value in the text buffer
+:since:  v1.1.0
+        """
+
+        _return = self._text_length
+
+        self._text_chunks.append(value)
+        self._text_length += len(value)
+
+        return _return
+    #
+
+    def count_node(self, node_path):
+        """
+Count the occurrence of a specified node. As with "XmlResource", a node
+position in the last node path segment does not match any node.
+
+:param node_path: Path to the node; delimiter is space; or a compiled path
+
+:return: (int) Counted number off matching nodes
+:since:  v1.1.0
+        """
+
+        _return = 0
+        node_path = self.parser.compile_path(node_path)
+
+        if (node_path is not None and len(node_path.segments) > 0 and node_path.segments[-1][1] < 0):
+            node_segments = node_path.segments
+            index = (self._get_index_walker(node_segments[:-1]) if (len(node_segments) > 1) else -1)
+
+            if (index >= 0 or len(node_segments) < 2): _return = len(self._get_child_indexes(index, node_segments[-1][0]))
+        #
+
+        return _return
+    #
+
+    def get_attributes(self, index):
+        """
+Returns the attributes of the given element.
+
+:param index: Element index
+
+:return: (dict) Attributes of the element
+:since:  v1.1.0
+        """
+
+        _return = { }
+
+        for position in range(self.attribute_starts[index], self.attribute_ends[index]):
+            value_offset = self.attribute_value_offsets[position]
+            _return[self.names[self.attribute_names[position]]] = self.text[value_offset:value_offset + self.attribute_value_lengths[position]]
+        #
+
+        return _return
+    #
+
+    def _get_child_indexes(self, index, node_name):
+        """
+Returns the indexes of the child elements with the given node name.
+
+:param index: Element index; -1 for the root element
+:param node_name: Node name of the child elements
+
+:return: (object) Array of element indexes
+:since:  v1.1.0
+        """
+
+        cache_key = ( index, self._name_ids.get(node_name) )
+        _return = self._child_indexes_cache.get(cache_key)
+
+        if (_return is None):
+            _return = array("i", self.iter_child_indexes(index, node_name))
+
+            if (len(self._child_indexes_cache) >= XmlColumnarDocument.CHILD_INDEXES_CACHE_SIZE): self._child_indexes_cache.clear()
+            self._child_indexes_cache[cache_key] = _return
+        #
+
+        return _return
+    #
+
+    def _get_index_walker(self, node_segments):
+        """
+Returns the element index of the given node path segments. Nodes without a
+position given refer to the last one of the same name.
+
+:param node_segments: Segments of the node path
+
+:return: (int) Element index; -1 if not found
+:since:  v1.1.0
+        """
+
+        _return = -1
+
+        for node_name, node_position, _ in node_segments:
+            child_indexes = self._get_child_indexes(_return, node_name)
+            nodes_count = len(child_indexes)
+
+            if (nodes_count < 1): _return = -1
+            elif (node_position < 0): _return = child_indexes[-1]
+            elif (node_position < nodes_count): _return = child_indexes[node_position]
+            elif (nodes_count == 1): _return = child_indexes[0]
+            else: _return = -1
+
+            if (_return < 0): break
+        #
+
+        return _return
+    #
+
+    def get_node(self, node_path, remove_metadata = True):
+        """
+Read a specified node including all children if applicable. The XML tree of
+the node is created on each call.
+
+:param node_path: Path to the node; delimiter is space; or a compiled path
+:param remove_metadata: False to not remove the xml.item node
+
+:return: (dict) XML node element; None on error
+:since:  v1.1.0
+        """
+
+        _return = None
+        index = self.get_node_index(node_path)
+
+        if (index >= 0):
+            _return = self.get_subtree(index)
+            if (remove_metadata and "xml.item" in _return): del(_return['xml.item'])
+        #
+
+        return _return
+    #
+
+    def get_node_attributes(self, node_path):
+        """
+Returns the attributes of a specified node.
+
+:param node_path: Path to the node; delimiter is space; or a compiled path
+
+:return: (dict) Attributes for the node; None if undefined
+:since:  v1.1.0
+        """
+
+        index = self.get_node_index(node_path)
+        return (None if (index < 0) else self.get_attributes(index))
+    #
+
+    def get_node_index(self, node_path):
+        """
+Returns the element index of a specified node.
+
+:param node_path: Path to the node; delimiter is space; or a compiled path
+
+:return: (int) Element index; -1 if not found
+:since:  v1.1.0
+        """
+
+        node_path = self.parser.compile_path(node_path)
+        return (-1 if (node_path is None or len(node_path.segments) < 1) else self._get_index_walker(node_path.segments))
+    #
+
+    def get_node_value(self, node_path):
+        """
+Read a specified node including all children if applicable.
+
+:param node_path: Path to the node; delimiter is space; or a compiled path
+
+:return: (str) Node value; None if undefined
+:since:  v1.1.0
+        """
+
+        index = self.get_node_index(node_path)
+        return (None if (index < 0) else self.get_value(index))
+    #
+
+    def get_subtree(self, index):
+        """
+Creates the XML tree of the given element. XML namespaces declared by its
+ancestors are inherited.
+
+:param index: Element index
+
+:return: (dict) XML node element
+:since:  v1.1.0
+        """
+
+        ancestors = [ ]
+        parent_index = self.parents[index]
+
+        while (parent_index >= 0):
+            ancestors.append(parent_index)
+            parent_index = self.parents[parent_index]
+        #
+
+        node_ptr = self.parser._create_children_node()
+
+        for ancestor_index in reversed(ancestors):
+            ns_attributes = dict(( key, value ) for key, value in self.get_attributes(ancestor_index).items()
+                                 if key == "xmlns" or key[:6] == "xmlns:"
+                                )
+
+            if (len(ns_attributes) > 0):
+                node_ptr = self.parser._convert_leaf_to_node(self.parser._create_node(node_ptr, self.get_tag(ancestor_index), "", ns_attributes))
+            #
+        #
+
+        return self._get_subtree_walker(node_ptr, index)
+    #
+
+    def _get_subtree_walker(self, node_ptr, index):
+        """
+Creates the XML tree of the given element below the given parent node.
+
+:param node_ptr: Parent XML node
+:param index: Element index
+
+:return: (dict) XML node element
+:since:  v1.1.0
+        """
+
+        _return = self.parser._create_node(node_ptr, self.get_tag(index), self.get_value(index), self.get_attributes(index))
+
+        if (self.ends[index] > index + 1):
+            _return = self.parser._convert_leaf_to_node(_return)
+
+            for child_index in self.iter_child_indexes(index):
+                self.parser._append_node(_return, self.get_tag(child_index), self._get_subtree_walker(_return, child_index))
+            #
+        #
+
+        return _return
+    #
+
+    def get_tag(self, index):
+        """
+Returns the tag of the given element.
+
+:param index: Element index
+
+:return: (str) Tag
+:since:  v1.1.0
+        """
+
+        return self.names[self.tags[index]]
+    #
+
+    def get_value(self, index):
+        """
+Returns the value of the given element.
+
+:param index: Element index
+
+:return: (str) Value
+:since:  v1.1.0
+        """
+
+        value_offset = self.value_offsets[index]
+        return self.text[value_offset:value_offset + self.value_lengths[index]]
+    #
+
+    def _get_name_id(self, name):
+        """
+Returns the ID of the given tag or attribute name. New names are interned.
+
+:param name: Tag or attribute name
+
+:return: (int) Name ID
+:since:  v1.1.0
+        """
+
+        _return = self._name_ids.get(name)
+
+        if (_return is None):
+            _return = len(self.names)
+
+            self._name_ids[name] = _return
+            self.names.append(name)
+        #
+
+        return _return
+    #
+
+    def iter_child_indexes(self, index, node_name = None):
+        """
+Iterates over the child elements of the given one.
+
+:param index: Element index; -1 for the root element
+:param node_name: Node name of the child elements; None for all
+
+:return: (object) Generator yielding element indexes
+:since:  v1.1.0
+        """
+
+        if (node_name is None): name_id = None
+        else:
+            name_id = self._name_ids.get(node_name)
+            if (name_id is None): return
+        #
+
+        child_index = index + 1
+        end = (min(len(self.tags), 1) if (index < 0) else self.ends[index])
+        ends = self.ends
+        tags = self.tags
+
+        while (child_index < end):
+            if (name_id is None or tags[child_index] == name_id): yield child_index
+            child_index = ends[child_index]
+        #
+    #
+
+    def _join_text(self):
+        """
+Joins the values added while parsing into the text buffer.
+
+:since: v1.1.0
+        """
+
+        self.text = "".join(self._text_chunks)
+
+        self._text_chunks = [ ]
+        self._text_length = len(self.text)
+    #
+#
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from .xml_immutable_dict import XmlImmutableDict
+
+class XmlEmptyMapping(XmlImmutableDict):
+    """
+"XmlEmptyMapping" is an immutable empty dict shared by all XML nodes without
+attributes. It is replaced by a dict owned by the node as soon as attributes
+are written.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _instance = None
+    """
+Shared instance
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __reduce__(self):
+        """
+python.org: The interface is currently defined as follows. [...] If a tuple
+is returned, it must be between two and six items long.
+
+:return: (tuple) Callable and arguments to recreate the empty mapping
+:since:  v1.1.0
+        """
+
+        return ( self.__class__, ( ) )
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the "official"
+string representation of an object.
+
+:return: (str) String representation
+:since:  v1.1.0
+        """
+
+        return "<{0}>".format(self.__class__.__name__)
+    #
+
+    @staticmethod
+    def get_instance():
+        """
+Returns the shared instance.
+
+:return: (object) XmlEmptyMapping instance
+:since:  v1.1.0
+        """
+
+        if (XmlEmptyMapping._instance is None): XmlEmptyMapping._instance = XmlEmptyMapping()
+        return XmlEmptyMapping._instance
+    #
+#
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+class XmlImmutableDict(dict):
+    """
+"XmlImmutableDict" is a dict raising a TypeError on all write operations.
+It is used for data shared between XML nodes. It is still a dict for
+"isinstance()" checks and JSON encoding. "copy()" returns a writable dict.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __delitem__(self, key):
+        """
+python.org: Called to implement deletion of self[key].
+
+:param key: Key
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+
+    def __ior__(self, other):
+        """
+python.org: These methods are called to implement the augmented arithmetic
+assignments.
+
+:param other: Mapping to merge
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+
+    def __reduce__(self):
+        """
+python.org: The interface is currently defined as follows. [...] If a tuple
+is returned, it must be between two and six items long.
+
+:return: (tuple) Callable and arguments to recreate the dict
+:since:  v1.1.0
+        """
+
+        return ( self.__class__, ( dict(self), ) )
+    #
+
+    def __setitem__(self, key, value):
+        """
+python.org: Called to implement assignment to self[key].
+
+:param key: Key
+:param value: Value
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+
+    def clear(self):
+        """
+python.org: Remove all items from the dictionary.
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+
+    def pop(self, key, *args):
+        """
+python.org: If key is in the dictionary, remove it and return its value,
+else return default.
+
+:param key: Key
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+
+    def popitem(self):
+        """
+python.org: Remove and return a (key, value) pair from the dictionary.
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+
+    def _raise_immutable(self):
+        """
+Raises a TypeError for write operations.
+
+:since: v1.1.0
+        """
+
+        raise TypeError("'{0}' object is immutable; use copy() to get a writable dict".format(self.__class__.__name__))
+    #
+
+    def setdefault(self, key, default = None):
+        """
+python.org: If key is in the dictionary, return its value. If not, insert
+key with a value of default and return default.
+
+:param key: Key
+:param default: Default value
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+
+    def update(self, *args, **kwargs):
+        """
+python.org: Update the dictionary with the key/value pairs from other,
+overwriting existing keys.
+
+:since: v1.1.0
+        """
+
+        self._raise_immutable()
+    #
+#
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+class XmlNamesTable(object):
+    """
+"XmlNamesTable" interns tag names, attribute names and node path segments.
+Equal names are represented by the same string instance across documents
+and parser instances. Lowercased names are remembered for the original name
+to avoid lowercasing it again.
+
+The shared table returned by "get_instance()" is used by default. It lives
+as long as the process; it is emptied once it holds "max_size" names and
+the next name is added. Call "clear()" to release all names earlier or set
+"XmlParser.names_table" to a table of its own to scope names to a parser.
+
+The table is not locked. Lookups are safe to be used from several threads
+but "hits" and "misses" are approximate then as concurrent updates may get
+lost.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    DEFAULT_MAX_SIZE = 16384
+    """
+Default maximum number of names interned by the shared table before it is
+emptied
+    """
+
+    _instance = None
+    """
+Shared instance
+    """
+
+    __slots__ = [ "hits", "_lowercase_names", "max_size", "misses", "_names" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_size = None):
+        """
+Constructor __init__(XmlNamesTable)
+
+:param max_size: Maximum number of names interned before the table is
+       emptied; None for unlimited
+
+:since: v1.1.0
+        """
+
+        self.hits = 0
+        """
+Number of names found in the table
+        """
+        self._lowercase_names = { }
+        """
+Interned lowercased names with the original name as key
+        """
+        self.max_size = max_size
+        """
+Maximum number of names interned before the table is emptied; None for
+unlimited
+        """
+        self.misses = 0
+        """
+Number of names not found in the table
+        """
+        self._names = { }
+        """
+Interned names
+        """
+    #
+
+    @property
+    def stats(self):
+        """
+Returns statistics of the interning table.
+
+:return: (dict) Number of "hits" and "misses", current "size" and
+         "max_size"
+:since:  v1.1.0
+        """
+
+        return { "hits": self.hits,
+                 "misses": self.misses,
+                 "size": len(self._names),
+                 "max_size": self.max_size
+               }
+    #
+
+    def clear(self):
+        """
+Removes all interned names and resets the statistics.
+
+:since: v1.1.0
+        """
+
+        self._lowercase_names = { }
+        self._names = { }
+
+        self.hits = 0
+        self.misses = 0
+    #
+
+    def _evict(self):
+        """
+Removes all interned names if the table is full. Names already in use stay
+valid; they are interned again on the next lookup.
+
+:since: v1.1.0
+        """
+
+        if (self.max_size is not None and len(self._names) >= self.max_size):
+            self._lowercase_names = { }
+            self._names = { }
+        #
+    #
+
+    def get(self, name):
+        """
+Returns the interned instance of the given name.
+
+:param name: Name
+
+:return: (str) Interned name
+:since:  v1.1.0
+        """
+
+        _return = self._names.get(name)
+
+        if (_return is None):
+            self.misses += 1
+            _return = name
+
+            self._evict()
+            self._names[name] = name
+        else: self.hits += 1
+
+        return _return
+    #
+
+    def get_lowercase(self, name):
+        """
+Returns the interned instance of the given name in lowercase.
+
+:param name: Name
+
+:return: (str) Interned lowercased name
+:since:  v1.1.0
+        """
+
+        _return = self._lowercase_names.get(name)
+
+        if (_return is None):
+            _return = self.get(name.lower())
+
+            if (self.max_size is not None and len(self._lowercase_names) >= self.max_size): self._lowercase_names = { }
+            self._lowercase_names[name] = _return
+        else: self.hits += 1
+
+        return _return
+    #
+
+    @staticmethod
+    def get_instance():
+        """
+Returns the table shared by all parser instances.
+
+:return: (object) XmlNamesTable instance
+:since:  v1.1.0
+        """
+
+        if (XmlNamesTable._instance is None): XmlNamesTable._instance = XmlNamesTable(XmlNamesTable.DEFAULT_MAX_SIZE)
+        return XmlNamesTable._instance
+    #
+#
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+try: from collections.abc import MutableMapping
+except ImportError: from collections import MutableMapping
+
+class XmlNode(MutableMapping):
+    """
+"XmlNode" stores the "tag", "value", "attributes" and "xmlns" keys of a XML
+node in slots instead of a dict. Additional keys (e.g. "tag_ns") are kept in
+a dict created on demand.
+
+The class can be given as "node_type" to "XmlParser" and "XmlResource".
+Set "children_type" to "XmlNodeChildren" for XML nodes with children and
+repeated XML nodes.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    SLOT_KEYS = ( "tag", "value", "attributes", "xmlns" )
+    """
+Keys stored in slots
+    """
+
+    __slots__ = [ "attributes", "_data", "tag", "value", "xmlns" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+Constructor __init__(XmlNode)
+
+:param args: Mapping or iterable of key-value pairs
+:param kwargs: Keys and values
+
+:since: v1.1.0
+        """
+
+        self._data = None
+        """
+Dict of additional keys
+        """
+
+        if (len(args) > 0): self.update(args[0])
+
+        for key in kwargs:
+            if (key in XmlNode.SLOT_KEYS): setattr(self, key, kwargs[key])
+            else: self[key] = kwargs[key]
+        #
+    #
+
+    def __contains__(self, key):
+        """
+python.org: Called to implement membership test operators.
+
+:param key: Key
+
+:return: (bool) True if the key is available
+:since:  v1.1.0
+        """
+
+        if (key in XmlNode.SLOT_KEYS): _return = hasattr(self, key)
+        else: _return = (self._data is not None and key in self._data)
+
+        return _return
+    #
+
+    def __delitem__(self, key):
+        """
+python.org: Called to implement deletion of self[key].
+
+:param key: Key
+
+:since: v1.1.0
+        """
+
+        if (key in XmlNode.SLOT_KEYS):
+            if (not hasattr(self, key)): raise KeyError(key)
+            delattr(self, key)
+        elif (self._data is None): raise KeyError(key)
+        else: del(self._data[key])
+    #
+
+    def __getitem__(self, key):
+        """
+python.org: Called to implement evaluation of self[key].
+
+:param key: Key
+
+:return: (mixed) Value
+:since:  v1.1.0
+        """
+
+        if (key in XmlNode.SLOT_KEYS):
+            try: _return = getattr(self, key)
+            except AttributeError: raise KeyError(key)
+        elif (self._data is None): raise KeyError(key)
+        else: _return = self._data[key]
+
+        return _return
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator yielding the keys
+:since:  v1.1.0
+        """
+
+        for key in XmlNode.SLOT_KEYS:
+            if (hasattr(self, key)): yield key
+        #
+
+        if (self._data is not None):
+            for key in list(self._data): yield key
+        #
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of keys
+:since:  v1.1.0
+        """
+
+        _return = (0 if (self._data is None) else len(self._data))
+
+        for key in XmlNode.SLOT_KEYS:
+            if (hasattr(self, key)): _return += 1
+        #
+
+        return _return
+    #
+
+    def __reduce__(self):
+        """
+python.org: The interface is currently defined as follows. [...] If a tuple
+is returned, it must be between two and six items long.
+
+:return: (tuple) Callable and arguments to recreate the XML node
+:since:  v1.1.0
+        """
+
+        return ( self.__class__, ( dict(self.items()), ) )
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the "official"
+string representation of an object.
+
+:return: (str) String representation
+:since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, dict(self.items()))
+    #
+
+    def __setitem__(self, key, value):
+        """
+python.org: Called to implement assignment to self[key].
+
+:param key: Key
+:param value: Value
+
+:since: v1.1.0
+        """
+
+        if (key in XmlNode.SLOT_KEYS): setattr(self, key, value)
+        elif (self._data is None): self._data = { key: value }
+        else: self._data[key] = value
+    #
+
+    def copy(self):
+        """
+Returns a shallow copy of this XML node.
+
+:return: (object) XmlNode instance
+:since:  v1.1.0
+        """
+
+        return self.__class__(self)
+    #
+
+    def get(self, key, default = None):
+        """
+python.org: Return the value for key if key is in the dictionary, else
+default.
+
+:param key: Key
+:param default: Default value
+
+:return: (mixed) Value or default value
+:since:  v1.1.0
+        """
+
+        if (key in XmlNode.SLOT_KEYS): _return = getattr(self, key, default)
+        elif (self._data is None): _return = default
+        else: _return = self._data.get(key, default)
+
+        return _return
+    #
+#
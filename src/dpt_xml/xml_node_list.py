@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+try: from collections.abc import MutableMapping
+except ImportError: from collections import MutableMapping
+
+class XmlNodeList(MutableMapping):
+    """
+"XmlNodeList" is a list-backed container for repeated XML nodes. It provides
+the mapping interface of "xml.mtree" nodes with the node positions as keys
+and "xml.mtree" as the position of the last node. Nodes are appended in O(1)
+and removing a node renumbers the following ones without rebuilding the
+container.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_nodes" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, nodes = None):
+        """
+Constructor __init__(XmlNodeList)
+
+:param nodes: Iterable of XML nodes
+
+:since: v1.1.0
+        """
+
+        self._nodes = ([ ] if (nodes is None) else list(nodes))
+        """
+List of XML nodes
+        """
+    #
+
+    def __contains__(self, key):
+        """
+python.org: Called to implement membership test operators.
+
+:param key: Node position or "xml.mtree"
+
+:return: (bool) True if the key is available
+:since:  v1.1.0
+        """
+
+        return (key == "xml.mtree" or (type(key) is int and 0 <= key < len(self._nodes)))
+    #
+
+    def __delitem__(self, key):
+        """
+python.org: Called to implement deletion of self[key].
+
+:param key: Node position
+
+:since: v1.1.0
+        """
+
+        if (type(key) is not int or key < 0 or key >= len(self._nodes)): raise KeyError(key)
+        del(self._nodes[key])
+    #
+
+    def __getitem__(self, key):
+        """
+python.org: Called to implement evaluation of self[key].
+
+:param key: Node position or "xml.mtree"
+
+:return: (mixed) XML node or position of the last node
+:since:  v1.1.0
+        """
+
+        if (key == "xml.mtree"): _return = len(self._nodes) - 1
+        elif (type(key) is int and 0 <= key < len(self._nodes)): _return = self._nodes[key]
+        else: raise KeyError(key)
+
+        return _return
+    #
+
+    def __iter__(self):
+        """
+python.org: Return an iterator object.
+
+:return: (object) Iterator yielding the node positions and "xml.mtree"
+:since:  v1.1.0
+        """
+
+        for node_position in range(len(self._nodes)): yield node_position
+        yield "xml.mtree"
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of keys including "xml.mtree"
+:since:  v1.1.0
+        """
+
+        return len(self._nodes) + 1
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the "official"
+string representation of an object.
+
+:return: (str) String representation
+:since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, self._nodes)
+    #
+
+    def __setitem__(self, key, value):
+        """
+python.org: Called to implement assignment to self[key]. The position
+following the last node appends the given node. "xml.mtree" is derived from
+the number of nodes and can not be set.
+
+:param key: Node position
+:param value: XML node
+
+:since: v1.1.0
+        """
+
+        if (type(key) is not int or key < 0 or key > len(self._nodes)): raise KeyError(key)
+
+        if (key == len(self._nodes)): self._nodes.append(value)
+        else: self._nodes[key] = value
+    #
+
+    def append(self, node):
+        """
+Appends the given XML node.
+
+:param node: XML node
+
+:since: v1.1.0
+        """
+
+        self._nodes.append(node)
+    #
+
+    def copy(self):
+        """
+Returns a shallow copy of this container.
+
+:return: (object) XmlNodeList instance
+:since:  v1.1.0
+        """
+
+        return self.__class__(self._nodes)
+    #
+#
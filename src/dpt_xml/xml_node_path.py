@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from .xml_names_table import XmlNamesTable
+from .xml_parser import XmlParser
+
+class XmlNodePath(object):
+    """
+"XmlNodePath" is a precompiled node path with its segments split and node
+positions parsed. Instances are created by "XmlResource.compile_path()".
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "node_path", "ns_path", "ns_version", "_predefined_path", "_predefined_segments", "segments" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, node_path, ns_path, ns, ns_version):
+        """
+Constructor __init__(XmlNodePath)
+
+:param node_path: Path to the node - delimiter is space
+:param ns_path: Path to the node with registered namespaces translated
+:param ns: Registered namespaces
+:param ns_version: Version of the registered namespaces
+
+:since: v1.1.0
+        """
+
+        self.node_path = node_path
+        """
+Path to the node - delimiter is space
+        """
+        self.ns_path = ns_path
+        """
+Path to the node with registered namespaces translated
+        """
+        self.ns_version = ns_version
+        """
+Version of the registered namespaces used to compile this path
+        """
+        self._predefined_path = None
+        """
+Last node path found for "ns_path" in the predefined namespace cache
+        """
+        self._predefined_segments = None
+        """
+Segments of the last node path found in the predefined namespace cache
+        """
+        self.segments = XmlNodePath._get_segments(node_path, ns)
+        """
+Tuple of node name, node position (-1 if not specified) and true if the
+node name uses a registered namespace for each segment
+        """
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the "official"
+string representation of an object.
+
+:return: (str) String representation
+:since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, self.node_path)
+    #
+
+    def get_segments(self, ns_predefined_default, ns):
+        """
+Returns the node path and segments to resolve based on the given cache of
+node paths with a predefined namespace.
+
+:param ns_predefined_default: Cache of node paths with a predefined NS
+:param ns: Registered namespaces
+
+:return: (tuple) Node path and its segments
+:since:  v1.1.0
+        """
+
+        node_path = ns_predefined_default.get(self.ns_path)
+
+        if (node_path is None): _return = ( self.node_path, self.segments )
+        else:
+            if (node_path != self._predefined_path):
+                self._predefined_segments = XmlNodePath._get_segments(node_path, ns)
+                self._predefined_path = node_path
+            #
+
+            _return = ( node_path, self._predefined_segments )
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_segments(node_path, ns):
+        """
+Splits the given node path into its segments. Node names are interned in
+the shared names table.
+
+:param node_path: Path to the node - delimiter is space
+:param ns: Registered namespaces
+
+:return: (tuple) Node path segments
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        if (len(node_path) > 0):
+            for node_name in node_path.split(" "):
+                re_result = XmlParser.RE_NODE_POSITION.match(node_name)
+
+                if (re_result is None): node_position = -1
+                else:
+                    node_name = re_result.group(1)
+                    node_position = int(re_result.group(2))
+                #
+
+                node_name = XmlNamesTable.get_instance().get(node_name)
+
+                re_result = XmlParser.RE_NODE_NAME_XMLNS.match(node_name)
+                _return.append(( node_name, node_position, (re_result is not None and re_result.group(1) in ns) ))
+            #
+        #
+
+        return tuple(_return)
+    #
+#
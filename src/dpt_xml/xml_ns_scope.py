@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from threading import Lock
+from weakref import WeakValueDictionary
+
+from .xml_immutable_dict import XmlImmutableDict
+
+class XmlNsScope(XmlImmutableDict):
+    """
+"XmlNsScope" is an immutable dict of XML namespace prefixes ("@" for the
+default namespace) to their compact NS or URI. Scopes are interned: equal
+scopes are represented by the same instance returned by "get_instance()".
+XML nodes share the scope of their parent node unless they declare new
+bindings. Copied or unpickled scopes are not interned.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _instances = WeakValueDictionary()
+    """
+Interned scopes in use
+    """
+    _lock = Lock()
+    """
+Thread safety lock
+    """
+
+    __slots__ = [ "__weakref__", "_derived", "_hash" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, ns = None):
+        """
+Constructor __init__(XmlNsScope)
+
+:param ns: Mapping of XML namespace prefixes
+
+:since: v1.1.0
+        """
+
+        XmlImmutableDict.__init__(self, ({ } if (ns is None) else ns))
+
+        self._derived = { }
+        """
+Scopes derived from this one for the namespace bindings changed
+        """
+        self._hash = hash(frozenset(self.items()))
+        """
+Hash of the namespace bindings
+        """
+    #
+
+    def __hash__(self):
+        """
+python.org: Called by built-in function hash() and for operations on members
+of hashed collections.
+
+:return: (int) Hash of the namespace bindings
+:since:  v1.1.0
+        """
+
+        return self._hash
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the "official"
+string representation of an object.
+
+:return: (str) String representation
+:since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, dict(self))
+    #
+
+    def derive(self, changes):
+        """
+Returns the scope with the given namespace bindings changed. Derived scopes
+are remembered to return them again without rebuilding the bindings.
+
+:param changes: Mapping of XML namespace prefixes to the compact NS or URI
+                to bind; None to remove the binding
+
+:return: (object) XmlNsScope instance
+:since:  v1.1.0
+        """
+
+        changes_key = frozenset(changes.items())
+        _return = self._derived.get(changes_key)
+
+        if (_return is None):
+            ns = self.copy()
+
+            for key in changes:
+                if (changes[key] is None): ns.pop(key, None)
+                else: ns[key] = changes[key]
+            #
+
+            _return = (self if (ns == self) else XmlNsScope.get_instance(ns))
+            self._derived[changes_key] = _return
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def get_instance(ns = None):
+        """
+Returns the interned scope for the given namespace bindings.
+
+:param ns: Mapping of XML namespace prefixes or XmlNsScope instance
+
+:return: (object) XmlNsScope instance
+:since:  v1.1.0
+        """
+
+        if (isinstance(ns, XmlNsScope)): _return = ns
+        else:
+            if (ns is None): ns = { }
+            ns_key = frozenset(ns.items())
+
+            _return = XmlNsScope._instances.get(ns_key)
+
+            if (_return is None):
+                with XmlNsScope._lock:
+                    _return = XmlNsScope._instances.get(ns_key)
+
+                    if (_return is None):
+                        _return = XmlNsScope(ns)
+                        XmlNsScope._instances[ns_key] = _return
+                    #
+                #
+            #
+        #
+
+        return _return
+    #
+#
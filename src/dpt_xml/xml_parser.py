@@ -19,6 +19,9 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=import-error,invalid-name,unused-import,wrong-import-position
 
+from collections import OrderedDict
+from sys import version_info
+from threading import local
 from weakref import proxy, ProxyTypes
 import re
 
@@ -30,6 +33,23 @@ except ImportError:
     from cgi import escape as html_escape
 #
 
+try: from mmap import mmap, ACCESS_READ
+except ImportError: mmap = None
+
+try: from multiprocessing import cpu_count, Pool
+except ImportError: Pool = None
+
+try: from queue import Empty, Queue
+except ImportError: from Queue import Empty, Queue
+
+try: from types import MappingProxyType
+except ImportError: MappingProxyType = dict
+
+_POOL_ERROR_CALLBACK = (version_info[0] > 2)
+"""
+True if "Pool.apply_async()" supports an error callback
+"""
+
 _IMPLEMENTATION_JAVA = 1
 """
 Java based Python implementation
@@ -52,6 +72,13 @@ except NameError:
 #
 
 from .abstract_xml_parser import AbstractXmlParser
+from .xml_empty_mapping import XmlEmptyMapping
+from .xml_names_table import XmlNamesTable
+from .xml_node_list import XmlNodeList
+from .xml_ns_scope import XmlNsScope
+
+if (version_info[:2] >= ( 3, 6 )): from .xml_parser_async_mixin import XmlParserAsyncMixin
+else: XmlParserAsyncMixin = object
 
 try:
     import java.lang.System
@@ -68,7 +95,12 @@ if (_mode is None):
     _mode = _IMPLEMENTATION_PYTHON
 #
 
-class XmlParser(object):
+_thread_local = local()
+"""
+Thread-local storage of reusable parser instances
+"""
+
+class XmlParser(XmlParserAsyncMixin):
     """
 This class provides a bridge between Python and XML to read XML on the fly.
 
@@ -81,6 +113,35 @@ This class provides a bridge between Python and XML to read XML on the fly.
              Mozilla Public License, v. 2.0
     """
 
+    CONFIGURATION_ATTRIBUTES = ( "children_type",
+                                 "data_cdata_encoding",
+                                 "data_charset",
+                                 "_log_handler",
+                                 "mtree_type",
+                                 "names_table",
+                                 "node_ptr_cache_size",
+                                 "node_type",
+                                 "shared_empty_attributes",
+                                 "shared_ns_scopes",
+                                 "tag_index_on_parse",
+                                 "text_buffer_size"
+                               )
+    """
+Attributes returned by "get_configuration()"
+    """
+    FILE_CHUNK_SIZE = 1048576
+    """
+Size of XML data chunks read from files
+    """
+    NODE_PTR_CACHE_SIZE = 32
+    """
+Default maximum number of cached node pointers
+    """
+    NS_NAMES_CACHE_SIZE = 1024
+    """
+Maximum number of node and attribute names cached split into their NS
+prefix and name
+    """
     RE_ATTRIBUTES_XMLNS = re.compile("xmlns\\:", re.I)
     """
 RegExp to find xmlns attributes
@@ -104,20 +165,32 @@ compliant)
     """
 
     __slots__ = [ "__weakref__",
+                  "children_type",
                   "_data",
-                  "data_cache_node",
-                  "data_cache_ptr",
                   "data_charset",
                   "data_cdata_encoding",
                   "data_ns",
                   "data_ns_compact",
+                  "data_ns_compact_prefix",
                   "data_ns_counter",
                   "data_ns_default",
+                  "data_ns_prefix",
                   "data_ns_predefined_compact",
                   "data_ns_predefined_default",
                   "_log_handler",
+                  "mtree_type",
+                  "names_table",
+                  "_node_ptr_cache",
+                  "_node_ptr_cache_hits",
+                  "_node_ptr_cache_misses",
+                  "node_ptr_cache_size",
+                  "_ns_names_cache",
                   "node_type",
-                  "parser_instance"
+                  "parser_instance",
+                  "shared_empty_attributes",
+                  "shared_ns_scopes",
+                  "_tag_index",
+                  "tag_index_on_parse"
                 ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
@@ -138,17 +211,14 @@ Constructor __init__(XmlParser)
 
         # global: _IMPLEMENTATION_MONO, _mode
 
-        self._data = None
+        self.children_type = None
         """
-XML data
-        """
-        self.data_cache_node = ""
+Dict implementation used to create XML nodes with children and containers of
+repeated XML nodes; None to use "node_type"
         """
-Path of the cached node pointer
-        """
-        self.data_cache_ptr = None
+        self._data = None
         """
-Reference of the cached node pointer (string if unset)
+XML data
         """
         self.data_charset = xml_charset.upper()
         """
@@ -158,13 +228,17 @@ Charset used
         """
 Put embedded XML in a CDATA node
         """
-        self.data_ns = { }
+        self.data_ns = OrderedDict()
         """
-Cache for known XML NS (URI)
+Cache for known XML NS (URI) in the order registered
         """
         self.data_ns_compact = { }
         """
 Cache for the compact number of a XML NS
+        """
+        self.data_ns_compact_prefix = { }
+        """
+Cache for the registered prefix of a compact number of a XML NS
         """
         self.data_ns_counter = 0
         """
@@ -173,19 +247,56 @@ Counter for the compact link numbering
         self.data_ns_default = { }
         """
 Cache for the XML NS and the corresponding number
+        """
+        self.data_ns_prefix = { }
+        """
+Cache for the registered prefix of a XML NS (URI)
         """
         self.data_ns_predefined_compact = { }
         """
-Cache of node paths with a predefined NS (key = Compact name)
+Cache of node paths with a predefined NS (key = Compact name). Node paths
+without NS are not cached.
         """
         self.data_ns_predefined_default = { }
         """
-Cache of node paths with a predefined NS (key = Full name)
+Cache of node paths with a predefined NS (key = Full name). Node paths
+without NS are not cached.
         """
         self._log_handler = None
         """
 The log handler is called whenever debug messages should be logged or errors
 happened.
+        """
+        self.mtree_type = None
+        """
+Container type for repeated XML nodes ("XmlNodeList"); None to use
+"node_type" with integer keys
+        """
+        self.names_table = XmlNamesTable.get_instance()
+        """
+Table used to intern tag and attribute names; shared by all parser
+instances by default
+        """
+        self._node_ptr_cache = OrderedDict()
+        """
+LRU cache of node pointers and their node path without positions (key =
+translated node path)
+        """
+        self._node_ptr_cache_hits = 0
+        """
+Number of node lookups started from a cached node pointer
+        """
+        self._node_ptr_cache_misses = 0
+        """
+Number of node lookups started from the XML tree root
+        """
+        self.node_ptr_cache_size = XmlParser.NODE_PTR_CACHE_SIZE
+        """
+Maximum number of cached node pointers
+        """
+        self._ns_names_cache = { }
+        """
+Cache of node and attribute names split into their NS prefix and name
         """
         self.node_type = node_type
         """
@@ -195,6 +306,26 @@ Dict implementation used to create new nodes
         """
 The selected parser implementation
         """
+        self.shared_empty_attributes = False
+        """
+True to share an immutable empty dict ("XmlEmptyMapping") between nodes
+without attributes
+        """
+        self.shared_ns_scopes = False
+        """
+True to share interned immutable XML namespace scopes ("XmlNsScope")
+between nodes instead of copying the XML namespaces into each node
+        """
+        self._tag_index = None
+        """
+Index of node paths and XML nodes (key = tag and compact NS name); None if
+not built
+        """
+        self.tag_index_on_parse = False
+        """
+True to build the tag index while parsing if supported by the parser
+implementation
+        """
 
         if (log_handler is not None): self.log_handler = log_handler
 
@@ -214,6 +345,21 @@ Return the Python representation data of this "XmlParser" instance.
         return self._data.copy()
     #
 
+    @property
+    def data_view(self):
+        """
+Returns a read-only view of the Python representation data without copying
+it. Child nodes are not wrapped. Python versions without "MappingProxyType"
+get a shallow copy instead.
+
+:return: (object) Read-only view of the Python representation data; None
+         if not parsed
+:since:  v1.1.0
+        """
+
+        return (None if (self._data is None) else MappingProxyType(self._data))
+    #
+
     @property
     def log_handler(self):
         """
@@ -239,6 +385,50 @@ Sets the log handler.
         self._log_handler = (log_handler if (isinstance(log_handler, ProxyTypes)) else proxy(log_handler))
     #
 
+    @property
+    def node_ptr_cache_stats(self):
+        """
+Returns statistics of the node pointer cache.
+
+:return: (dict) Number of "hits" and "misses", current "size" and
+         "max_size"
+:since:  v1.1.0
+        """
+
+        return { "hits": self._node_ptr_cache_hits,
+                 "misses": self._node_ptr_cache_misses,
+                 "size": len(self._node_ptr_cache),
+                 "max_size": self.node_ptr_cache_size
+               }
+    #
+
+    @property
+    def text_buffer_size(self):
+        """
+Returns the size of the buffer used by the parser implementation to join
+character data.
+
+:return: (int) Buffer size; 0 if disabled
+:since:  v1.1.0
+        """
+
+        return self.parser_instance.text_buffer_size
+    #
+
+    @text_buffer_size.setter
+    def text_buffer_size(self, size):
+        """
+Sets the size of the buffer used by the parser implementation to join
+character data.
+
+:param size: Buffer size; 0 to disable buffering
+
+:since: v1.1.0
+        """
+
+        self.parser_instance.text_buffer_size = int(size)
+    #
+
     def add_node(self, node_path, value = "", attributes = "", add_recursively = True):
         """
 Adds a XML node with content - recursively if required.
@@ -263,21 +453,21 @@ Adds a XML node with content - recursively if required.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.add_node({0})- (#echo(__LINE__)#)", node_path)
         _return = False
 
-        if (self._data is None): self._data = self.node_type()
+        if (self._data is None): self._data = self._create_children_node()
 
         if (type(node_path) == str):
+            self._tag_index = None
+
             node_path = self._translate_ns_path(node_path)
+            cached_node_data = (self._get_cached_node_ptr(node_path[:node_path.rindex(" ")]) if (" " in node_path) else None)
 
-            if (self.data_cache_node == ""
-                or re.match("^{0}(\\W|$)".format(re.escape(self.data_cache_node)), node_path, re.I) is None
-                or ("xml.item" not in self.data_cache_ptr and "xml.mtree" not in self.data_cache_ptr)
-               ):
+            if (cached_node_data is None or "xml.item" not in cached_node_data[1]):
                 node_path_done = ""
                 node_ptr = self._data
             else:
-                node_path = node_path[len(self.data_cache_node):].strip()
-                node_path_done = XmlParser.RE_NODE_POSITIONS.sub("\\2", self.data_cache_node)
-                node_ptr = self.data_cache_ptr
+                node_path = node_path[len(cached_node_data[0]):].strip()
+                node_path_done = XmlParser.RE_NODE_POSITIONS.sub("\\2", cached_node_data[0])
+                node_ptr = cached_node_data[1]
             #
 
             is_available = True
@@ -294,6 +484,8 @@ Adds a XML node with content - recursively if required.
                     node_position = int(re_result.group(2))
                 #
 
+                node_name = self.names_table.get(node_name)
+
                 if (len(nodes_list) > 0):
                     if (node_name in node_ptr):
                         is_available = True
@@ -311,12 +503,17 @@ Adds a XML node with content - recursively if required.
                             if (is_available):
                                 if ((not isinstance(mtree_node[node_position], Mapping))
                                     or "xml.item" not in mtree_node[node_position]
-                                   ): mtree_node[node_position] = self._convert_leaf_to_node(mtree_node[node_position])
+                                   ):
+                                    self._remove_cached_node_ptrs(self._get_node_path_joined(node_path_done, node_name))
+                                    mtree_node[node_position] = self._convert_leaf_to_node(mtree_node[node_position])
+                                #
 
                                 node_ptr = mtree_node[node_position]
                             #
                         elif ("xml.item" in node_ptr[node_name]): node_ptr = node_ptr[node_name]
                         else:
+                            self._remove_cached_node_ptrs(self._get_node_path_joined(node_path_done, node_name))
+
                             node_ptr[node_name] = self._convert_leaf_to_node(node_ptr[node_name])
                             node_ptr = node_ptr[node_name]
                         #
@@ -325,14 +522,13 @@ Adds a XML node with content - recursively if required.
                     if ((not is_available) and add_recursively):
                         node_dict = self.node_type(tag = node_name,
                                                    value = '',
-                                                   attributes = { },
-                                                   xmlns = { }
+                                                   attributes = self._get_empty_attributes(),
+                                                   xmlns = self._get_node_xmlns(node_ptr['xml.item'].get("xmlns")
+                                                                                if ("xml.item" in node_ptr) else
+                                                                                None
+                                                                               )
                                                   )
 
-                        if ("xml.item" in node_ptr and "xmlns" in node_ptr['xml.item']):
-                            node_dict['xmlns'] = node_ptr['xml.item']['xmlns'].copy()
-                        #
-
                         self._add_node_ns_cache(node_path_done, node_name, node_dict)
 
                         is_available = True
@@ -342,56 +538,8 @@ Adds a XML node with content - recursively if required.
                 else:
                     if (type(value) is not str): value = str(value)
 
-                    node_dict = self.node_type(tag = node_name,
-                                               value = value,
-                                               attributes = { },
-                                               xmlns = { }
-                                              )
-
-                    if ("xml.item" in node_ptr and "xmlns" in node_ptr['xml.item']): node_dict['xmlns'] = node_ptr['xml.item']['xmlns'].copy()
-
-                    if (isinstance(attributes, Mapping) and len(attributes) > 0):
-                        if ("xmlns" in attributes):
-                            if (len(attributes['xmlns']) > 0):
-                                if (attributes['xmlns'] not in self.data_ns_default):
-                                    self.data_ns_counter += 1
-                                    self.data_ns_default[attributes['xmlns']] = self.data_ns_counter
-                                    self.data_ns_compact[self.data_ns_counter] = attributes['xmlns']
-                                #
-
-                                node_dict['xmlns']['@'] = self.data_ns_default[attributes['xmlns']]
-                            elif ("@" in node_dict['xmlns']): del(node_dict['xmlns']['@'])
-                        #
-
-                        for key in attributes:
-                            value = attributes[key]
-                            value_type = type(value)
-
-                            if ((value_type in ( str, _PY_UNICODE_TYPE )) and XmlParser.RE_ATTRIBUTES_XMLNS.match(key) is not None):
-                                ns_name = key[6:]
-
-                                if (len(value) > 0): node_dict['xmlns'][ns_name] = (self.data_ns_default[value] if (value in self.data_ns_default) else value)
-                                elif (ns_name in node_dict['xmlns']): del(node_dict['xmlns'][ns_name])
-                            #
-                        #
-
-                        node_dict['attributes'] = attributes
-                    #
-
-                    if (node_name in node_ptr):
-                        if (not isinstance(node_ptr[node_name], Mapping)):
-                            node_dict[node_name] = node_ptr[node_name]
-                            node_ptr[node_name] = node_dict
-                        elif ("xml.mtree" not in node_ptr[node_name]):
-                            node_ptr[node_name] = self.node_type([ ( 0, node_ptr[node_name] ), ( 1, node_dict ) ])
-                            node_ptr[node_name]['xml.mtree'] = 1
-                        else:
-                            node_ptr[node_name]['xml.mtree'] += 1
-                            node_ptr[node_name][node_ptr[node_name]['xml.mtree']] = node_dict
-                        #
-                    else: node_ptr[node_name] = node_dict
-
-                    self._add_node_ns_cache(node_path_done, node_name, node_dict)
+                    self._remove_cached_node_ptrs(self._get_node_path_joined(node_path_done, node_name))
+                    self._add_node_to_parent(node_ptr, node_path_done, node_name, value, attributes)
 
                     _return = True
                 #
@@ -406,7 +554,8 @@ Adds a XML node with content - recursively if required.
 
     def _add_node_ns_cache(self, node_path_done, node_name, node_dict):
         """
-Caches XML namespace data for the given XML node.
+Caches XML namespace data for the given XML node. Only node paths differing
+from their compact representation are cached.
 
 :param node_path_done: XML node path containing the given XML node
 :param node_name: XML node name
@@ -415,30 +564,93 @@ Caches XML namespace data for the given XML node.
 :since: v1.0.0
         """
 
-        node_ns_name = ""
-        re_result = XmlParser.RE_NODE_NAME_XMLNS.match(node_name)
+        node_ns_name = self._get_node_ns_name(node_name, node_dict)
+        node_path_done_compact = (self.data_ns_predefined_compact.get(node_path_done) if (len(node_path_done) > 0) else None)
 
-        if (re_result is not None):
-            if (re_result.group(1) in node_dict['xmlns']
-                and type(node_dict['xmlns'][re_result.group(1)]) is int
-               ): node_ns_name = "{0}:{1}".format(node_dict['xmlns'][re_result.group(1)], re_result.group(2))
-        elif ("@" in node_dict['xmlns']): node_ns_name = "{0}:{1}".format(node_dict['xmlns']['@'], node_name)
-
-        if (len(node_path_done) > 0):
-            self.data_ns_predefined_compact["{0} {1}".format(node_path_done, node_name)] = "{0} {1}".format(self.data_ns_predefined_compact[node_path_done],
-                                                                                                            (node_name if (node_ns_name == "") else node_ns_name)
-                                                                                                           )
-
-            self.data_ns_predefined_default[self.data_ns_predefined_compact["{0} {1}".format(node_path_done, node_name)]] = "{0} {1}".format(node_path_done, node_name)
-        elif (node_ns_name == ""):
-            self.data_ns_predefined_compact[node_name] = node_name
-            self.data_ns_predefined_default[node_name] = node_name
+        if (node_ns_name == "" and node_path_done_compact is None):
+            if (len(self.data_ns_predefined_compact) > 0):
+                self.data_ns_predefined_compact.pop(self._get_node_path_joined(node_path_done, node_name), None)
+            #
         else:
-            self.data_ns_predefined_compact[node_name] = node_ns_name
-            self.data_ns_predefined_default[node_ns_name] = node_name
+            node_path = self._get_node_path_joined(node_path_done, node_name)
+
+            node_path_compact = self._get_node_path_joined((node_path_done if (node_path_done_compact is None) else node_path_done_compact),
+                                                           (node_name if (node_ns_name == "") else node_ns_name)
+                                                          )
+
+            self.data_ns_predefined_compact[node_path] = node_path_compact
+            self.data_ns_predefined_default[node_path_compact] = node_path
+        #
+    #
+
+    def _add_node_to_parent(self, node_ptr, node_path_done, node_name, value = "", attributes = None):
+        """
+Creates a new XML node and appends it to the given parent node.
+
+:param node_ptr: Parent XML node
+:param node_path_done: XML node path of the parent node
+:param node_name: XML node name
+:param value: Value for the new node
+:param attributes: Attributes of the node
+
+:return: (dict) XML node added
+:since:  v1.1.0
+        """
+
+        node_dict = self._create_node(node_ptr, node_name, value, attributes)
+
+        self._append_node(node_ptr, node_name, node_dict)
+        self._add_node_ns_cache(node_path_done, node_name, node_dict)
+
+        return node_dict
+    #
+
+    def _add_node_to_tag_index(self, node_path, node_name, node_dict):
+        """
+Adds the given XML node to the tag index. Nodes are indexed with their tag
+and, if different, their compact NS name.
+
+:param node_path: Path to the node with positions - delimiter is space
+:param node_name: XML node name
+:param node_dict: XML node
+
+:since: v1.1.0
+        """
+
+        node_entry = ( node_path, node_dict )
+        node_ns_name = self._get_node_ns_name(node_name, node_dict)
+
+        for tag in ([ node_name ] if (node_ns_name == "") else [ node_name, node_ns_name ]):
+            if (tag in self._tag_index): self._tag_index[tag].append(node_entry)
+            else: self._tag_index[tag] = [ node_entry ]
         #
     #
 
+    def _append_node(self, node_ptr, node_name, node_dict):
+        """
+Appends the given XML node to the parent node. Nodes of the same name are
+moved into a container for repeated nodes.
+
+:param node_ptr: Parent XML node
+:param node_name: XML node name
+:param node_dict: XML node
+
+:since: v1.1.0
+        """
+
+        if (node_name in node_ptr):
+            if (not isinstance(node_ptr[node_name], Mapping)):
+                node_dict[node_name] = node_ptr[node_name]
+                node_ptr[node_name] = node_dict
+            elif ("xml.mtree" not in node_ptr[node_name]): node_ptr[node_name] = self._create_mtree_node([ node_ptr[node_name], node_dict ])
+            elif (isinstance(node_ptr[node_name], XmlNodeList)): node_ptr[node_name].append(node_dict)
+            else:
+                node_ptr[node_name]['xml.mtree'] += 1
+                node_ptr[node_name][node_ptr[node_name]['xml.mtree']] = node_dict
+            #
+        else: node_ptr[node_name] = node_dict
+    #
+
     def _convert_leaf_to_node(self, node_ptr):
         """
 Convert an XML leaf to a node.
@@ -449,7 +661,243 @@ Convert an XML leaf to a node.
 :since:  v1.0.0
         """
 
-        return self.node_type([ ( "xml.item", node_ptr ) ])
+        return self._create_children_node([ ( "xml.item", node_ptr ) ])
+    #
+
+    def _create_children_node(self, items = None):
+        """
+Creates a new XML node with children or a container of repeated XML nodes of
+the type selected with "children_type".
+
+:param items: Mapping or iterable of key-value pairs
+
+:return: (dict) XML node created
+:since:  v1.1.0
+        """
+
+        children_type = (self.node_type if (self.children_type is None) else self.children_type)
+        return (children_type() if (items is None) else children_type(items))
+    #
+
+    def _create_mtree_node(self, nodes):
+        """
+Creates a container for the given repeated XML nodes of the type selected
+with "mtree_type".
+
+:param nodes: List of XML nodes
+
+:return: (object) Container of the XML nodes
+:since:  v1.1.0
+        """
+
+        if (self.mtree_type is None):
+            _return = self._create_children_node(enumerate(nodes))
+            _return['xml.mtree'] = len(nodes) - 1
+        else: _return = self.mtree_type(nodes)
+
+        return _return
+    #
+
+    def _create_node(self, node_ptr, node_name, value = "", attributes = None):
+        """
+Creates a new XML node inheriting the XML namespaces of the given parent
+node. Shared XML namespace scopes are only derived if the node declares
+namespaces. Nodes without attributes may share an immutable empty dict.
+
+:param node_ptr: Parent XML node
+:param node_name: XML node name
+:param value: Value for the new node
+:param attributes: Attributes of the node
+
+:return: (dict) XML node created
+:since:  v1.1.0
+        """
+
+        # global: _PY_UNICODE_TYPE
+
+        xmlns = self._get_node_xmlns(node_ptr['xml.item'].get("xmlns") if ("xml.item" in node_ptr) else None)
+
+        node_dict = self.node_type(tag = node_name,
+                                   value = value,
+                                   attributes = self._get_empty_attributes(),
+                                   xmlns = xmlns
+                                  )
+
+        if (isinstance(attributes, Mapping) and len(attributes) > 0):
+            ns_changes = { }
+
+            if ("xmlns" in attributes):
+                if (len(attributes['xmlns']) > 0):
+                    if (attributes['xmlns'] not in self.data_ns_default):
+                        self.data_ns_counter += 1
+                        self.data_ns_default[attributes['xmlns']] = self.data_ns_counter
+                        self.data_ns_compact[self.data_ns_counter] = attributes['xmlns']
+                    #
+
+                    ns_changes['@'] = self.data_ns_default[attributes['xmlns']]
+                else: ns_changes['@'] = None
+            #
+
+            for key in attributes:
+                value = attributes[key]
+                value_type = type(value)
+
+                if ((value_type in ( str, _PY_UNICODE_TYPE )) and XmlParser.RE_ATTRIBUTES_XMLNS.match(key) is not None):
+                    ns_name = key[6:]
+
+                    ns_changes[ns_name] = ((self.data_ns_default[value] if (value in self.data_ns_default) else value)
+                                           if (len(value) > 0) else
+                                           None
+                                          )
+                #
+            #
+
+            if (len(ns_changes) > 0): node_dict['xmlns'] = self._derive_node_xmlns(xmlns, ns_changes)
+            node_dict['attributes'] = attributes
+        #
+
+        return node_dict
+    #
+
+    def _cache_node_ptr(self, node_path, node_ptr):
+        """
+Adds the given node pointer to the LRU cache of node pointers.
+
+:param node_path: Translated path to the node - delimiter is space
+:param node_ptr: XML node
+
+:since: v1.1.0
+        """
+
+        if (self.node_ptr_cache_size > 0):
+            if (node_path in self._node_ptr_cache): del(self._node_ptr_cache[node_path])
+            elif (len(self._node_ptr_cache) >= self.node_ptr_cache_size): self._node_ptr_cache.popitem(False)
+
+            self._node_ptr_cache[node_path] = ( node_ptr,
+                                                (XmlParser.RE_NODE_POSITIONS.sub("\\2", node_path) if ("#" in node_path) else node_path)
+                                              )
+        #
+    #
+
+    def close(self):
+        """
+Finishes an incremental parsing operation started with "feed()".
+
+:return: (dict) Multi-dimensional or merged XML tree; None on error
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.close()- (#echo(__LINE__)#)")
+        return self.parser_instance.close()
+    #
+
+    def _derive_node_xmlns(self, xmlns, changes):
+        """
+Returns the XML namespaces with the given namespace bindings changed.
+Shared XML namespace scopes are derived while other ones are changed in
+place.
+
+:param xmlns: XML namespaces of the node
+:param changes: Mapping of XML namespace prefixes to the compact NS or URI
+                to bind; None to remove the binding
+
+:return: (dict) XML namespaces
+:since:  v1.1.0
+        """
+
+        if (isinstance(xmlns, XmlNsScope)): _return = xmlns.derive(changes)
+        else:
+            _return = xmlns
+
+            for key in changes:
+                if (changes[key] is not None): _return[key] = changes[key]
+                elif (key in _return): del(_return[key])
+            #
+        #
+
+        return _return
+    #
+
+    def dict_to_compact(self, xml_tree):
+        """
+Converts the given XML dict tree into a compact form of nested tuples. It is
+cheap to pickle and can be converted back with "import_compact()".
+
+Nodes are represented as "(tag, value, attributes, xmlns)" or
+"(tag, value, attributes, xmlns, children)" where children is a tuple of
+"(node_name, node)" pairs. Multiple nodes of the same name are given as a
+list. Empty attributes and XML namespaces inherited unchanged from the
+parent node are given as None. XML namespaces refer to their URI.
+
+:param xml_tree: XML dict tree
+
+:return: (tuple) Compact XML tree
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.dict_to_compact()- (#echo(__LINE__)#)")
+        return self._dict_to_compact_walker(xml_tree, { })
+    #
+
+    def _dict_to_compact_walker(self, xml_tree, xmlns):
+        """
+Converts the children of the given XML dict tree level into their compact
+form.
+
+:param xml_tree: XML dict tree level to work on
+:param xmlns: XML namespaces of the XML dict tree level
+
+:return: (tuple) Compact children
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        for node_name in xml_tree:
+            if (node_name == "xml.item"): continue
+            node = xml_tree[node_name]
+
+            if (isinstance(node, Mapping) and "xml.mtree" in node):
+                _return.append(( node_name,
+                                 [ self._dict_to_compact_node(node[node_position], xmlns) for node_position in node if node_position != "xml.mtree" ]
+                               ))
+            elif (isinstance(node, Mapping)): _return.append(( node_name, self._dict_to_compact_node(node, xmlns) ))
+            else: _return.append(( node_name, node ))
+        #
+
+        return tuple(_return)
+    #
+
+    def _dict_to_compact_node(self, node, xmlns):
+        """
+Converts the given XML node into its compact form.
+
+:param node: XML node
+:param xmlns: XML namespaces of the parent node
+
+:return: (tuple) Compact XML node
+:since:  v1.1.0
+        """
+
+        node_item = (node['xml.item'] if ("xml.item" in node) else node)
+
+        node_xmlns = None
+
+        if (node_item['xmlns'] is not xmlns and node_item['xmlns'] != xmlns):
+            node_xmlns = dict(( key, (self.data_ns_compact[value] if (type(value) is int and value in self.data_ns_compact) else value) )
+                              for key, value in node_item['xmlns'].items()
+                             )
+        #
+
+        _return = ( node_item['tag'],
+                    node_item['value'],
+                    (node_item['attributes'] if (len(node_item['attributes']) > 0) else None),
+                    node_xmlns
+                  )
+
+        if ("xml.item" in node): _return += ( self._dict_to_compact_walker(node, node_item['xmlns']), )
+
+        return _return
     #
 
     def dict_to_xml(self, xml_tree, strict_standard_mode = True):
@@ -468,11 +916,10 @@ Builds recursively a valid XML ouput reflecting the given XML dict tree.
 
         if (isinstance(xml_tree, Mapping) and len(xml_tree) > 0):
             for xml_node in xml_tree:
+                if (xml_node == "xml.item" or xml_node == "xml.mtree"): continue
                 xml_node_dict = xml_tree[xml_node]
 
-                if ("xml.mtree" in xml_node_dict):
-                    del(xml_node_dict['xml.mtree'])
-                    _return += self.dict_to_xml(xml_node_dict, strict_standard_mode)
+                if ("xml.mtree" in xml_node_dict): _return += self.dict_to_xml(xml_node_dict, strict_standard_mode)
                 elif ("xml.item" in xml_node_dict):
                     _return += self.dict_to_xml_item_encoder(xml_node_dict['xml.item'], False, strict_standard_mode)
 
@@ -481,7 +928,6 @@ Builds recursively a valid XML ouput reflecting the given XML dict tree.
                                     "digitstart__{0}".format(xml_node_dict['xml.item']['tag'])
                                    )
 
-                    del(xml_node_dict['xml.item'])
                     _return += "{0}</{1}>".format(self.dict_to_xml(xml_node_dict, strict_standard_mode), xml_node_tag)
                 elif (len(xml_node_dict['tag']) > 0): _return += self.dict_to_xml_item_encoder(xml_node_dict, True, strict_standard_mode)
             #
@@ -508,8 +954,8 @@ Builds recursively a valid XML ouput reflecting the given XML dict tree.
 
         if (isinstance(data, Mapping)):
             if (len(data['tag']) > 0):
-                if (re.match("\\d", data['tag']) is not None): data['tag'] = "digitstart__{0}".format(data['tag'])
-                _return += "<{0}".format(data['tag'])
+                tag = (data['tag'] if (XmlParser.RE_TAG_DIGIT.match(data['tag']) is None) else "digitstart__{0}".format(data['tag']))
+                _return += "<{0}".format(tag)
 
                 if ("attributes" in data):
                     for key in data['attributes']:
@@ -559,7 +1005,7 @@ Builds recursively a valid XML ouput reflecting the given XML dict tree.
                         else: _return += html_escape(value, True)
                     #
 
-                    if (close_tag): _return += "</{0}>".format(data['tag'])
+                    if (close_tag): _return += "</{0}>".format(tag)
                 #
             #
         #
@@ -567,25 +1013,456 @@ Builds recursively a valid XML ouput reflecting the given XML dict tree.
         return _return
     #
 
-    def parse(self, data, strict_standard_mode = True):
+    def feed(self, data, treemode = True, strict_standard_mode = True, encoding = None):
         """
-Parses the given XML data.
+Parses the given chunk of XML data. The parser state is kept between calls
+until "close()" is called. "treemode", "strict_standard_mode" and
+"encoding" are only applied for the first chunk of a document.
 
-:param data: Input XML data
+:param data: XML data chunk
+:param treemode: Create a multi-dimensional result
 :param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
 
-:since: v1.0.0
+:since: v1.1.0
         """
 
-        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.parse()- (#echo(__LINE__)#)")
-
-        self._data = None
-        self.data_cache_node = ""
-        self.data_cache_ptr = None
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.feed()- (#echo(__LINE__)#)")
 
-        self.parser_instance.mode = AbstractXmlParser.MODE_TREE
-        self.parser_instance.strict_standard_mode = strict_standard_mode
-        self.parser_instance.parse(data)
+        if (not self.parser_instance.is_parsing): self._prepare_parser_instance(treemode, strict_standard_mode, encoding)
+        self.parser_instance.feed(data)
+    #
+
+    def _get_cached_node_ptr(self, node_path):
+        """
+Returns the cached node pointer for the longest prefix of the given node
+path.
+
+:param node_path: Translated path to the node - delimiter is space
+
+:return: (tuple) Cached node path and node pointer; None if not cached
+:since:  v1.1.0
+        """
+
+        _return = None
+
+        if (len(self._node_ptr_cache) > 0):
+            cached_node_path = node_path
+
+            while (_return is None):
+                if (cached_node_path in self._node_ptr_cache):
+                    cached_node_data = self._node_ptr_cache.pop(cached_node_path)
+                    self._node_ptr_cache[cached_node_path] = cached_node_data
+
+                    _return = ( cached_node_path, cached_node_data[0] )
+                elif (" " in cached_node_path): cached_node_path = cached_node_path[:cached_node_path.rindex(" ")]
+                else: break
+            #
+        #
+
+        return _return
+    #
+
+    def get_configuration(self):
+        """
+Returns the configuration of this instance to be restored later with
+"set_configuration()". Registered namespaces are not part of it.
+
+:return: (dict) Configuration
+:since:  v1.1.0
+        """
+
+        return dict(( key, getattr(self, key) ) for key in self.__class__.CONFIGURATION_ATTRIBUTES)
+    #
+
+    def _get_empty_attributes(self):
+        """
+Returns the attributes for a new node without attributes. These are shared
+if "shared_empty_attributes" is true.
+
+:return: (dict) Empty attributes
+:since:  v1.1.0
+        """
+
+        return (XmlEmptyMapping.get_instance() if (self.shared_empty_attributes) else { })
+    #
+
+    def _get_node_ns_name(self, node_name, node_dict):
+        """
+Returns the compact NS name of the given XML node.
+
+:param node_name: XML node name
+:param node_dict: XML node
+
+:return: (str) Compact NS name; empty string if the node has no NS
+:since:  v1.1.0
+        """
+
+        _return = ""
+        re_result = (XmlParser.RE_NODE_NAME_XMLNS.match(node_name) if (":" in node_name) else None)
+
+        if (re_result is not None):
+            if (re_result.group(1) in node_dict['xmlns']
+                and type(node_dict['xmlns'][re_result.group(1)]) is int
+               ): _return = "{0}:{1}".format(node_dict['xmlns'][re_result.group(1)], re_result.group(2))
+        elif ("@" in node_dict['xmlns']): _return = "{0}:{1}".format(node_dict['xmlns']['@'], node_name)
+
+        return _return
+    #
+
+    def _get_node_xmlns(self, xmlns = None):
+        """
+Returns the XML namespaces for a new node inheriting the given ones. These
+are shared if "shared_ns_scopes" is true and copied otherwise.
+
+:param xmlns: XML namespaces of the parent node
+
+:return: (dict) XML namespaces
+:since:  v1.1.0
+        """
+
+        if (self.shared_ns_scopes): _return = XmlNsScope.get_instance(xmlns)
+        else: _return = ({ } if (xmlns is None) else dict(xmlns))
+
+        return _return
+    #
+
+    def _get_ns_name_data(self, name):
+        """
+Returns the given node or attribute name split into its NS prefix and name.
+
+:param name: Node or attribute name
+
+:return: (tuple) NS prefix and name; None if not prefixed
+:since:  v1.1.0
+        """
+
+        _return = self._ns_names_cache.get(name, False)
+
+        if (_return is False):
+            re_result = (XmlParser.RE_NODE_NAME_XMLNS.match(name) if (":" in name) else None)
+            _return = (None if (re_result is None) else ( re_result.group(1), re_result.group(2) ))
+
+            if (len(self._ns_names_cache) >= XmlParser.NS_NAMES_CACHE_SIZE): self._ns_names_cache.clear()
+            self._ns_names_cache[name] = _return
+        #
+
+        return _return
+    #
+
+    def _get_ns_prefix(self, ns):
+        """
+Returns the registered prefix of the given XML NS.
+
+:param ns: Compact number or URI of the XML NS
+
+:return: (str) Registered prefix; None if not registered
+:since:  v1.1.0
+        """
+
+        return (self.data_ns_compact_prefix.get(ns) if (type(ns) is int) else self.data_ns_prefix.get(ns))
+    #
+
+    def _get_tag_index(self):
+        """
+Returns the tag index and builds it if not available.
+
+:return: (dict) Lists of node paths and XML nodes with the tag or compact NS
+         name as key
+:since:  v1.1.0
+        """
+
+        if (self._tag_index is None):
+            self._tag_index = { }
+            if (self._data is not None): self._get_tag_index_walker("", self._data)
+        #
+
+        return self._tag_index
+    #
+
+    def _get_tag_index_walker(self, node_path_done, node_ptr):
+        """
+Adds the child nodes of the given XML node recursively to the tag index.
+
+:param node_path_done: Path to the given node with positions
+:param node_ptr: XML node
+
+:since: v1.1.0
+        """
+
+        node_path_prefix = (node_path_done + " " if (len(node_path_done) > 0) else "")
+
+        for node_name in node_ptr:
+            node_child = node_ptr[node_name]
+            if (node_name == "xml.item" or (not isinstance(node_child, Mapping))): continue
+
+            for node_position, node_entry in ([ ( key, node_child[key] ) for key in node_child if key != "xml.mtree" ]
+                                              if ("xml.mtree" in node_child) else
+                                              [ ( 0, node_child ) ]
+                                             ):
+                node_path = "{0}{1}#{2:d}".format(node_path_prefix, node_name, node_position)
+
+                if ("xml.item" in node_entry):
+                    self._add_node_to_tag_index(node_path, node_name, node_entry['xml.item'])
+                    self._get_tag_index_walker(node_path, node_entry)
+                else: self._add_node_to_tag_index(node_path, node_name, node_entry)
+            #
+        #
+    #
+
+    def import_compact(self, data):
+        """
+Replaces the XML tree of this instance with the one given in the compact
+form created by "dict_to_compact()".
+
+:param data: Compact XML tree
+
+:return: (dict) Multi-dimensional XML tree
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.import_compact()- (#echo(__LINE__)#)")
+
+        self.reset()
+
+        self._data = self._create_children_node()
+        self._import_compact_walker(self._data, "", data, self._get_node_xmlns())
+
+        return self._data
+    #
+
+    def _import_compact_walker(self, node_ptr, node_path, data, xmlns):
+        """
+Adds the given compact children to the XML tree level.
+
+:param node_ptr: XML tree level to work on
+:param node_path: XML node path of the XML tree level
+:param data: Compact children
+:param xmlns: XML namespaces of the XML tree level
+
+:since: v1.1.0
+        """
+
+        for node_name, node in data:
+            if (type(node) is list):
+                node_ptr[node_name] = self._create_mtree_node([ self._import_compact_node(node_path, node_name, mtree_node_data, xmlns)
+                                                                for mtree_node_data in node
+                                                              ])
+            elif (type(node) is tuple): node_ptr[node_name] = self._import_compact_node(node_path, node_name, node, xmlns)
+            else: node_ptr[node_name] = node
+        #
+    #
+
+    def _import_compact_node(self, node_path, node_name, data, xmlns):
+        """
+Creates the XML node for the given compact one.
+
+:param node_path: XML node path of the parent node
+:param node_name: XML node name
+:param data: Compact XML node
+:param xmlns: XML namespaces of the parent node
+
+:return: (dict) XML node
+:since:  v1.1.0
+        """
+
+        if (data[3] is None): node_xmlns = self._get_node_xmlns(xmlns)
+        else:
+            node_xmlns = { }
+
+            for key in data[3]:
+                value = data[3][key]
+
+                if (key == "@"):
+                    if (value not in self.data_ns_default):
+                        self.data_ns_counter += 1
+                        self.data_ns_default[value] = self.data_ns_counter
+                        self.data_ns_compact[self.data_ns_counter] = value
+                    #
+
+                    node_xmlns[key] = self.data_ns_default[value]
+                else: node_xmlns[key] = self.data_ns_default.get(value, value)
+            #
+
+            if (self.shared_ns_scopes): node_xmlns = XmlNsScope.get_instance(node_xmlns)
+        #
+
+        _return = self.node_type(tag = data[0],
+                                 value = data[1],
+                                 attributes = (self._get_empty_attributes() if (data[2] is None) else data[2]),
+                                 xmlns = node_xmlns
+                                )
+
+        self._add_node_ns_cache(node_path, node_name, _return)
+
+        if (len(data) > 4):
+            _return = self._create_children_node([ ( "xml.item", _return ) ])
+
+            self._import_compact_walker(_return,
+                                        ("{0} {1}".format(node_path, node_name) if (len(node_path) > 0) else node_name),
+                                        data[4],
+                                        node_xmlns
+                                       )
+        #
+
+        return _return
+    #
+
+    def _iter_file_chunks(self, source):
+        """
+Reads the given file chunk by chunk. Files given by path are memory-mapped
+if supported.
+
+:param source: File path or file object
+
+:return: (object) Generator yielding XML data chunks
+:since:  v1.1.0
+        """
+
+        # global: _PY_UNICODE_TYPE, mmap
+
+        if (type(source) in ( str, _PY_UNICODE_TYPE )):
+            with open(source, "rb") as file_obj:
+                mapped_data = None
+
+                if (mmap is not None):
+                    try: mapped_data = mmap(file_obj.fileno(), 0, access = ACCESS_READ)
+                    except (EnvironmentError, ValueError): pass
+                #
+
+                if (mapped_data is None):
+                    for data in self._iter_file_chunks(file_obj): yield data
+                else:
+                    try:
+                        mapped_size = len(mapped_data)
+
+                        for offset in range(0, mapped_size, XmlParser.FILE_CHUNK_SIZE):
+                            yield mapped_data[offset:offset + XmlParser.FILE_CHUNK_SIZE]
+                        #
+                    finally: mapped_data.close()
+                #
+            #
+        else:
+            data = source.read(XmlParser.FILE_CHUNK_SIZE)
+
+            while (len(data) > 0):
+                yield data
+                data = source.read(XmlParser.FILE_CHUNK_SIZE)
+            #
+        #
+    #
+
+    def iter_nodes(self, source, node_path, strict_standard_mode = True, encoding = None):
+        """
+Parses the XML data of the given file and yields each node matching the
+given path as soon as it is complete. Matching nodes are not added to the
+XML tree of this instance.
+
+:param source: File path or file object
+:param node_path: Path of the nodes to yield - delimiter is space
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+
+:return: (object) Generator yielding XML nodes
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.iter_nodes({0})- (#echo(__LINE__)#)", node_path)
+
+        self._prepare_parser_instance(True, strict_standard_mode, encoding)
+        for node in self.parser_instance.iter_nodes(self._iter_file_chunks(source), node_path): yield node
+    #
+
+    def parse(self, data, strict_standard_mode = True, encoding = None, include_paths = None, exclude_paths = None):
+        """
+Parses the given XML data.
+
+:param data: Input XML data
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+:param include_paths: List of node paths the XML tree is limited to; node
+                      positions are not supported and raise a ValueError
+:param exclude_paths: List of node paths excluded from the XML tree; node
+                      positions are not supported and raise a ValueError
+
+:since: v1.0.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.parse()- (#echo(__LINE__)#)")
+
+        self._prepare_parser_instance(True, strict_standard_mode, encoding, include_paths, exclude_paths)
+        self.parser_instance.parse(data)
+    #
+
+    def parse_file(self, source, treemode = True, strict_standard_mode = True, encoding = None, include_paths = None, exclude_paths = None):
+        """
+Parses the XML data of the given file without reading it into memory as a
+whole. Files given by path are memory-mapped if supported.
+
+:param source: File path or file object
+:param treemode: Create a multi-dimensional result
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+:param include_paths: List of node paths the XML tree is limited to; node
+                      positions are not supported and raise a ValueError
+:param exclude_paths: List of node paths excluded from the XML tree; node
+                      positions are not supported and raise a ValueError
+
+:return: (dict) Multi-dimensional XML tree or merged one; None on error
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.parse_file()- (#echo(__LINE__)#)")
+
+        self._prepare_parser_instance(treemode, strict_standard_mode, encoding, include_paths, exclude_paths)
+        for data in self._iter_file_chunks(source): self.parser_instance.feed(data)
+
+        return self.parser_instance.close()
+    #
+
+    def _prepare_parser_instance(self, treemode = True, strict_standard_mode = True, encoding = None, include_paths = None, exclude_paths = None):
+        """
+Prepares the parser instance to parse a new XML document.
+
+:param treemode: Create a multi-dimensional result
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+:param include_paths: List of node paths the XML tree is limited to; node
+                      positions are not supported and raise a ValueError
+:param exclude_paths: List of node paths excluded from the XML tree; node
+                      positions are not supported and raise a ValueError
+
+:since: v1.1.0
+        """
+
+        for node_paths in ( include_paths, exclude_paths ):
+            if (node_paths is not None):
+                for node_path in node_paths:
+                    if (XmlParser.RE_NODE_POSITIONS.search(node_path) is not None): raise ValueError("Node positions are not supported in projected node path '{0}'".format(node_path))
+                #
+            #
+        #
+
+        if (not strict_standard_mode):
+            if (include_paths is not None): include_paths = [ node_path.lower() for node_path in include_paths ]
+            if (exclude_paths is not None): exclude_paths = [ node_path.lower() for node_path in exclude_paths ]
+        #
+
+        self.parser_instance.reset()
+        self.parser_instance.encoding = encoding
+        self.parser_instance.set_node_projection(include_paths, exclude_paths)
+
+        if (treemode):
+            self._data = None
+            self._node_ptr_cache.clear()
+
+            self.parser_instance.mode = AbstractXmlParser.MODE_TREE
+            self.parser_instance.strict_standard_mode = strict_standard_mode
+        else: self.parser_instance.mode = AbstractXmlParser.MODE_MERGED
     #
 
     def register_ns(self, ns, uri):
@@ -613,6 +1490,8 @@ Registers a namespace (URI) for later use with this XML reader instance.
             self.data_ns_default[uri] = self.data_ns_counter
             self.data_ns_compact[self.data_ns_counter] = uri
         #
+
+        self._update_ns_prefixes()
     #
 
     def translate_ns(self, node):
@@ -633,28 +1512,22 @@ tag will be saved as "tag_ns" and "tag_parsed".
             _return['tag_ns'] = ""
             _return['tag_parsed'] = node['tag']
 
-            re_result = XmlParser.RE_NODE_NAME_XMLNS.match(node['tag'])
+            name_data = self._get_ns_name_data(node['tag'])
+            tag_ns = (None if (name_data is None) else self._get_ns_prefix(node['xmlns'].get(name_data[0])))
 
-            if (re_result is not None and re_result.group(1) in node['xmlns'] and node['xmlns'][re_result.group(1)] in self.data_ns_compact):
-                tag_ns = XmlParser._search_dict(self.data_ns_compact[node['xmlns'][re_result.group(1)]], self.data_ns)
-
-                if (tag_ns is not None):
-                    _return['tag_ns'] = tag_ns
-                    _return['tag_parsed'] = "{0}:{1}".format(tag_ns, re_result.group(2))
-                #
+            if (tag_ns is not None):
+                _return['tag_ns'] = tag_ns
+                _return['tag_parsed'] = "{0}:{1}".format(tag_ns, name_data[1])
             #
 
             if ("attributes" in node):
-                for key in node['attributes']:
-                    re_result = XmlParser.RE_NODE_NAME_XMLNS.match(key)
+                for key in list(node['attributes']):
+                    name_data = self._get_ns_name_data(key)
+                    tag_ns = (None if (name_data is None) else self._get_ns_prefix(node['xmlns'].get(name_data[0])))
 
-                    if (re_result is not None and re_result.group(1) in node['xmlns'] and node['xmlns'][re_result.group(1)] in self.data_ns_compact):
-                        tag_ns = XmlParser._search_dict(self.data_ns_compact[node['xmlns'][re_result.group(1)]], self.data_ns)
-
-                        if (tag_ns is not None):
-                            _return['attributes']["{0}:{1}".format(tag_ns, re_result.group(2))] = node['attributes'][key]
-                            del(_return['attributes'][key])
-                        #
+                    if (tag_ns is not None and tag_ns != name_data[0]):
+                        _return['attributes']["{0}:{1}".format(tag_ns, name_data[1])] = node['attributes'][key]
+                        del(_return['attributes'][key])
                     #
                 #
             #
@@ -679,31 +1552,93 @@ path.
         if (str is not _PY_UNICODE_TYPE and type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
 
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml._translate_ns_path({0})- (#echo(__LINE__)#)", node_path)
-        _return = node_path
 
-        nodes_list = node_path.split(" ")
-        node_path = ""
+        return self.data_ns_predefined_default.get(self._translate_ns_path_prefixes(node_path), node_path)
+    #
 
-        while (len(nodes_list) > 0):
-            node_name = nodes_list.pop(0)
-            if (len(node_path) > 0): node_path += " "
+    def _translate_ns_path_prefixes(self, node_path):
+        """
+Replaces registered namespace prefixes in the given path with their compact
+number.
 
-            if (":" in node_name):
-                re_result = XmlParser.RE_NODE_NAME_XMLNS.match(node_name)
+:param node_path: Path to the new node; delimiter is space
 
-                if (re_result is None): node_path += node_name
-                else:
-                    node_path += "{0}:{1}".format((self.data_ns_default[self.data_ns[re_result.group(1)]]
-                                                   if (re_result.group(1) in self.data_ns and self.data_ns[re_result.group(1)] in self.data_ns_default) else
-                                                   re_result.group(1)
-                                                  ),
-                                                  re_result.group(2)
-                                                 )
-            else: node_path += node_name
+:return: (str) Node path with namespace prefixes translated
+:since:  v1.1.0
+        """
+
+        if (":" in node_path):
+            nodes_list = node_path.split(" ")
+            node_path = ""
+
+            while (len(nodes_list) > 0):
+                node_name = nodes_list.pop(0)
+                if (len(node_path) > 0): node_path += " "
+
+                if (":" in node_name):
+                    re_result = XmlParser.RE_NODE_NAME_XMLNS.match(node_name)
+
+                    if (re_result is None): node_path += node_name
+                    else:
+                        node_path += "{0}:{1}".format((self.data_ns_default[self.data_ns[re_result.group(1)]]
+                                                       if (re_result.group(1) in self.data_ns and self.data_ns[re_result.group(1)] in self.data_ns_default) else
+                                                       re_result.group(1)
+                                                      ),
+                                                      re_result.group(2)
+                                                     )
+                else: node_path += node_name
+            #
         #
 
-        if (node_path in self.data_ns_predefined_default): _return = self.data_ns_predefined_default[node_path]
-        return _return
+        return node_path
+    #
+
+    def _remove_cached_node_ptrs(self, node_path):
+        """
+Removes the cached node pointers of the given node path and all of its
+descendants regardless of node positions.
+
+:param node_path: Translated path to the node without positions - delimiter
+                  is space
+
+:since: v1.1.0
+        """
+
+        node_path_prefix = node_path + " "
+
+        if (len(self._node_ptr_cache) > 0):
+            for cached_node_path in [ cached_node_path
+                                      for cached_node_path, cached_node_data in self._node_ptr_cache.items()
+                                      if (cached_node_data[1] == node_path or cached_node_data[1].startswith(node_path_prefix))
+                                    ]: del(self._node_ptr_cache[cached_node_path])
+        #
+    #
+
+    def reset(self):
+        """
+Resets this instance to parse a new XML document. Registered namespaces
+are kept.
+
+:since: v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.reset()- (#echo(__LINE__)#)")
+
+        self._data = None
+        self._node_ptr_cache.clear()
+        self._node_ptr_cache_hits = 0
+        self._node_ptr_cache_misses = 0
+        self._tag_index = None
+
+        ns_uris = self.data_ns.values()
+
+        self.data_ns_default = dict(( uri, self.data_ns_default[uri] ) for uri in ns_uris if uri in self.data_ns_default)
+        self.data_ns_compact = dict(( self.data_ns_default[uri], uri ) for uri in self.data_ns_default)
+        self.data_ns_counter = (max(self.data_ns_compact) if (len(self.data_ns_compact) > 0) else 0)
+        self.data_ns_predefined_compact = { }
+        self.data_ns_predefined_default = { }
+
+        self.parser_instance.reset()
     #
 
     def set_xml_tree(self, data_dict, overwrite = False):
@@ -722,6 +1657,9 @@ Sets the Python representation data of this "XmlResource" instance.
 
         if ((self._data is None or overwrite) and isinstance(data_dict, Mapping)):
             self._data = data_dict
+            self._node_ptr_cache.clear()
+            self._tag_index = None
+
             _return = True
         #
 
@@ -748,9 +1686,22 @@ Uses or disables CDATA nodes to encode embedded XML.
         else: self.data_cdata_encoding = False
     #
 
+    def set_configuration(self, configuration):
+        """
+Restores the configuration returned by "get_configuration()".
+
+:param configuration: Configuration
+
+:since: v1.1.0
+        """
+
+        for key in configuration: setattr(self, key, configuration[key])
+    #
+
     def unregister_ns(self, ns = ""):
         """
-Unregisters a namespace or clears the cache (if ns is empty).
+Unregisters a namespace or clears the cache (if ns is empty). The compact
+number of an URI is kept as long as another namespace is registered for it.
 
 :param ns: Output relevant namespace definition
 
@@ -765,25 +1716,52 @@ Unregisters a namespace or clears the cache (if ns is empty).
 
         if (len(ns) > 0):
             if (ns in self.data_ns):
-                del(self.data_ns_compact[self.data_ns_default[self.data_ns[ns]]])
-                del(self.data_ns_default[self.data_ns[ns]])
-                del(self.data_ns[ns])
+                uri = self.data_ns.pop(ns)
+
+                if (uri not in self.data_ns.values()):
+                    del(self.data_ns_compact[self.data_ns_default[uri]])
+                    del(self.data_ns_default[uri])
+                #
             #
         else:
-            self.data_ns = { }
+            self.data_ns = OrderedDict()
             self.data_ns_compact = { }
             self.data_ns_counter = 0
             self.data_ns_default = { }
             self.data_ns_predefined_compact = { }
             self.data_ns_predefined_default = { }
         #
+
+        self._update_ns_prefixes()
     #
 
-    def xml_to_merged_dict(self, data):
+    def _update_ns_prefixes(self):
+        """
+Rebuilds the caches of registered prefixes for XML NS URIs and compact
+numbers. The first prefix registered for an URI is used.
+
+:since: v1.1.0
+        """
+
+        self.data_ns_prefix = { }
+
+        for ns in self.data_ns:
+            uri = self.data_ns[ns]
+            if (uri not in self.data_ns_prefix): self.data_ns_prefix[uri] = ns
+        #
+
+        self.data_ns_compact_prefix = dict(( self.data_ns_default[uri], self.data_ns_prefix[uri] )
+                                           for uri in self.data_ns_prefix
+                                           if uri in self.data_ns_default
+                                          )
+    #
+
+    def xml_to_merged_dict(self, data, encoding = None):
         """
 Converts XML data into a merged XML dictionary.
 
 :param data: Input XML data
+:param encoding: Encoding of raw XML data overriding the declared one
 
 :return: (dict) Merged XML dictionary; None on error
 :since:  v1.0.0
@@ -796,13 +1774,135 @@ Converts XML data into a merged XML dictionary.
         _return = None
 
         try:
-            self.parser_instance.mode = AbstractXmlParser.MODE_MERGED
+            self._prepare_parser_instance(False, encoding = encoding)
             _return = self.parser_instance.parse(data)
         except Exception: pass
 
         return _return
     #
 
+    @staticmethod
+    def _get_node_path_joined(node_path, node_name):
+        """
+Returns the node path of the given child node.
+
+:param node_path: Path of the parent node - delimiter is space
+:param node_name: XML node name
+
+:return: (str) Node path
+:since:  v1.1.0
+        """
+
+        return ("{0} {1}".format(node_path, node_name) if (len(node_path) > 0) else node_name)
+    #
+
+    @staticmethod
+    def parse_many(sources, workers = None, treemode = True, strict_standard_mode = True, encoding = None, ordered = True, max_pending = None, file_paths = True):
+        """
+Parses the given XML documents in a pool of worker processes. Multi-
+dimensional XML trees are returned in the compact form created by
+"dict_to_compact()". Use "import_compact()" to get the XML tree.
+
+:param sources: Iterable of XML file paths or XML data
+:param workers: Number of worker processes; None for the number of CPUs
+:param treemode: Create a multi-dimensional result
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+:param ordered: True to yield results in input order; False to yield them
+                as soon as they are complete
+:param max_pending: Maximum number of documents submitted but not yet
+                    yielded; None for twice the number of workers
+:param file_paths: True if sources are XML file paths; False for XML data
+
+:return: (object) Generator yielding tuples of the source index and the
+         compact XML tree or merged one (None on parsing errors); exceptions
+         raised outside of parsing (e.g. unpicklable sources) are re-raised
+         after the documents already submitted are parsed
+:since:  v1.1.0
+        """
+
+        # global: _POOL_ERROR_CALLBACK, cpu_count, Empty, Pool, Queue
+
+        if (Pool is None):
+            for index, source in enumerate(sources):
+                yield _parse_many_worker(index, source, treemode, strict_standard_mode, encoding, file_paths)
+            #
+        else:
+            if (workers is None): workers = cpu_count()
+            if (max_pending is None): max_pending = 2 * workers
+
+            pool = Pool(workers)
+            results = Queue()
+            results_buffered = { }
+
+            async_results = { }
+            callback_kwargs = { "callback": results.put }
+            if (_POOL_ERROR_CALLBACK): callback_kwargs['error_callback'] = results.put
+
+            pending_count = 0
+            sources_iterator = iter(enumerate(sources))
+            sources_pending = True
+            yield_index = 0
+
+            try:
+                while (True):
+                    while (sources_pending and pending_count < max_pending):
+                        source_data = next(sources_iterator, None)
+
+                        if (source_data is None): sources_pending = False
+                        else:
+                            async_results[source_data[0]] = pool.apply_async(_parse_many_worker,
+                                                                             source_data + ( treemode, strict_standard_mode, encoding, file_paths ),
+                                                                             **callback_kwargs
+                                                                            )
+
+                            pending_count += 1
+                        #
+                    #
+
+                    if (pending_count < 1): break
+
+                    result_data = None
+
+                    while (result_data is None):
+                        if (_POOL_ERROR_CALLBACK): result_data = results.get()
+                        else:
+                            # Failed tasks are not reported by a callback
+                            try: result_data = results.get(True, 0.1)
+                            except Empty:
+                                for async_result in async_results.values():
+                                    if (async_result.ready()): async_result.get()
+                                #
+                            #
+                        #
+                    #
+
+                    if (isinstance(result_data, BaseException)): raise result_data
+
+                    index, result = result_data
+                    del(async_results[index])
+
+                    if (ordered):
+                        results_buffered[index] = result
+
+                        while (yield_index in results_buffered):
+                            pending_count -= 1
+                            yield ( yield_index, results_buffered.pop(yield_index) )
+                            yield_index += 1
+                        #
+                    else:
+                        pending_count -= 1
+                        yield ( index, result )
+                    #
+                #
+            finally:
+                # Terminating workers still sending results may deadlock the pool
+                pool.close()
+                pool.join()
+            #
+        #
+    #
+
     @staticmethod
     def _search_dict(needle, haystack):
         """
@@ -817,7 +1917,7 @@ Searches haystack for needle.
 
         _return = None
 
-        if (needle in haystack):
+        if (needle in haystack.values()):
             for key in haystack:
                 if (haystack[key] == needle):
                     _return = key
@@ -830,29 +1930,83 @@ Searches haystack for needle.
     #
 
     @staticmethod
-    def xml_to_dict(data, treemode = True, strict_standard_mode = True):
+    def xml_to_dict(data, treemode = True, strict_standard_mode = True, encoding = None):
         """
 Converts XML data into a multi-dimensional XML tree or merged one.
 
 :param data: Input XML data
 :param treemode: Create a multi-dimensional result
 :param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
 
 :return: (dict) Multi-dimensional XML tree or merged one; None on error
 :since:  v1.0.0
         """
 
+        # global: _thread_local
+
         _return = None
 
-        xml_parser = XmlParser()
+        xml_parser = getattr(_thread_local, "xml_parser", None)
+        if (xml_parser is None): xml_parser = XmlParser()
 
-        if (treemode):
-            xml_parser.parse(data, strict_standard_mode)
-            _return = xml_parser.data
-        else:
-            _return = xml_parser.xml_to_merged_dict(data)
+        _thread_local.xml_parser = None
+
+        try:
+            if (treemode):
+                xml_parser.parse(data, strict_standard_mode, encoding)
+                _return = xml_parser.data
+            else:
+                _return = xml_parser.xml_to_merged_dict(data, encoding)
+            #
+        finally:
+            xml_parser.reset()
+            _thread_local.xml_parser = xml_parser
         #
 
         return _return
     #
 #
+
+def _parse_many_worker(index, source, treemode, strict_standard_mode, encoding, file_paths):
+    """
+Parses the given XML document in a worker process of "parse_many()".
+
+:param index: Source index
+:param source: XML file path or XML data
+:param treemode: Create a multi-dimensional result
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+:param file_paths: True if the source is a XML file path
+
+:return: (tuple) Source index and compact XML tree or merged one (None on
+         error)
+:since:  v1.1.0
+    """
+
+    # global: _thread_local
+    # pylint: disable=broad-except
+
+    _return = None
+
+    xml_parser = getattr(_thread_local, "xml_parser", None)
+    if (xml_parser is None): xml_parser = XmlParser()
+
+    _thread_local.xml_parser = None
+
+    try:
+        if (file_paths): _return = xml_parser.parse_file(source, treemode, strict_standard_mode, encoding)
+        elif (treemode):
+            xml_parser.parse(source, strict_standard_mode, encoding)
+            _return = xml_parser._data
+        else: _return = xml_parser.xml_to_merged_dict(source, encoding)
+
+        if (treemode and _return is not None): _return = xml_parser.dict_to_compact(_return)
+    except Exception: _return = None
+    finally:
+        xml_parser.reset()
+        _thread_local.xml_parser = xml_parser
+    #
+
+    return ( index, _return )
+#
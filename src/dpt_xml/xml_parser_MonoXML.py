@@ -40,7 +40,7 @@ This implementation supports XmlNodeReader for XML parsing.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "timeout_retries" ]
+    __slots__ = [ "_feed_buffer", "timeout_retries" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -60,12 +60,61 @@ Constructor __init__(XmlParserMonoXml)
 
         AbstractXmlParser.__init__(self, parser, log_handler)
 
+        self._feed_buffer = None
+        """
+XML data chunks of an incremental parsing operation
+        """
         self.timeout_retries = (5 if (timeout_retries is None) else timeout_retries)
         """
 Retries before timing out
         """
     #
 
+    @property
+    def is_parsing(self):
+        """
+Returns true if an incremental parsing operation is in progress.
+
+:return: (bool) True if data has been fed but not closed yet
+:since:  v1.1.0
+        """
+
+        return (self._feed_buffer is not None)
+    #
+
+    def close(self):
+        """
+Finishes an incremental parsing operation and returns the result in the
+format set by "mode" and "strict_standard_mode". XmlDocument can not parse
+incrementally, so the fed data is parsed as a whole.
+
+:return: (dict) Multi-dimensional or merged XML tree; None on error
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.close()- (#echo(__LINE__)#)", self)
+
+        data = ("" if (self._feed_buffer is None or len(self._feed_buffer) < 1) else self._feed_buffer[0][:0].join(self._feed_buffer))
+        self._feed_buffer = None
+
+        return self.parse(data)
+    #
+
+    def feed(self, data):
+        """
+Buffers the given chunk of XML data until "close()" is called.
+
+:param data: XML data chunk
+
+:since: v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.feed()- (#echo(__LINE__)#)", self)
+
+        if (self._feed_buffer is None): self._feed_buffer = [ ]
+        self._feed_buffer.append(data)
+    #
+
     def _get_merged_result(self, _XmlNodeReader):
         """
 Uses the given XmlNodeReader to parse data as a merged tree.
@@ -206,7 +255,7 @@ algorithm.
             is_node = False
             is_preserved_mode = False
             is_read = True
-            node_content = ""
+            node_content_list = [ ]
             nodes_list = [ ]
             timeout_time = (time() + self.timeout_retries)
 
@@ -247,24 +296,24 @@ algorithm.
 
             while (is_node and time() < timeout_time):
                 if (xml_level < _XmlNodeReader.Depth):
-                    if (_XmlNodeReader.NodeType == XmlNodeType.CDATA): node_content += (_XmlNodeReader.Value if (is_preserved_mode) else _XmlNodeReader.Value.strip())
+                    if (_XmlNodeReader.NodeType == XmlNodeType.CDATA): node_content_list.append(_XmlNodeReader.Value if (is_preserved_mode) else _XmlNodeReader.Value.strip())
                     elif (_XmlNodeReader.NodeType == XmlNodeType.Element):
                         is_read = False
                         nodes_list.append(self._get_parsed_dict_walker(_XmlNodeReader, node_path, _XmlNodeReader.Depth))
                     elif (_XmlNodeReader.NodeType == XmlNodeType.EndElement):
                         is_read = False
                         _XmlNodeReader.Read()
-                    elif (_XmlNodeReader.NodeType == XmlNodeType.Text): node_content += (_XmlNodeReader.Value if (is_preserved_mode) else _XmlNodeReader.Value.strip())
+                    elif (_XmlNodeReader.NodeType == XmlNodeType.Text): node_content_list.append(_XmlNodeReader.Value if (is_preserved_mode) else _XmlNodeReader.Value.strip())
                     elif (is_preserved_mode
                           and (_XmlNodeReader.NodeType == XmlNodeType.Whitespace or _XmlNodeReader.NodeType == XmlNodeType.SignificantWhitespace)
-                         ): node_content += _XmlNodeReader.Value
+                         ): node_content_list.append(_XmlNodeReader.Value)
 
                     if (is_read): is_node = _XmlNodeReader.Read()
                     else: is_read = True
                 else: break
             #
 
-            _return = { "node_path": node_path, "value": node_content, "attributes": attributes_dict, "children": nodes_list }
+            _return = { "node_path": node_path, "value": "".join(node_content_list), "attributes": attributes_dict, "children": nodes_list }
         #
 
         return _return
@@ -285,6 +334,7 @@ and "strict_standard_mode".
 
         _return = None
 
+        if (self._encoding is not None and type(data) is not _PY_UNICODE_TYPE): data = data.decode(self._encoding)
         if (str is not _PY_UNICODE_TYPE and type(data) is _PY_UNICODE_TYPE): data = _PY_STR(data, "utf-8")
 
         parser_ptr = XmlDocument()
@@ -301,6 +351,17 @@ and "strict_standard_mode".
         return _return
     #
 
+    def reset(self):
+        """
+Resets the parser state and discards an incomplete incremental parsing
+operation.
+
+:since: v1.1.0
+        """
+
+        self._feed_buffer = None
+    #
+
     def _update_parser_with_parsed_dict_walker(self, data_dict):
         """
 Imports a pre-parsed XML dict into the given parser instance.
@@ -314,7 +375,8 @@ Imports a pre-parsed XML dict into the given parser instance.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}._update_parser_with_parsed_dict_walker()- (#echo(__LINE__)#)", self)
         _return = False
 
-        if (type(data_dict) is dict):
+        if (type(data_dict) is dict and (not self._is_node_path_projected(data_dict['node_path']))): _return = True
+        elif (type(data_dict) is dict):
             if (len(data_dict['value']) > 0 or len(data_dict['attributes']) > 0 or len(data_dict['children']) > 0):
                 if ((not self.strict_standard_mode) and "value" in data_dict['attributes'] and len(data_dict['value']) < 1):
                     data_dict['value'] = data_dict['attributes']['value']
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+import asyncio
+
+class XmlParserAsyncMixin(object):
+    """
+"XmlParserAsyncMixin" provides methods to parse XML data read from asyncio
+streams without blocking the event loop.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    ASYNC_YIELD_SIZE = 65536
+    """
+Size of XML data parsed before control is given back to the event loop
+    """
+
+    __slots__ = [ ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    async def _iter_async_chunks(self, reader):
+        """
+Reads the given asyncio stream and yields XML data chunks not larger than
+"ASYNC_YIELD_SIZE".
+
+:param reader: asyncio stream reader or asynchronous iterable of XML data
+               chunks
+
+:return: (object) Asynchronous generator yielding XML data chunks
+:since:  v1.1.0
+        """
+
+        if (hasattr(reader, "read")):
+            data = await reader.read(self.FILE_CHUNK_SIZE)
+
+            while (len(data) > 0):
+                for offset in range(0, len(data), self.ASYNC_YIELD_SIZE): yield data[offset:offset + self.ASYNC_YIELD_SIZE]
+                data = await reader.read(self.FILE_CHUNK_SIZE)
+            #
+        else:
+            async for data in reader:
+                for offset in range(0, len(data), self.ASYNC_YIELD_SIZE): yield data[offset:offset + self.ASYNC_YIELD_SIZE]
+            #
+        #
+    #
+
+    async def iter_nodes_async(self, reader, node_path, strict_standard_mode = True, encoding = None):
+        """
+Parses the XML data read from the given asyncio stream and yields each node
+matching the given path as soon as it is complete. Matching nodes are not
+added to the XML tree of this instance. The parser state is reset if the
+generator is closed before the document is complete.
+
+:param reader: asyncio stream reader or asynchronous iterable of XML data
+               chunks
+:param node_path: Path of the nodes to yield - delimiter is space
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+
+:return: (object) Asynchronous generator yielding XML nodes
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.iter_nodes_async({0})- (#echo(__LINE__)#)", node_path)
+
+        self._prepare_parser_instance(True, strict_standard_mode, encoding)
+        self.parser_instance.set_node_stream(node_path)
+
+        try:
+            async for data in self._iter_async_chunks(reader):
+                self.parser_instance.feed(data)
+                for node in self.parser_instance.get_streamed_nodes(): yield node
+
+                await asyncio.sleep(0)
+            #
+
+            self.parser_instance.close()
+            for node in self.parser_instance.get_streamed_nodes(): yield node
+        finally:
+            self.parser_instance.reset()
+            self.parser_instance.set_node_stream(None)
+        #
+    #
+
+    async def parse_async(self, reader, treemode = True, strict_standard_mode = True, encoding = None, include_paths = None, exclude_paths = None):
+        """
+Parses the XML data read from the given asyncio stream. Control is given
+back to the event loop after each "ASYNC_YIELD_SIZE" bytes parsed. The
+parser state is reset if reading or parsing fails.
+
+:param reader: asyncio stream reader or asynchronous iterable of XML data
+               chunks
+:param treemode: Create a multi-dimensional result
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+:param include_paths: List of node paths the XML tree is limited to; node
+                      positions are not supported and raise a ValueError
+:param exclude_paths: List of node paths excluded from the XML tree; node
+                      positions are not supported and raise a ValueError
+
+:return: (dict) Multi-dimensional XML tree or merged one; None on error
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.parse_async()- (#echo(__LINE__)#)")
+
+        self._prepare_parser_instance(treemode, strict_standard_mode, encoding, include_paths, exclude_paths)
+
+        try:
+            async for data in self._iter_async_chunks(reader):
+                self.parser_instance.feed(data)
+                await asyncio.sleep(0)
+            #
+
+            return self.parser_instance.close()
+        finally: self.parser_instance.reset()
+    #
+#
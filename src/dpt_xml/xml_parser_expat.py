@@ -19,6 +19,7 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=invalid-name,undefined-variable
 
+from collections import deque
 from xml.parsers import expat
 
 from .abstract_xml_parser import AbstractXmlParser, _PY_STR, _PY_UNICODE_TYPE
@@ -36,12 +37,15 @@ This implementation supports expat for XML parsing.
              Mozilla Public License, v. 2.0
     """
 
-    __slots__ = [ "node_path",
-                  "node_path_list",
+    __slots__ = [ "_columnar_document",
+                  "_expat_parser",
+                  "node_path_cache",
+                  "node_stack",
                   "parser_active",
                   "parser_cache",
-                  "parser_cache_counter",
-                  "parser_cache_link"
+                  "skip_depth",
+                  "stream_node_path",
+                  "stream_nodes"
                 ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
@@ -60,13 +64,28 @@ Constructor __init__(XmlParserExpat)
 
         AbstractXmlParser.__init__(self, parser, log_handler)
 
-        self.node_path = ""
+        self._columnar_document = None
         """
-Current node path of the parser
+Columnar document filled while parsing
         """
-        self.node_path_list = [ ]
+        self._expat_parser = None
         """
-Current path as an array of node tags
+expat parser instance of an incremental parsing operation
+        """
+        self.node_path_cache = { }
+        """
+Node paths of the current document keyed by the parent path and node name
+        """
+        self.node_stack = [ ]
+        """
+Stack of open XML nodes. In tree mode each entry contains the XML node, the
+dict holding it, its key there, the node converted to contain children (if
+any), its node path, true if its path matches the streamed one so far, its
+character data chunks, the remaining include and exclude paths and its node
+path with positions if the tag index is built.
+In merged mode each entry contains the XML node, its character data chunks
+and its merged node path. In columnar mode each entry contains the element
+index, its attributes and its character data chunks.
         """
         self.parser_active = False
         """
@@ -76,14 +95,178 @@ True if not the last element has been reached
         """
 Parser data cache
         """
-        self.parser_cache_counter = 0
+        self.skip_depth = 0
+        """
+Depth of the current element below the first one skipped
+        """
+        self.stream_node_path = None
+        """
+Path of the nodes streamed instead of being added to the XML tree as a list
+of node names
+        """
+        self.stream_nodes = deque()
+        """
+Streamed nodes completed but not yet consumed
+        """
+    #
+
+    @property
+    def is_parsing(self):
+        """
+Returns true if an incremental parsing operation is in progress.
+
+:return: (bool) True if data has been fed but not closed yet
+:since:  v1.1.0
+        """
+
+        return (self._expat_parser is not None)
+    #
+
+    def _add_node_from_element(self, parent_entry, name, attributes, include_trie, exclude_trie):
+        """
+Adds a new XML node for the started element to the given parent node
+stack entry.
+
+:param parent_entry: Node stack entry of the parent node
+:param name: XML tag
+:param attributes: Node attributes
+:param include_trie: Remaining include paths below this node; None for all
+:param exclude_trie: Remaining exclude paths below this node; None for none
+
+:since: v1.1.0
+        """
+
+        self._normalize_attributes(attributes, (not self.strict_standard_mode))
+
+        if (parent_entry[3] is None):
+            parent_entry[3] = self.parser._convert_leaf_to_node(parent_entry[0])
+            parent_entry[1][parent_entry[2]] = parent_entry[3]
+        #
+
+        node_ptr = parent_entry[3]
+        node_path_done = parent_entry[4]
+        node_path_key = ( node_path_done, name )
+        node_path = self.node_path_cache.get(node_path_key)
+
+        if (node_path is None):
+            node_path = ("{0} {1}".format(node_path_done, name) if (len(node_path_done) > 0) else name)
+            self.node_path_cache[node_path_key] = node_path
+        #
+
+        node_depth = len(self.node_stack)
+
+        is_stream_matching = (parent_entry[5]
+                              and node_depth <= len(self.stream_node_path)
+                              and self.stream_node_path[node_depth - 1] == name
+                             )
+
+        if (is_stream_matching and node_depth == len(self.stream_node_path)):
+            node_dict = self.parser._create_node(node_ptr, name, "", attributes)
+            self.parser._add_node_ns_cache(node_path_done, name, node_dict)
+
+            self.node_stack.append([ node_dict, { name: node_dict }, name, None, node_path, True, None, include_trie, exclude_trie, None ])
+        else:
+            node_dict = self.parser._add_node_to_parent(node_ptr, node_path_done, name, "", attributes)
+            is_mtree = ("xml.mtree" in node_ptr[name])
+
+            if (self.parser._tag_index is None): node_index_path = None
+            else:
+                node_index_path = "{0}#{1:d}".format(self.parser._get_node_path_joined(parent_entry[9], name),
+                                                     (node_ptr[name]['xml.mtree'] if (is_mtree) else 0)
+                                                    )
+
+                self.parser._add_node_to_tag_index(node_index_path, name, node_dict)
+            #
+
+            if (is_mtree): self.node_stack.append([ node_dict, node_ptr[name], node_ptr[name]['xml.mtree'], None, node_path, is_stream_matching, None, include_trie, exclude_trie, node_index_path ])
+            else: self.node_stack.append([ node_dict, node_ptr, name, None, node_path, is_stream_matching, None, include_trie, exclude_trie, node_index_path ])
+        #
+    #
+
+    def close(self):
         """
-Cache entry counter
+Finishes an incremental parsing operation and returns the result in the
+format set by "mode" and "strict_standard_mode".
+
+:return: (dict) Multi-dimensional or merged XML tree; None on error
+:since:  v1.1.0
         """
-        self.parser_cache_link = ""
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.close()- (#echo(__LINE__)#)", self)
+
+        if (self._expat_parser is None): self._create_expat_parser()
+        self._parse_chunk(b"", True)
+
+        return (self._get_merged_result() if (self._merged_mode) else self.parser.data)
+    #
+
+    def _create_expat_parser(self):
         """
-Links to the latest entry added
+Creates a new expat parser for the mode selected and resets the parser
+state.
+
+:since: v1.1.0
         """
+
+        self.reset()
+        self._expat_parser = expat.ParserCreate(self._encoding)
+
+        if (self.text_buffer_size > 0):
+            self._expat_parser.buffer_text = True
+            self._expat_parser.buffer_size = self.text_buffer_size
+        #
+
+        if (self._columnar_document is not None):
+            self._expat_parser.CharacterDataHandler = self.handle_cdata_columnar
+            self._expat_parser.StartElementHandler = self.handle_element_start_columnar
+            self._expat_parser.EndElementHandler = self.handle_element_end_columnar
+        elif (self._merged_mode):
+            self._expat_parser.CharacterDataHandler = self.handle_cdata_merged
+            self._expat_parser.StartElementHandler = self.handle_element_start_merged
+            self._expat_parser.EndElementHandler = self.handle_element_end_merged
+        else:
+            self._expat_parser.CharacterDataHandler = self.handle_cdata
+            self._expat_parser.StartElementHandler = self.handle_element_start
+            self._expat_parser.EndElementHandler = self.handle_element_end
+        #
+    #
+
+    def feed(self, data):
+        """
+Parses the given chunk of XML data. The parser state is kept until
+"close()" is called.
+
+:param data: XML data chunk
+
+:since: v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.feed()- (#echo(__LINE__)#)", self)
+
+        if (self._expat_parser is None): self._create_expat_parser()
+        self._parse_chunk(data, False)
+    #
+
+    def _get_interned_name(self, name, lowercase):
+        """
+Returns the interned node name for the given XML tag.
+
+:param name: XML tag
+:param lowercase: True to convert the name to lowercase and to remove the
+                  "digitstart__" prefix
+
+:return: (str) Interned node name
+:since:  v1.1.0
+        """
+
+        names_table = self.parser.names_table
+
+        if (lowercase):
+            _return = names_table.get_lowercase(name)
+            if (_return[:12] == "digitstart__"): _return = names_table.get(_return[12:])
+        else: _return = names_table.get(name)
+
+        return _return
     #
 
     def _get_merged_result(self):
@@ -106,6 +289,20 @@ completed its work.
         return _return
     #
 
+    def get_streamed_nodes(self):
+        """
+Returns the nodes completed since the last call if a node stream is set.
+
+:return: (list) Completed XML nodes
+:since:  v1.1.0
+        """
+
+        _return = list(self.stream_nodes)
+        self.stream_nodes.clear()
+
+        return _return
+    #
+
     def handle_cdata(self, data):
         """
 python.org: Called for character data. This will be called for normal
@@ -121,9 +318,11 @@ required information.
 
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_cdata()- (#echo(__LINE__)#)", self)
 
-        if (self.parser_active):
-            if ("value" in self.parser_cache[self.parser_cache_link[self.node_path]]): self.parser_cache[self.parser_cache_link[self.node_path]]['value'] += data
-            else: self.parser_cache[self.parser_cache_link[self.node_path]]['value'] = data
+        if (self.parser_active and self.skip_depth < 1):
+            node_entry = self.node_stack[-1]
+
+            if (node_entry[6] is None): node_entry[6] = [ data ]
+            else: node_entry[6].append(data)
         #
     #
 
@@ -142,30 +341,145 @@ Method to handle "end element" callbacks.
 
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_element_end({1})- (#echo(__LINE__)#)", self, name)
 
-        if (self.parser_active):
-            node_path = self.parser_cache_link[self.node_path]
+        if (self.skip_depth > 0): self.skip_depth -= 1
+        elif (self.parser_active):
+            node_entry = self.node_stack.pop()
+            node_dict = node_entry[0]
 
-            del(self.parser_cache_link[self.node_path])
-            self.node_path_list.pop()
-            self.node_path = " ".join(self.node_path_list)
+            if (node_entry[6] is not None): node_dict['value'] = "".join(node_entry[6])
 
-            if ("value" not in self.parser_cache[node_path]): self.parser_cache[node_path]['value'] = ""
-            elif ("xml:space" not in self.parser_cache[node_path]['attributes']
-                  or self.parser_cache[node_path]['attributes']['xml:space'] != "preserve"
-                 ): self.parser_cache[node_path]['value'] = self.parser_cache[node_path]['value'].strip()
+            if ("xml:space" not in node_dict['attributes']
+                or node_dict['attributes']['xml:space'] != "preserve"
+               ): node_dict['value'] = node_dict['value'].strip()
 
             if ((not self.strict_standard_mode)
-                and "value" in self.parser_cache[node_path]['attributes']
-                and len(self.parser_cache[node_path]['value']) < 1
+                and "value" in node_dict['attributes']
+                and len(node_dict['value']) < 1
                ):
-                self.parser_cache[node_path]['value'] = self.parser_cache[node_path]['attributes']['value']
-                del(self.parser_cache[node_path]['attributes']['value'])
+                node_dict['value'] = node_dict['attributes']['value']
+                del(node_dict['attributes']['value'])
             #
 
-            self.parser_active = (self.node_path != "")
+            if (str is not _PY_UNICODE_TYPE and type(node_dict['value']) is _PY_UNICODE_TYPE): node_dict['value'] = _PY_STR(node_dict['value'], "utf-8")
+            if (node_entry[5] and len(self.node_stack) == len(self.stream_node_path)): self.stream_nodes.append(node_entry[1][node_entry[2]])
+        #
+
+        if (self.parser_active and self.skip_depth < 1 and len(self.node_stack) < 2):
+            self.node_stack = [ ]
+            self.parser_active = False
+        #
+    #
+
+    def handle_cdata_columnar(self, data):
+        """
+python.org: Called for character data. This will be called for normal
+character data, CDATA marked content, and ignorable whitespace. Applications
+which must distinguish these cases can use the StartCdataSectionHandler,
+EndCdataSectionHandler, and ElementDeclHandler callbacks to collect the
+required information. (Columnar XML parser)
+
+:param data: Character data
+
+:since: v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_cdata_columnar()- (#echo(__LINE__)#)", self)
+
+        if (self.parser_active):
+            node_entry = self.node_stack[-1]
+
+            if (node_entry[2] is None): node_entry[2] = [ data ]
+            else: node_entry[2].append(data)
         #
     #
 
+    def handle_element_end_columnar(self, name):
+        """
+Method to handle "end element" callbacks. (Columnar XML parser)
+
+:param name: XML tag
+
+:since: v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(name) is _PY_UNICODE_TYPE): name = _PY_STR(name, "utf-8")
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_element_end_columnar({1})- (#echo(__LINE__)#)", self, name)
+
+        if (self.parser_active):
+            document = self._columnar_document
+            index, attributes, value = self.node_stack.pop()
+
+            value = ("" if (value is None) else "".join(value))
+            if ("xml:space" not in attributes or attributes['xml:space'] != "preserve"): value = value.strip()
+
+            if ((not self.strict_standard_mode) and "value" in attributes and len(value) < 1):
+                value = attributes['value']
+                del(attributes['value'])
+            #
+
+            document.ends[index] = len(document.tags)
+
+            if (len(value) > 0):
+                document.value_offsets[index] = document._add_text(value)
+                document.value_lengths[index] = len(value)
+            #
+
+            if (len(attributes) > 0):
+                document.attribute_starts[index] = len(document.attribute_names)
+
+                for key in attributes:
+                    value = attributes[key]
+
+                    document.attribute_names.append(document._get_name_id(key))
+                    document.attribute_value_offsets.append(document._add_text(value))
+                    document.attribute_value_lengths.append(len(value))
+                #
+
+                document.attribute_ends[index] = len(document.attribute_names)
+            #
+
+            self.parser_active = (len(self.node_stack) > 0)
+        #
+    #
+
+    def handle_element_start_columnar(self, name, attributes):
+        """
+Method to handle "start element" callbacks. (Columnar XML parser)
+
+:param name: XML tag
+:param attributes: Node attributes
+
+:since: v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(name) is _PY_UNICODE_TYPE): name = _PY_STR(name, "utf-8")
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_element_start_columnar({1})- (#echo(__LINE__)#)", self, name)
+
+        self.parser_active = True
+
+        name = self._get_interned_name(name, (not self.strict_standard_mode))
+        self._normalize_attributes(attributes, (not self.strict_standard_mode))
+
+        document = self._columnar_document
+        index = len(document.tags)
+
+        document.parents.append(self.node_stack[-1][0] if (len(self.node_stack) > 0) else -1)
+        document.tags.append(document._get_name_id(name))
+        document.ends.append(index + 1)
+        document.value_offsets.append(0)
+        document.value_lengths.append(0)
+        document.attribute_starts.append(0)
+        document.attribute_ends.append(0)
+
+        self.node_stack.append([ index, attributes, None ])
+    #
+
     def handle_cdata_merged(self, data):
         """
 python.org: Called for character data. This will be called for normal
@@ -182,8 +496,10 @@ required information. (Merged XML parser)
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_cdata_merged()- (#echo(__LINE__)#)", self)
 
         if (self.parser_active):
-            if (self.parser_cache_link[self.node_path] > 0): self.parser_cache[self.node_path][self.parser_cache_link[self.node_path]]['value'] += data
-            else: self.parser_cache[self.node_path]['value'] += data
+            node_entry = self.node_stack[-1]
+
+            if (node_entry[1] is None): node_entry[1] = [ data ]
+            else: node_entry[1].append(data)
         #
     #
 
@@ -203,13 +519,10 @@ Method to handle "end element" callbacks. (Merged XML parser)
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_element_end_merged({1})- (#echo(__LINE__)#)", self, name)
 
         if (self.parser_active):
-            node_ptr = (self.parser_cache[self.node_path][self.parser_cache_link[self.node_path]]
-                        if (self.parser_cache_link[self.node_path] > 0) else
-                        self.parser_cache[self.node_path]
-                       )
+            node_entry = self.node_stack.pop()
+            node_ptr = node_entry[0]
 
-            self.node_path_list.pop()
-            self.node_path = "_".join(self.node_path_list)
+            if (node_entry[1] is not None): node_ptr['value'] = "".join(node_entry[1])
 
             if ("xml:space" not in node_ptr['attributes']): node_ptr['value'] = node_ptr['value'].strip()
             elif (node_ptr['attributes']['xml:space'] != "preserve"): node_ptr['value'] = node_ptr['value'].strip()
@@ -219,7 +532,7 @@ Method to handle "end element" callbacks. (Merged XML parser)
                 del(node_ptr['attributes']['value'])
             #
 
-            self.parser_active = (self.node_path != "")
+            self.parser_active = (len(self.node_stack) > 0)
         #
     #
 
@@ -239,47 +552,32 @@ Method to handle "start element" callbacks. (Merged XML parser)
 
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_element_start_merged({1})- (#echo(__LINE__)#)", self, name)
 
-        if (not self.parser_active):
-            self.node_path = ""
-            self.parser_active = True
-            self.parser_cache_link = { }
-        #
-
-        name = name.lower()
-        if (name[:12] == "digitstart__"): name = name[12:]
+        self.parser_active = True
 
-        if (len(self.node_path) > 0): self.node_path += "_"
-        self.node_path += name
-        self.node_path_list.append(name)
+        name = self._get_interned_name(name, True)
 
-        for key in attributes:
-            if (str is not _PY_UNICODE_TYPE and type(key) is _PY_UNICODE_TYPE): key = _PY_STR(key, "utf-8")
-            key_lowercase = key.lower()
-            value = attributes[key]
+        node_path_done = (self.node_stack[-1][2] if (len(self.node_stack) > 0) else "")
+        node_path_key = ( node_path_done, name )
+        node_path = self.node_path_cache.get(node_path_key)
 
-            if (key_lowercase.startswith("xmlns:")):
-                attributes["xmlns:{0}".format(key[6:])] = value
-                if (key[:6] != "xmlns:"): del(attributes[key])
-            elif (key_lowercase == "xml:space"):
-                attributes[key_lowercase] = value.lower()
-                if (key != key_lowercase): del(attributes[key])
-            elif (key != key_lowercase):
-                del(attributes[key])
-                attributes[key_lowercase] = value
-            #
+        if (node_path is None):
+            node_path = ("{0}_{1}".format(node_path_done, name) if (len(node_path_done) > 0) else name)
+            self.node_path_cache[node_path_key] = node_path
         #
 
-        node_dict = { "tag": name, "value": "", "attributes": attributes }
+        self._normalize_attributes(attributes, True)
 
-        if (self.node_path in self.parser_cache):
-            if ("tag" in self.parser_cache[self.node_path]): self.parser_cache[self.node_path] = [ self.parser_cache[self.node_path], node_dict ]
-            else: self.parser_cache[self.node_path].append(node_dict)
+        node_dict = { "tag": name,
+                      "value": "",
+                      "attributes": (attributes if (len(attributes) > 0) else self.parser._get_empty_attributes())
+                    }
 
-            self.parser_cache_link[self.node_path] += 1
-        else:
-            self.parser_cache[self.node_path] = node_dict
-            self.parser_cache_link[self.node_path] = 0
-        #
+        if (node_path in self.parser_cache):
+            if ("tag" in self.parser_cache[node_path]): self.parser_cache[node_path] = [ self.parser_cache[node_path], node_dict ]
+            else: self.parser_cache[node_path].append(node_dict)
+        else: self.parser_cache[node_path] = node_dict
+
+        self.node_stack.append([ node_dict, None, node_path ])
     #
 
     def handle_element_start(self, name, attributes):
@@ -299,41 +597,113 @@ Method to handle "start element" callbacks.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.handle_element_start({1})- (#echo(__LINE__)#)", self, name)
 
         if (not self.parser_active):
-            self.node_path = ""
             self.parser_active = True
-            self.parser_cache_counter = 0
-            self.parser_cache_link = { }
+            self.node_stack = [ [ None, None, None, self.parser._create_children_node(), "", (self.stream_node_path is not None), None, self._include_paths_trie, self._exclude_paths_trie, "" ] ]
+
+            self.parser.set_xml_tree(self.node_stack[0][3], True)
+            if (self.parser.tag_index_on_parse and self.stream_node_path is None): self.parser._tag_index = { }
         #
 
-        if (not self.strict_standard_mode):
-            name = name.lower()
-            if (name[:12] == "digitstart__"): name = name[12:]
+        if (self.skip_depth > 0): self.skip_depth += 1
+        else:
+            name = self._get_interned_name(name, (not self.strict_standard_mode))
+            parent_entry = self.node_stack[-1]
+
+            include_trie = parent_entry[7]
+            exclude_trie = parent_entry[8]
+
+            if (include_trie is not None):
+                if (name in include_trie): include_trie = include_trie[name]
+                else: self.skip_depth = 1
+            #
+
+            if (exclude_trie is not None):
+                exclude_trie = exclude_trie.get(name)
+                if (exclude_trie is True): self.skip_depth = 1
+            #
+
+            if (self.skip_depth < 1): self._add_node_from_element(parent_entry, name, attributes, include_trie, exclude_trie)
         #
+    #
+
+    def _normalize_attributes(self, attributes, lowercase):
+        """
+Normalizes the attribute names and XML specific attribute values given.
 
-        if (len(self.node_path) > 0): self.node_path += " "
-        self.node_path += name
-        self.node_path_list.append(name)
+:param attributes: Node attributes
+:param lowercase: True to convert all attribute names to lowercase
+
+:since: v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        is_changed = False
+        names_table = self.parser.names_table
+        normalized_attributes = [ ]
+        renamed_attributes = [ ]
 
         for key in attributes:
-            if (str is not _PY_UNICODE_TYPE and type(key) is _PY_UNICODE_TYPE): key = _PY_STR(key, "utf-8")
-            key_lowercase = key.lower()
             value = attributes[key]
+            is_renamed = False
 
-            if (key_lowercase.startswith("xmlns:")):
-                attributes["xmlns:{0}".format(key[6:])] = value
-                if (key[:6] != "xmlns:"): del(attributes[key])
-            elif (key_lowercase == "xml:space"):
-                attributes[key_lowercase] = value.lower()
-                if (key != key_lowercase): del(attributes[key])
-            elif ((not self.strict_standard_mode) and key != key_lowercase):
-                del(attributes[key])
-                attributes[key_lowercase] = value
+            if (str is not _PY_UNICODE_TYPE and type(key) is _PY_UNICODE_TYPE):
+                is_renamed = True
+                key = _PY_STR(key, "utf-8")
             #
+
+            key_lowercase = names_table.get_lowercase(key)
+
+            if (key_lowercase.startswith("xmlns:")): normalized_key = names_table.get("xmlns:{0}".format(key[6:]))
+            elif (key_lowercase == "xml:space"):
+                normalized_key = key_lowercase
+                value = value.lower()
+            elif (lowercase): normalized_key = key_lowercase
+            else: normalized_key = names_table.get(key)
+
+            if (is_renamed or normalized_key != key): renamed_attributes.append(( normalized_key, value ))
+            else: normalized_attributes.append(( normalized_key, value ))
+
+            if (is_renamed or normalized_key is not key or value is not attributes[key]): is_changed = True
         #
 
-        self.parser_cache[self.parser_cache_counter] = { "node_path": self.node_path, "attributes": attributes }
-        self.parser_cache_link[self.node_path] = self.parser_cache_counter
-        self.parser_cache_counter += 1
+        if (is_changed):
+            attributes.clear()
+            attributes.update(normalized_attributes + renamed_attributes)
+        #
+    #
+
+    def iter_nodes(self, chunks, node_path):
+        """
+Parses the given XML data chunks and yields each node matching the given
+path as soon as it is complete. The parser state is reset if the generator
+is closed before the document is complete.
+
+:param chunks: Iterable of XML data chunks
+:param node_path: Path of the nodes to yield - delimiter is space
+
+:return: (object) Generator yielding XML nodes
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.iter_nodes({1})- (#echo(__LINE__)#)", self, node_path)
+
+        self._create_expat_parser()
+        self.set_node_stream(node_path)
+
+        try:
+            for data in chunks:
+                self._parse_chunk(data, False)
+
+                while (len(self.stream_nodes) > 0): yield self.stream_nodes.popleft()
+            #
+
+            self._parse_chunk(b"", True)
+            while (len(self.stream_nodes) > 0): yield self.stream_nodes.popleft()
+        finally:
+            self.reset()
+            self.set_node_stream(None)
+        #
     #
 
     def parse(self, data):
@@ -347,51 +717,93 @@ and "strict_standard_mode".
 
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.parse()- (#echo(__LINE__)#)", self)
 
-        parser_ptr = expat.ParserCreate()
+        self._create_expat_parser()
+        self._parse_chunk(data, True)
 
-        if (self._merged_mode):
-            parser_ptr.CharacterDataHandler = self.handle_cdata_merged
-            parser_ptr.StartElementHandler = self.handle_element_start_merged
-            parser_ptr.EndElementHandler = self.handle_element_end_merged
-            parser_ptr.Parse(data, True)
+        return (self._get_merged_result() if (self._merged_mode) else self.parser.data)
+    #
 
-            _return = self._get_merged_result()
-        else:
-            parser_ptr.CharacterDataHandler = self.handle_cdata
-            parser_ptr.StartElementHandler = self.handle_element_start
-            parser_ptr.EndElementHandler = self.handle_element_end
-            parser_ptr.Parse(data, True)
+    def parse_columnar(self, data, document):
+        """
+Parses a given XML string into the array columns of the given document.
 
-            self._update_parser_with_result()
-            _return = self.parser.data
+:param data: XML data
+:param document: XmlColumnarDocument instance to fill
+
+:return: (object) XmlColumnarDocument instance
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}.parse_columnar()- (#echo(__LINE__)#)", self)
+
+        self._columnar_document = document
+
+        try:
+            self._create_expat_parser()
+            self._parse_chunk(data, True)
+        finally: self._columnar_document = None
+
+        document._join_text()
+        return document
+    #
+
+    def _parse_chunk(self, data, is_final):
+        """
+Passes the given data to the active expat parser. The parser state is reset
+if expat reports an error or the document is complete. The partial XML tree
+of a failed document is discarded.
+
+:param data: XML data chunk
+:param is_final: True if this is the last chunk of the document
+
+:since: v1.1.0
+        """
+
+        try: self._expat_parser.Parse(data, is_final)
+        except expat.ExpatError:
+            if (self.parser_active and self._columnar_document is None and (not self._merged_mode)):
+                self.parser._data = None
+                self.parser._node_ptr_cache.clear()
+                self.parser._tag_index = None
+            #
+
+            self.reset()
+            raise
         #
 
-        return _return
+        if (is_final): self._expat_parser = None
     #
 
-    def _update_parser_with_result(self):
+    def reset(self):
         """
-Adds the result of an expat parsing operation to the defined XML instance if
-the parser completed its work.
+Resets the parser state and discards an incomplete incremental parsing
+operation.
 
-:return: (dict) Multi-dimensional XML tree; None on error
-:since:  v1.0.0
+:since: v1.1.0
         """
 
-        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -{0!r}._update_parser_with_result()- (#echo(__LINE__)#)", self)
-        _return = None
+        self._expat_parser = None
+        self.node_path_cache = { }
+        self.node_stack = [ ]
+        self.parser_active = False
+        self.parser_cache = { }
+        self.skip_depth = 0
+    #
 
-        if ((not self.parser_active) and type(self.parser_cache) is dict and len(self.parser_cache) > 0):
-            self.parser.set_xml_tree({ }, True)
+    def set_node_stream(self, node_path = None):
+        """
+Sets the path of the nodes to be returned by "get_streamed_nodes()" instead
+of being added to the XML tree. The path is converted to lowercase if not in
+strict standard mode.
 
-            for node_key in self.parser_cache:
-                node_dict = self.parser_cache[node_key]
-                self.parser.add_node(node_dict['node_path'], node_dict['value'], node_dict['attributes'])
-            #
+:param node_path: Path of the nodes to stream - delimiter is space; None
+                  to disable streaming
 
-            self.parser_cache = { }
-        #
+:since: v1.1.0
+        """
 
-        return _return
+        if (node_path is not None and (not self.strict_standard_mode)): node_path = node_path.lower()
+        self.stream_node_path = (None if (node_path is None) else node_path.split(" "))
+        self.stream_nodes = deque()
     #
 #
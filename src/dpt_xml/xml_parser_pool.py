@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=invalid-name
+
+from contextlib import contextmanager
+from threading import Lock
+
+from .xml_parser import XmlParser
+
+class XmlParserPool(object):
+    """
+Thread-safe pool of reusable XML parser instances. Instances are reset and
+their configuration is restored when returned to the pool. Registered
+namespaces are kept.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = [ "_idle_instances", "_lock", "parser_class", "parser_kwargs", "size" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, size = 8, parser_class = XmlParser, **kwargs):
+        """
+Constructor __init__(XmlParserPool)
+
+:param size: Maximum number of idle instances kept
+:param parser_class: XmlParser compatible class to instantiate
+:param kwargs: Keyword arguments for new instances
+
+:since: v1.1.0
+        """
+
+        self._idle_instances = [ ]
+        """
+Idle parser instances
+        """
+        self._lock = Lock()
+        """
+Lock protecting the list of idle parser instances
+        """
+        self.parser_class = parser_class
+        """
+XmlParser compatible class to instantiate
+        """
+        self.parser_kwargs = kwargs
+        """
+Keyword arguments for new instances
+        """
+        self.size = size
+        """
+Maximum number of idle instances kept
+        """
+    #
+
+    @contextmanager
+    def acquire(self):
+        """
+Returns a context manager providing a parser instance for exclusive use.
+The instance is reset, its configuration restored and returned to the pool
+afterwards. A new instance is created if no idle one is available.
+
+:return: (object) Context manager providing the parser instance
+:since:  v1.1.0
+        """
+
+        parser = None
+
+        with self._lock:
+            if (len(self._idle_instances) > 0): parser = self._idle_instances.pop()
+        #
+
+        if (parser is None): parser = self.parser_class(**self.parser_kwargs)
+        configuration = parser.get_configuration()
+
+        try: yield parser
+        finally: self.release(parser, configuration)
+    #
+
+    def release(self, parser, configuration = None):
+        """
+Resets the given parser instance and keeps it for reuse if the pool is not
+full.
+
+:param parser: Parser instance
+:param configuration: Configuration to restore as returned by
+                      "get_configuration()"
+
+:since: v1.1.0
+        """
+
+        if (configuration is not None): parser.set_configuration(configuration)
+        parser.reset()
+
+        with self._lock:
+            if (len(self._idle_instances) < self.size): self._idle_instances.append(parser)
+        #
+    #
+#
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from itertools import islice
+import re
+
+try: from collections.abc import Mapping
+except ImportError: from collections import Mapping
+
+from .xml_parser import XmlParser
+
+class XmlQuery(object):
+    """
+"XmlQuery" is a compiled query of a XPath subset. Supported are the child
+("/") and descendant ("//") axes, node names, "*", positional predicates
+("[1]" is the first node), attribute predicates ("[@name]", "[@name='v']"
+and "[@name!='v']") and "text()" as the last step to return node values.
+
+Nodes are returned in tree order. Queries are evaluated lazily and return
+the XML nodes of the tree without copying them.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    PREDICATE_ATTRIBUTE = 2
+    """
+Attribute predicate
+    """
+    PREDICATE_POSITION = 1
+    """
+Positional predicate
+    """
+    RE_PREDICATE = re.compile("\\[\\s*(?:(\\d+)|@([^\\s=!\\]]+)\\s*(?:(!?=)\\s*(?:'([^']*)'|\"([^\"]*)\"))?)\\s*\\]")
+    """
+RegExp to parse a predicate
+    """
+    RE_STEP = re.compile("(//|/)?(\\*|text\\(\\)|[^/\\[\\]\\s]+)((?:\\[(?:[^\\]'\"]|'[^']*'|\"[^\"]*\")*\\])*)")
+    """
+RegExp to parse a location step
+    """
+
+    __slots__ = [ "expression", "steps" ]
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, expression):
+        """
+Constructor __init__(XmlQuery)
+
+:param expression: Query expression
+
+:since: v1.1.0
+        """
+
+        self.expression = expression
+        """
+Query expression
+        """
+        self.steps = XmlQuery._get_steps(expression)
+        """
+Tuple of descendant axis flag, node name (None for "*"), "text()" flag and
+predicates for each location step
+        """
+    #
+
+    def evaluate(self, xml_resource):
+        """
+Evaluates the query against the XML tree of the given instance.
+
+:param xml_resource: XmlResource instance
+
+:return: (object) Generator yielding matching XML nodes or node values
+:since:  v1.1.0
+        """
+
+        root_node = xml_resource._data
+        nodes = iter(( ) if (root_node is None) else ( root_node, ))
+
+        for step in self.steps: nodes = self._evaluate_step(xml_resource, root_node, nodes, step)
+        return nodes
+    #
+
+    def _evaluate_step(self, xml_resource, root_node, nodes, step):
+        """
+Evaluates the given location step for all context nodes.
+
+:param xml_resource: XmlResource instance
+:param root_node: XML tree root
+:param nodes: Iterable of context nodes
+:param step: Location step
+
+:return: (object) Generator yielding matching XML nodes or node values
+:since:  v1.1.0
+        """
+
+        is_descendant, node_name, is_text, predicates = step
+
+        if (is_text):
+            for node in nodes:
+                context_nodes = (self._iter_descendants_or_self(root_node, node) if (is_descendant) else ( node, ))
+
+                for context_node in context_nodes:
+                    if ("xml.item" in context_node): yield context_node['xml.item']['value']
+                    elif (context_node is not root_node): yield context_node['value']
+                #
+            #
+        else:
+            node_ids = (set() if (is_descendant) else None)
+
+            for node in nodes:
+                context_nodes = (self._iter_descendants_or_self(root_node, node) if (is_descendant) else ( node, ))
+
+                for context_node in context_nodes:
+                    child_nodes = self._iter_children(xml_resource, root_node, context_node, node_name)
+                    for predicate in predicates: child_nodes = self._filter_predicate(child_nodes, predicate)
+
+                    for child_node in child_nodes:
+                        if (node_ids is not None):
+                            if (id(child_node) in node_ids): continue
+                            node_ids.add(id(child_node))
+                        #
+
+                        yield child_node
+                    #
+                #
+            #
+        #
+    #
+
+    def _filter_predicate(self, nodes, predicate):
+        """
+Filters the given nodes by the predicate.
+
+:param nodes: Iterable of XML nodes
+:param predicate: Predicate
+
+:return: (object) Iterable of matching XML nodes
+:since:  v1.1.0
+        """
+
+        if (predicate[0] == XmlQuery.PREDICATE_POSITION):
+            _return = (islice(nodes, predicate[1] - 1, predicate[1]) if (predicate[1] > 0) else iter(( )))
+        else: _return = self._filter_predicate_attribute(nodes, predicate[1], predicate[2], predicate[3])
+
+        return _return
+    #
+
+    def _filter_predicate_attribute(self, nodes, name, operator, value):
+        """
+Filters the given nodes by the attribute given.
+
+:param nodes: Iterable of XML nodes
+:param name: Attribute name
+:param operator: Comparison operator; None to check for existence only
+:param value: Attribute value to compare with
+
+:return: (object) Generator yielding matching XML nodes
+:since:  v1.1.0
+        """
+
+        for node in nodes:
+            attributes = (node['xml.item'] if ("xml.item" in node) else node).get("attributes")
+
+            if (isinstance(attributes, Mapping) and name in attributes):
+                if (operator is None
+                    or (operator == "=" and attributes[name] == value)
+                    or (operator == "!=" and attributes[name] != value)
+                   ): yield node
+            #
+        #
+    #
+
+    def _iter_children(self, xml_resource, root_node, node, node_name):
+        """
+Iterates over the child nodes with the given name.
+
+:param xml_resource: XmlResource instance
+:param root_node: XML tree root
+:param node: XML node
+:param node_name: Node name; None for all child nodes
+
+:return: (object) Generator yielding child XML nodes
+:since:  v1.1.0
+        """
+
+        if (node is root_node or "xml.item" in node):
+            ns_uri = None
+
+            if (node_name is not None):
+                re_result = XmlParser.RE_NODE_NAME_XMLNS.match(node_name)
+
+                if (re_result is not None and re_result.group(1) in xml_resource.data_ns):
+                    ns_uri = xml_resource.data_ns[re_result.group(1)]
+                    node_name = re_result.group(2)
+                #
+            #
+
+            if (node_name is not None and ns_uri is None):
+                if (node_name in node):
+                    for child_node in self._iter_entries(node[node_name]): yield child_node
+                #
+            else:
+                for key in node:
+                    if (key == "xml.item"): continue
+
+                    if (ns_uri is None):
+                        for child_node in self._iter_entries(node[key]): yield child_node
+                    else:
+                        re_result = XmlParser.RE_NODE_NAME_XMLNS.match(key)
+                        key_name = (key if (re_result is None) else re_result.group(2))
+
+                        if (key_name == node_name):
+                            ns_name = ("@" if (re_result is None) else re_result.group(1))
+
+                            for child_node in self._iter_entries(node[key]):
+                                child_item = (child_node['xml.item'] if ("xml.item" in child_node) else child_node)
+                                child_ns = child_item.get("xmlns", { }).get(ns_name)
+
+                                if (type(child_ns) is int): child_ns = xml_resource.data_ns_compact.get(child_ns)
+                                if (child_ns == ns_uri): yield child_node
+                            #
+                        #
+                    #
+                #
+            #
+        #
+    #
+
+    def _iter_descendants_or_self(self, root_node, node):
+        """
+Iterates over the given node and all of its descendants.
+
+:param root_node: XML tree root
+:param node: XML node
+
+:return: (object) Generator yielding XML nodes
+:since:  v1.1.0
+        """
+
+        yield node
+
+        if (node is root_node or "xml.item" in node):
+            iterators = [ self._iter_children(None, root_node, node, None) ]
+
+            while (len(iterators) > 0):
+                child_node = next(iterators[-1], None)
+
+                if (child_node is None): iterators.pop()
+                else:
+                    yield child_node
+                    if ("xml.item" in child_node): iterators.append(self._iter_children(None, root_node, child_node, None))
+                #
+            #
+        #
+    #
+
+    def _iter_entries(self, node):
+        """
+Iterates over the XML nodes of the given node or list of nodes.
+
+:param node: XML node or list of nodes
+
+:return: (object) Generator yielding XML nodes
+:since:  v1.1.0
+        """
+
+        if (isinstance(node, Mapping)):
+            if ("xml.mtree" in node):
+                for key in node:
+                    if (key != "xml.mtree"): yield node[key]
+                #
+            else: yield node
+        #
+    #
+
+    @staticmethod
+    def _get_steps(expression):
+        """
+Parses the given query expression.
+
+:param expression: Query expression
+
+:return: (tuple) Location steps
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        expression = expression.strip()
+        expression_length = len(expression)
+        position = 0
+
+        if (expression_length < 1): raise ValueError("Empty XML query given")
+
+        while (position < expression_length):
+            re_result = XmlQuery.RE_STEP.match(expression, position)
+
+            if (re_result is None
+                or (len(_return) > 0 and re_result.group(1) is None)
+                or (len(_return) > 0 and _return[-1][2])
+               ): raise ValueError("Invalid XML query '{0}' at position {1:d}".format(expression, position))
+
+            node_name = re_result.group(2)
+            is_text = (node_name == "text()")
+            predicates = [ ]
+
+            predicates_position = 0
+            predicates_data = re_result.group(3)
+
+            while (predicates_position < len(predicates_data)):
+                re_predicate_result = XmlQuery.RE_PREDICATE.match(predicates_data, predicates_position)
+                if (re_predicate_result is None or is_text): raise ValueError("Invalid XML query predicate in '{0}'".format(expression))
+
+                if (re_predicate_result.group(1) is not None):
+                    predicates.append(( XmlQuery.PREDICATE_POSITION, int(re_predicate_result.group(1)) ))
+                else:
+                    predicates.append(( XmlQuery.PREDICATE_ATTRIBUTE,
+                                        re_predicate_result.group(2),
+                                        re_predicate_result.group(3),
+                                        (re_predicate_result.group(4)
+                                         if (re_predicate_result.group(4) is not None) else
+                                         re_predicate_result.group(5)
+                                        )
+                                      ))
+                #
+
+                predicates_position = re_predicate_result.end()
+            #
+
+            _return.append(( (re_result.group(1) == "//"),
+                             (None if (is_text or node_name == "*") else node_name),
+                             is_text,
+                             tuple(predicates)
+                           ))
+
+            position = re_result.end()
+        #
+
+        return tuple(_return)
+    #
+#
@@ -17,9 +17,22 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 #echo(__FILEPATH__)#
 """
 
-# pylint: disable=invalid-name
+# pylint: disable=import-error,invalid-name
 
+from collections import OrderedDict
+
+try: from collections.abc import Mapping
+except ImportError: from collections import Mapping
+
+try: from types import MappingProxyType
+except ImportError: MappingProxyType = dict
+
+from .xml_columnar_document import XmlColumnarDocument
+from .xml_empty_mapping import XmlEmptyMapping
+from .xml_node_list import XmlNodeList
+from .xml_node_path import XmlNodePath
 from .xml_parser import XmlParser
+from .xml_query import XmlQuery
 
 try:
     _PY_STR = unicode.encode
@@ -46,7 +59,16 @@ create valid documents.
     # pylint: disable=no-member
     # pylint issue #2641 for @property overrides
 
-    __slots__ = [ ]
+    NODE_PATHS_CACHE_SIZE = 256
+    """
+Maximum number of compiled node paths cached
+    """
+    QUERIES_CACHE_SIZE = 64
+    """
+Maximum number of compiled queries cached
+    """
+
+    __slots__ = [ "_attribute_indexes", "_node_paths_cache", "_ns_version", "_queries_cache" ]
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -64,6 +86,24 @@ Constructor __init__(XmlResource)
 :since: v1.0.0
         """
 
+        self._attribute_indexes = { }
+        """
+Attribute value indexes (key = node path without positions and attribute
+name; value = dict of node lists or None if outdated)
+        """
+        self._node_paths_cache = OrderedDict()
+        """
+LRU cache of compiled node paths
+        """
+        self._ns_version = 0
+        """
+Version of the registered namespaces
+        """
+        self._queries_cache = OrderedDict()
+        """
+LRU cache of compiled queries
+        """
+
         XmlParser.__init__(self, xml_charset, node_type, timeout_retries, log_handler)
     #
 
@@ -92,12 +132,72 @@ Returns the XML string for the Python representation data of this instance.
         return self.export_data()
     #
 
+    def add_node(self, node_path, value = "", attributes = "", add_recursively = True):
+        """
+Adds a XML node with content - recursively if required.
+
+:param node_path: Path to the new node - delimiter is space
+:param value: Value for the new node
+:param attributes: Attributes of the node
+:param add_recursively: True to create the required tree recursively
+
+:return: (bool) False on error
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
+
+        if (len(self._attribute_indexes) < 1): _return = XmlParser.add_node(self, node_path, value, attributes, add_recursively)
+        else:
+            try: _return = XmlParser.add_node(self, node_path, value, attributes, add_recursively)
+            except Exception:
+                self._reset_attribute_indexes()
+                raise
+            #
+
+            if (_return): self._add_node_to_attribute_indexes(node_path)
+        #
+
+        return _return
+    #
+
+    def _add_node_to_attribute_indexes(self, node_path):
+        """
+Updates the attribute indexes for the node added with the given path.
+Parent nodes converted from leaves are updated as well.
+
+:param node_path: Path to the node added - delimiter is space
+
+:since: v1.1.0
+        """
+
+        node_path_list = self._translate_ns_path(node_path).split(" ")
+        node_path_list[-1] = XmlResource.RE_NODE_POSITION.sub("\\1", node_path_list[-1])
+
+        node_path = ""
+
+        for node_name in node_path_list:
+            node_path = self._get_node_path_joined(node_path, node_name)
+            index_node_path = (XmlResource.RE_NODE_POSITIONS.sub("\\2", node_path) if ("#" in node_path) else node_path)
+
+            if (index_node_path in self._attribute_indexes):
+                node_ptr = self._get_node_ptr(node_path)
+
+                if (not isinstance(node_ptr, Mapping)): pass
+                elif (len(node_path) == len(" ".join(node_path_list))): self._update_attribute_indexes(index_node_path, node_ptr, None, node_ptr)
+                elif ("xml.item" in node_ptr): self._update_attribute_indexes(index_node_path, node_ptr['xml.item'], node_ptr['xml.item'], node_ptr)
+            #
+        #
+    #
+
     def change_node_attributes(self, node_path, attributes):
         """
 Change the attributes of a specified node. Note: XMLNS updates must be
 handled by the calling code.
 
-:param node_path: Path to the new node - delimiter is space
+:param node_path: Path to the new node - delimiter is space; or a compiled path
 :param attributes: Attributes of the node
 
 :return: (bool) False on error
@@ -111,14 +211,18 @@ handled by the calling code.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.change_node_attributes({0})- (#echo(__LINE__)#)", node_path)
         _return = False
 
-        if (type(node_path) is str and isinstance(attributes, dict)):
-            node_path = self._translate_ns_path(node_path)
+        if ((type(node_path) is str or isinstance(node_path, XmlNodePath)) and isinstance(attributes, dict)):
             node_ptr = self._get_node_ptr(node_path)
 
-            if (isinstance(node_ptr, dict)):
+            if (isinstance(node_ptr, Mapping)):
+                index_node_path = (self._get_index_node_path(node_path) if (len(self._attribute_indexes) > 0) else None)
+                if (index_node_path in self._attribute_indexes): self._update_attribute_indexes(index_node_path, node_ptr, node_ptr, None)
+
                 if ("xml.item" in node_ptr): node_ptr['xml.item']['attributes'] = attributes
                 else: node_ptr['attributes'] = attributes
 
+                if (index_node_path in self._attribute_indexes): self._update_attribute_indexes(index_node_path, node_ptr, None, node_ptr)
+
                 _return = True
             #
         #
@@ -130,7 +234,7 @@ handled by the calling code.
         """
 Change the value of a specified node.
 
-:param node_path: Path to the new node; delimiter is space
+:param node_path: Path to the new node; delimiter is space; or a compiled path
 :param value: Value for the new node
 
 :return: (bool) False on error
@@ -144,11 +248,10 @@ Change the value of a specified node.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.change_node_value({0})- (#echo(__LINE__)#)", node_path)
         _return = False
 
-        if (type(node_path) is str and (not isinstance(value, dict)) and (not isinstance(value, list))):
-            node_path = self._translate_ns_path(node_path)
+        if ((type(node_path) is str or isinstance(node_path, XmlNodePath)) and (not isinstance(value, dict)) and (not isinstance(value, list))):
             node_ptr = self._get_node_ptr(node_path)
 
-            if (isinstance(node_ptr, dict)):
+            if (isinstance(node_ptr, Mapping)):
                 if ("xml.item" in node_ptr): node_ptr['xml.item']['value'] = value
                 else: node_ptr['value'] = value
 
@@ -159,11 +262,111 @@ Change the value of a specified node.
         return _return
     #
 
+    def compile_path(self, node_path):
+        """
+Returns a compiled node path to be used repeatedly instead of the node path
+string. Compiled paths are cached and recompiled automatically if the
+registered namespaces change.
+
+:param node_path: Path to the node - delimiter is space
+
+:return: (object) Compiled node path; None on error
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
+        _return = None
+
+        if (isinstance(node_path, XmlNodePath)):
+            _return = (node_path if (node_path.ns_version == self._ns_version) else self.compile_path(node_path.node_path))
+        elif (type(node_path) is str):
+            _return = self._node_paths_cache.pop(node_path, None)
+
+            if (_return is None):
+                _return = XmlNodePath(node_path, self._translate_ns_path_prefixes(node_path), self.data_ns, self._ns_version)
+                if (len(self._node_paths_cache) >= XmlResource.NODE_PATHS_CACHE_SIZE): self._node_paths_cache.popitem(False)
+            #
+
+            self._node_paths_cache[node_path] = _return
+        #
+
+        return _return
+    #
+
+    def compile_query(self, expression):
+        """
+Returns a compiled query of the supported XPath subset. Compiled queries are
+cached.
+
+:param expression: Query expression
+
+:return: (object) Compiled query
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(expression) is _PY_UNICODE_TYPE): expression = _PY_STR(expression, "utf-8")
+
+        if (isinstance(expression, XmlQuery)): _return = expression
+        else:
+            _return = self._queries_cache.pop(expression, None)
+
+            if (_return is None):
+                _return = XmlQuery(expression)
+                if (len(self._queries_cache) >= XmlResource.QUERIES_CACHE_SIZE): self._queries_cache.popitem(False)
+            #
+
+            self._queries_cache[expression] = _return
+        #
+
+        return _return
+    #
+
+    def create_index(self, node_path, attribute):
+        """
+Creates an index of the values of the given attribute for all nodes of the
+given path regardless of node positions. The index is kept up to date by
+"add_node()", "change_node_attributes()" and "remove_node()" and rebuilt
+on demand if the XML tree is replaced.
+
+:param node_path: Path to the nodes - delimiter is space
+:param attribute: Attribute name
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE):
+            if (type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
+            if (type(attribute) is _PY_UNICODE_TYPE): attribute = _PY_STR(attribute, "utf-8")
+        #
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.create_index({0}, {1})- (#echo(__LINE__)#)", node_path, attribute)
+        _return = False
+
+        if (type(node_path) is str and type(attribute) is str):
+            index_node_path = self._get_index_node_path(node_path)
+
+            if (index_node_path not in self._attribute_indexes): self._attribute_indexes[index_node_path] = { }
+            self._attribute_indexes[index_node_path][attribute] = None
+
+            self._get_attribute_index(index_node_path, attribute)
+            _return = True
+        #
+
+        return _return
+    #
+
     def count_node(self, node_path):
         """
 Count the occurrence of a specified node.
 
-:param node_path: Path to the node; delimiter is space
+:param node_path: Path to the node; delimiter is space; or a compiled path
 
 :return: (int) Counted number off matching nodes
 :since:  v1.0.0
@@ -176,24 +379,24 @@ Count the occurrence of a specified node.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.count_node({0})- (#echo(__LINE__)#)", node_path)
         _return = 0
 
-        if (type(node_path) is str):
+        node_path = self.compile_path(node_path)
+
+        if (node_path is not None):
             """
 Get the parent node of the target.
             """
 
-            node_path = self._translate_ns_path(node_path)
-            node_path_list = node_path.split(" ")
+            node_path, node_segments = node_path.get_segments(self.data_ns_predefined_default, self.data_ns)
 
-            if (len(node_path_list) > 1):
-                node_name = node_path_list.pop()
-                node_path = " ".join(node_path_list)
-                node_ptr = self._get_node_ptr(node_path)
+            if (len(node_segments) > 1):
+                node_ptr = self._get_node_ptr_walker(node_path[:node_path.rindex(" ")], node_segments[:-1])
+                node_name = node_path[node_path.rindex(" ") + 1:]
             else:
                 node_name = node_path
                 node_ptr = self._data
             #
 
-            if (isinstance(node_ptr, dict)):
+            if (isinstance(node_ptr, Mapping)):
                 node_name = self.translate_ns_name(node_ptr, node_name)
 
                 if (node_name in node_ptr):
@@ -221,17 +424,155 @@ Convert the Python representation data into a XML string.
         if (self._data is None or len(self._data) < 1): _return = ""
         else:
             _return = self.dict_to_xml(self._data, strict_standard_mode)
-            if (flush): self._data = { }
+            if (flush): self.set_xml_tree({ }, True)
+        #
+
+        return _return
+    #
+
+    def find_all(self, tag, return_node_paths = False):
+        """
+Returns all XML nodes with the given tag in document order. The tag index
+used is built while parsing if "tag_index_on_parse" is set or otherwise on
+demand. It is rebuilt after nodes are added or removed.
+
+:param tag: XML tag; registered namespaces are translated
+:param return_node_paths: True to return tuples of the node path with
+                          positions and the XML node
+
+:return: (list) XML nodes (without children)
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(tag) is _PY_UNICODE_TYPE): tag = _PY_STR(tag, "utf-8")
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.find_all({0})- (#echo(__LINE__)#)", tag)
+
+        node_entries = self._get_tag_index().get(self._translate_ns_path_prefixes(tag), [ ])
+        return (list(node_entries) if (return_node_paths) else [ node_entry[1] for node_entry in node_entries ])
+    #
+
+    def find_by_attribute(self, node_path, attribute, value):
+        """
+Returns the first node of the given path regardless of node positions with
+the given attribute value. An index created with "create_index()" is used
+if available.
+
+:param node_path: Path to the nodes - delimiter is space
+:param attribute: Attribute name
+:param value: Attribute value
+
+:return: (dict) XML node element; None if not found
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE):
+            if (type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
+            if (type(attribute) is _PY_UNICODE_TYPE): attribute = _PY_STR(attribute, "utf-8")
+            if (type(value) is _PY_UNICODE_TYPE): value = _PY_STR(value, "utf-8")
+        #
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.find_by_attribute({0}, {1})- (#echo(__LINE__)#)", node_path, attribute)
+        _return = None
+
+        if (type(node_path) is str and self._data is not None):
+            index_node_path = self._get_index_node_path(node_path)
+
+            if (attribute in self._attribute_indexes.get(index_node_path, { })):
+                nodes = self._get_attribute_index(index_node_path, attribute).get(value)
+                if (nodes is not None): _return = nodes[0]
+            else:
+                for node_ptr in self._iter_index_nodes(self._data, self.compile_path(index_node_path).segments):
+                    node_attributes = (node_ptr['xml.item'] if ("xml.item" in node_ptr) else node_ptr).get("attributes")
+
+                    if (isinstance(node_attributes, dict) and node_attributes.get(attribute) == value):
+                        _return = node_ptr
+                        break
+                    #
+                #
+            #
         #
 
         return _return
     #
 
+    def _get_attribute_index(self, index_node_path, attribute):
+        """
+Returns the attribute index given and rebuilds it if outdated.
+
+:param index_node_path: Path to the nodes without positions
+:param attribute: Attribute name
+
+:return: (dict) Lists of XML nodes with the attribute value as key
+:since:  v1.1.0
+        """
+
+        _return = self._attribute_indexes[index_node_path][attribute]
+
+        if (_return is None):
+            _return = { }
+
+            if (self._data is not None):
+                for node_ptr in self._iter_index_nodes(self._data, self.compile_path(index_node_path).segments):
+                    node_attributes = (node_ptr['xml.item'] if ("xml.item" in node_ptr) else node_ptr).get("attributes")
+
+                    if (isinstance(node_attributes, dict) and attribute in node_attributes):
+                        value = node_attributes[attribute]
+
+                        if (value in _return): _return[value].append(node_ptr)
+                        else: _return[value] = [ node_ptr ]
+                    #
+                #
+            #
+
+            self._attribute_indexes[index_node_path][attribute] = _return
+        #
+
+        return _return
+    #
+
+    def get_configuration(self):
+        """
+Returns the configuration of this instance to be restored later with
+"set_configuration()". Registered namespaces are not part of it.
+
+:return: (dict) Configuration including the declared attribute indexes
+:since:  v1.1.0
+        """
+
+        _return = XmlParser.get_configuration(self)
+
+        _return['attribute_indexes'] = [ ( index_node_path, attribute )
+                                         for index_node_path in self._attribute_indexes
+                                         for attribute in self._attribute_indexes[index_node_path]
+                                       ]
+
+        return _return
+    #
+
+    def _get_index_node_path(self, node_path):
+        """
+Returns the translated node path without positions used for indexes.
+
+:param node_path: Path to the node - delimiter is space; or a compiled path
+
+:return: (str) Node path without positions
+:since:  v1.1.0
+        """
+
+        node_path = self.compile_path(node_path).get_segments(self.data_ns_predefined_default, self.data_ns)[0]
+        return (XmlResource.RE_NODE_POSITIONS.sub("\\2", node_path) if ("#" in node_path) else node_path)
+    #
+
     def get_node(self, node_path, remove_metadata = True):
         """
 Read a specified node including all children if applicable.
 
-:param node_path: Path to the node; delimiter is space
+:param node_path: Path to the node; delimiter is space; or a compiled path
 :param remove_metadata: False to not remove the xml.item node
 
 :return: (dict) XML node element; None on error
@@ -245,11 +586,10 @@ Read a specified node including all children if applicable.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.get_node({0})- (#echo(__LINE__)#)", node_path)
         _return = None
 
-        if (type(node_path) is str):
-            node_path = self._translate_ns_path(node_path)
+        if (type(node_path) is str or isinstance(node_path, XmlNodePath)):
             node_ptr = self._get_node_ptr(node_path)
 
-            if (isinstance(node_ptr, dict)):
+            if (isinstance(node_ptr, Mapping)):
                 _return = node_ptr.copy()
                 if (remove_metadata and "xml.item" in _return): del(_return['xml.item'])
             #
@@ -260,9 +600,10 @@ Read a specified node including all children if applicable.
 
     def get_node_attributes(self, node_path):
         """
-Returns the attributes of a specified node.
+Returns the attributes of a specified node. Shared empty attributes are
+replaced by a dict owned by the node to keep the returned one writable.
 
-:param node_path: Path to the node; delimiter is space
+:param node_path: Path to the node; delimiter is space; or a compiled path
 
 :return: (str) Attributes for the node; None if undefined
 :since:  v1.0.0
@@ -275,11 +616,18 @@ Returns the attributes of a specified node.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.get_node_attributes({0})- (#echo(__LINE__)#)", node_path)
         _return = None
 
-        if (type(node_path) is str):
-            node_path = self._translate_ns_path(node_path)
+        if (type(node_path) is str or isinstance(node_path, XmlNodePath)):
             node_ptr = self._get_node_ptr(node_path)
 
-            if (isinstance(node_ptr, dict)): _return = (node_ptr['xml.item']['attributes'] if ("xml.item" in node_ptr) else node_ptr['attributes'])
+            if (isinstance(node_ptr, Mapping)):
+                node_ptr = (node_ptr['xml.item'] if ("xml.item" in node_ptr) else node_ptr)
+                _return = node_ptr['attributes']
+
+                if (isinstance(_return, XmlEmptyMapping)):
+                    _return = { }
+                    node_ptr['attributes'] = _return
+                #
+            #
         #
 
         return _return
@@ -289,7 +637,7 @@ Returns the attributes of a specified node.
         """
 Returns the pointer to a specific node.
 
-:param node_path: Path to the node - delimiter is space
+:param node_path: Path to the node - delimiter is space; or a compiled path
 
 :return: (dict) XML node element; False on error
 :since:  v1.0.0
@@ -302,57 +650,155 @@ Returns the pointer to a specific node.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml._get_node_ptr({0})- (#echo(__LINE__)#)", node_path)
         _return = None
 
-        if (self._data is not None and type(node_path) is str):
-            if (self.data_cache_node != "" and node_path[:len(self.data_cache_node)] == self.data_cache_node):
-                node_path = node_path[len(self.data_cache_node):].strip()
-                node_ptr = self.data_cache_ptr
-            else: node_ptr = self._data
+        node_path = self.compile_path(node_path)
 
-            is_valid = True
-            node_path_list = (node_path.split(" ") if (len(node_path) > 0) else [ ])
+        if (node_path is not None):
+            node_path, node_segments = node_path.get_segments(self.data_ns_predefined_default, self.data_ns)
+            _return = self._get_node_ptr_walker(node_path, node_segments)
+        #
 
-            while (is_valid and len(node_path_list) > 0):
-                is_valid = False
-                node_name = node_path_list.pop(0)
-                re_result = XmlResource.RE_NODE_POSITION.match(node_name)
+        return _return
+    #
 
-                if (re_result is None): node_position = -1
-                else:
-                    node_name = re_result.group(1)
-                    node_position = int(re_result.group(2))
+    def _get_node_ptr_child(self, node_ptr, node_segment):
+        """
+Returns the pointer to the child node of the given node path segment.
+
+:param node_ptr: XML node
+:param node_segment: Node path segment
+
+:return: (dict) XML node element; None if not found
+:since:  v1.1.0
+        """
+
+        _return = None
+        node_name, node_position, is_ns_name = node_segment
+
+        if (is_ns_name): node_name = self.translate_ns_name(node_ptr, node_name)
+
+        if (node_name in node_ptr):
+            node_child = node_ptr[node_name]
+
+            if ("xml.mtree" in node_child):
+                if (node_position >= 0):
+                    if (node_position in node_child): _return = node_child[node_position]
+                elif (node_child['xml.mtree'] in node_child): _return = node_child[node_child['xml.mtree']]
+            else: _return = node_child
+        #
+
+        return _return
+    #
+
+    def _get_node_ptr_walker(self, node_path, node_segments):
+        """
+Returns the pointer to the node of the given node path segments.
+
+:param node_path: Path to the node - delimiter is space
+:param node_segments: Segments of the node path
+
+:return: (dict) XML node element; None on error
+:since:  v1.1.0
+        """
+
+        _return = None
+
+        if (self._data is not None):
+            cached_node_data = (None if (len(node_segments) < 1) else self._get_cached_node_ptr(node_path))
+
+            if (cached_node_data is None):
+                node_ptr = self._data
+                node_segment_position = 0
+
+                self._node_ptr_cache_misses += 1
+            else:
+                node_ptr = cached_node_data[1]
+                node_segment_position = 1 + cached_node_data[0].count(" ")
+
+                self._node_ptr_cache_hits += 1
+            #
+
+            node_segments_count = len(node_segments)
+
+            while (node_ptr is not None and node_segment_position < node_segments_count):
+                node_ptr = self._get_node_ptr_child(node_ptr, node_segments[node_segment_position])
+                node_segment_position += 1
+            #
+
+            if (node_ptr is not None):
+                if (node_segment_position > 0 and (cached_node_data is None or len(cached_node_data[0]) < len(node_path))):
+                    self._cache_node_ptr(node_path, node_ptr)
                 #
 
-                node_name = self.translate_ns_name(node_ptr, node_name)
+                _return = node_ptr
+            #
+        #
 
-                if (node_name in node_ptr):
-                    if ("xml.mtree" in node_ptr[node_name]):
-                        if (node_position >= 0):
-                            if (node_position in node_ptr[node_name]):
-                                is_valid = True
-                                node_ptr = node_ptr[node_name][node_position]
-                            #
-                        elif (node_ptr[node_name]['xml.mtree'] in node_ptr[node_name]):
-                            is_valid = True
-                            node_ptr = node_ptr[node_name][node_ptr[node_name]['xml.mtree']]
-                        #
-                    else:
-                        is_valid = True
-                        node_ptr = node_ptr[node_name]
+        return _return
+    #
+
+    def _get_node_ptrs(self, node_paths):
+        """
+Returns the pointers to the nodes of the given paths. Segments shared by
+several paths are only resolved once.
+
+:param node_paths: List of node paths or compiled paths
+
+:return: (dict) XML node elements (None if not found) with the given node
+         paths as keys
+:since:  v1.1.0
+        """
+
+        _return = dict.fromkeys(node_paths)
+
+        if (self._data is not None):
+            node_paths_trie = ( { }, [ ] )
+
+            for node_path in _return:
+                compiled_node_path = self.compile_path(node_path)
+
+                if (compiled_node_path is not None):
+                    node_paths_trie_level = node_paths_trie
+
+                    for node_segment in compiled_node_path.get_segments(self.data_ns_predefined_default, self.data_ns)[1]:
+                        if (node_segment not in node_paths_trie_level[0]): node_paths_trie_level[0][node_segment] = ( { }, [ ] )
+                        node_paths_trie_level = node_paths_trie_level[0][node_segment]
                     #
+
+                    node_paths_trie_level[1].append(node_path)
                 #
             #
 
-            if (is_valid): _return = node_ptr
+            self._get_node_ptrs_walker(self._data, node_paths_trie, _return)
         #
 
         return _return
     #
 
+    def _get_node_ptrs_walker(self, node_ptr, node_paths_trie_level, node_ptrs):
+        """
+Resolves the node paths of the given trie level starting at the node
+given.
+
+:param node_ptr: XML node of the trie level
+:param node_paths_trie_level: Trie level of node path segments
+:param node_ptrs: Dict to add the resolved XML node elements to
+
+:since: v1.1.0
+        """
+
+        for node_path in node_paths_trie_level[1]: node_ptrs[node_path] = node_ptr
+
+        for node_segment in node_paths_trie_level[0]:
+            node_child = self._get_node_ptr_child(node_ptr, node_segment)
+            if (node_child is not None): self._get_node_ptrs_walker(node_child, node_paths_trie_level[0][node_segment], node_ptrs)
+        #
+    #
+
     def get_node_value(self, node_path):
         """
 Returns the value of a specified node.
 
-:param node_path: Path to the node; delimiter is space
+:param node_path: Path to the node; delimiter is space; or a compiled path
 
 :return: (str) Value for the node; None if undefined
 :since:  v1.0.0
@@ -365,11 +811,65 @@ Returns the value of a specified node.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.get_node_value({0})- (#echo(__LINE__)#)", node_path)
         _return = None
 
-        if (type(node_path) is str):
-            node_path = self._translate_ns_path(node_path)
+        if (type(node_path) is str or isinstance(node_path, XmlNodePath)):
             node_ptr = self._get_node_ptr(node_path)
 
-            if (isinstance(node_ptr, dict)): _return = (node_ptr['xml.item']['value'] if ("xml.item" in node_ptr) else node_ptr['value'])
+            if (isinstance(node_ptr, Mapping)): _return = (node_ptr['xml.item']['value'] if ("xml.item" in node_ptr) else node_ptr['value'])
+        #
+
+        return _return
+    #
+
+    def get_node_values(self, node_paths):
+        """
+Returns the values of the specified nodes. Node path segments shared by
+several paths are only resolved once.
+
+:param node_paths: List of node paths or compiled paths
+
+:return: (dict) Values (None if undefined) with the given node paths as
+         keys
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.get_node_values()- (#echo(__LINE__)#)")
+        _return = self._get_node_ptrs(node_paths)
+
+        for node_path in _return:
+            node_ptr = _return[node_path]
+
+            if (isinstance(node_ptr, Mapping)): _return[node_path] = (node_ptr['xml.item']['value'] if ("xml.item" in node_ptr) else node_ptr['value'])
+            else: _return[node_path] = None
+        #
+
+        return _return
+    #
+
+    def get_nodes(self, node_paths, remove_metadata = True):
+        """
+Read the specified nodes including all children if applicable. Node path
+segments shared by several paths are only resolved once.
+
+:param node_paths: List of node paths or compiled paths
+:param remove_metadata: False to not remove the xml.item node
+
+:return: (dict) XML node elements (None on error) with the given node
+         paths as keys
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.get_nodes()- (#echo(__LINE__)#)")
+        _return = self._get_node_ptrs(node_paths)
+
+        for node_path in _return:
+            node_ptr = _return[node_path]
+
+            if (isinstance(node_ptr, Mapping)):
+                node_ptr = node_ptr.copy()
+                if (remove_metadata and "xml.item" in node_ptr): del(node_ptr['xml.item'])
+
+                _return[node_path] = node_ptr
+            else: _return[node_path] = None
         #
 
         return _return
@@ -417,7 +917,7 @@ Read and convert a simple multi-dimensional dict into our XML tree.
         _return = False
 
         if (self._data is None or len(self._data) < 1 or overwrite):
-            self._data = self.import_dict_walker(data_dict)
+            self.set_xml_tree(self.import_dict_walker(data_dict), True)
             _return = True
         #
 
@@ -444,10 +944,10 @@ Read and convert a single dimension of an dictionary for our XML tree.
 
                 if (key_type in ( int, float ) or len(key) > 0):
                     if (isinstance(value, dict)):
-                        node_dict = self.node_type([ ( "xml.item", { "tag": key, "xmlns": { } } ) ])
+                        node_dict = self._create_children_node([ ( "xml.item", { "tag": key, "xmlns": self._get_node_xmlns() } ) ])
                         node_dict.update(self.import_dict_walker(value))
                         _return[key] = node_dict
-                    elif (isinstance(value, list)): _return[key] = self.node_type(tag = key, value = value, xmlns = { })
+                    elif (isinstance(value, list)): _return[key] = self.node_type(tag = key, value = value, xmlns = self._get_node_xmlns())
                 #
             #
         #
@@ -455,11 +955,151 @@ Read and convert a single dimension of an dictionary for our XML tree.
         return _return
     #
 
+    def iter_children(self, node_path):
+        """
+Iterates over all child nodes of the given node in document order. Repeated
+nodes are yielded directly from their "xml.mtree" container. The XML tree
+must not be changed while iterating.
+
+:param node_path: Path to the node - delimiter is space; or a compiled path
+
+:return: (object) Generator yielding read-only views of the child XML nodes
+         including their "xml.item" node
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.iter_children({0})- (#echo(__LINE__)#)", node_path)
+
+        node_ptr = ((self._get_node_ptr(node_path) if (len(node_path) > 0) else self._data)
+                    if (type(node_path) is str) else
+                    self._get_node_ptr(node_path)
+                   )
+
+        if (isinstance(node_ptr, Mapping) and (node_ptr is self._data or "xml.item" in node_ptr)):
+            for node_name in node_ptr:
+                node_child = node_ptr[node_name]
+                if (node_name == "xml.item" or (not isinstance(node_child, Mapping))): continue
+
+                if ("xml.mtree" in node_child):
+                    for position in range(node_child['xml.mtree'] + 1): yield MappingProxyType(node_child[position])
+                else: yield MappingProxyType(node_child)
+            #
+        #
+    #
+
+    def _iter_index_nodes(self, node_ptr, node_segments):
+        """
+Iterates over all nodes of the given node path segments regardless of node
+positions.
+
+:param node_ptr: XML node to start at
+:param node_segments: Segments of the node path
+
+:return: (object) Generator yielding XML nodes
+:since:  v1.1.0
+        """
+
+        if (len(node_segments) < 1): yield node_ptr
+        else:
+            node_name, node_position, is_ns_name = node_segments[0]
+            if (is_ns_name): node_name = self.translate_ns_name(node_ptr, node_name)
+
+            if (node_name in node_ptr and isinstance(node_ptr[node_name], Mapping)):
+                node_child = node_ptr[node_name]
+
+                for node_entry in ([ node_child[key] for key in node_child if key != "xml.mtree" ] if ("xml.mtree" in node_child) else [ node_child ]):
+                    if (len(node_segments) < 2): yield node_entry
+                    elif (isinstance(node_entry, Mapping) and "xml.item" in node_entry):
+                        for node_descendant in self._iter_index_nodes(node_entry, node_segments[1:]): yield node_descendant
+                    #
+                #
+            #
+        #
+    #
+
+    def iter_mtree(self, node_path):
+        """
+Iterates over all nodes with the given path regardless of the position
+given for the last node name. Nodes are yielded directly from the "xml.mtree"
+container without resolving the path again for each of them. The XML tree
+must not be changed while iterating.
+
+:param node_path: Path to the nodes - delimiter is space; or a compiled path
+
+:return: (object) Generator yielding read-only views of the XML nodes
+         including their "xml.item" node
+:since:  v1.1.0
+        """
+
+        # global: _PY_STR, _PY_UNICODE_TYPE
+
+        if (str is not _PY_UNICODE_TYPE and type(node_path) is _PY_UNICODE_TYPE): node_path = _PY_STR(node_path, "utf-8")
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.iter_mtree({0})- (#echo(__LINE__)#)", node_path)
+
+        node_path = self.compile_path(node_path)
+
+        if (node_path is not None):
+            node_path, node_segments = node_path.get_segments(self.data_ns_predefined_default, self.data_ns)
+
+            node_ptr = (self._get_node_ptr_walker(node_path[:node_path.rindex(" ")], node_segments[:-1])
+                        if (len(node_segments) > 1) else
+                        self._data
+                       )
+
+            if (isinstance(node_ptr, Mapping) and len(node_segments) > 0):
+                node_name = node_segments[-1][0]
+                if (node_segments[-1][2]): node_name = self.translate_ns_name(node_ptr, node_name)
+
+                node_child = node_ptr.get(node_name)
+
+                if (isinstance(node_child, Mapping)):
+                    if ("xml.mtree" in node_child):
+                        for position in range(node_child['xml.mtree'] + 1): yield MappingProxyType(node_child[position])
+                    else: yield MappingProxyType(node_child)
+                #
+            #
+        #
+    #
+
+    def query(self, expression):
+        """
+Returns the XML nodes matching the given query of the supported XPath
+subset. See "XmlQuery" for details.
+
+:param expression: Query expression or compiled query
+
+:return: (object) Generator yielding matching XML nodes or node values
+:since:  v1.1.0
+        """
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.query({0})- (#echo(__LINE__)#)", expression)
+        return self.compile_query(expression).evaluate(self)
+    #
+
+    def register_ns(self, ns, uri):
+        """
+Registers a namespace (URI) for later use with this XML reader instance.
+
+:param ns: Output relevant namespace definition
+:param uri: Uniform Resource Identifier
+
+:since: v1.1.0
+        """
+
+        XmlParser.register_ns(self, ns, uri)
+        self._reset_node_paths_cache()
+    #
+
     def remove_node(self, node_path):
         """
 Remove a node and all children if applicable.
 
-:param node_path: Path to the node - delimiter is space
+:param node_path: Path to the node - delimiter is space; or a compiled path
 
 :return: (bool) False on error
 :since:  v1.0.0
@@ -472,32 +1112,25 @@ Remove a node and all children if applicable.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.remove_node({0})- (#echo(__LINE__)#)", node_path)
         _return = False
 
-        if (type(node_path) is str):
+        node_path = self.compile_path(node_path)
+
+        if (node_path is not None):
             """
 Get the parent node of the target.
             """
 
-            node_path = self._translate_ns_path(node_path)
-            node_path_list = node_path.split(" ")
-
-            if (len(node_path_list) > 1):
-                node_name = node_path_list.pop()
-                node_path = " ".join(node_path_list)
-                node_ptr = self._get_node_ptr(node_path)
+            node_path, node_segments = node_path.get_segments(self.data_ns_predefined_default, self.data_ns)
 
-                if (self.data_cache_node != "" and node_path[:len(self.data_cache_node)] == self.data_cache_node):
-                    self.data_cache_node = ""
-                    self.data_cache_ptr = self._data
-                #
+            if (len(node_segments) > 1):
+                node_name = node_path[node_path.rindex(" ") + 1:]
+                node_path = node_path[:node_path.rindex(" ")]
+                node_ptr = self._get_node_ptr_walker(node_path, node_segments[:-1])
             else:
                 node_name = node_path
                 node_ptr = self._data
-
-                self.data_cache_node = ""
-                self.data_cache_ptr = self._data
             #
 
-            if (isinstance(node_ptr, dict)):
+            if (isinstance(node_ptr, Mapping)):
                 re_result = XmlResource.RE_NODE_POSITION.match(node_name)
 
                 if (re_result is None): node_position = -1
@@ -506,9 +1139,20 @@ Get the parent node of the target.
                     node_position = int(re_result.group(2))
                 #
 
+                node_path_changed = self._get_node_path_joined((XmlResource.RE_NODE_POSITIONS.sub("\\2", node_path) if (len(node_segments) > 1) else ""),
+                                                               node_name
+                                                              )
+
                 node_name = self.translate_ns_name(node_ptr, node_name)
 
                 if (node_name in node_ptr):
+                    self._remove_cached_node_ptrs(node_path_changed)
+                    self._tag_index = None
+
+                    if (len(self._attribute_indexes) > 0):
+                        self._remove_node_from_attribute_indexes(node_path_changed, self._get_node_ptr_child(node_ptr, ( node_name, node_position, False )))
+                    #
+
                     if ("xml.mtree" in node_ptr[node_name]):
                         if (node_position >= 0):
                             if (node_position in node_ptr[node_name]):
@@ -524,11 +1168,13 @@ Get the parent node of the target.
 Update the mtree counter or remove it if applicable.
                         """
 
-                        if (_return):
+                        if (_return and isinstance(node_ptr[node_name], XmlNodeList)):
+                            if (node_ptr[node_name]['xml.mtree'] < 1): node_ptr[node_name] = node_ptr[node_name][0]
+                        elif (_return):
                             node_ptr[node_name]['xml.mtree'] -= 1
 
                             if (node_ptr[node_name]['xml.mtree'] > 0):
-                                node_dict = self.node_type([ ( "xml.mtree", node_ptr[node_name]['xml.mtree'] ) ])
+                                node_dict = self._create_children_node([ ( "xml.mtree", node_ptr[node_name]['xml.mtree'] ) ])
                                 del(node_ptr[node_name]['xml.mtree'])
 
                                 node_position = 0
@@ -544,7 +1190,11 @@ Update the mtree counter or remove it if applicable.
                         #
                     else:
                         del(node_ptr[node_name])
-                        self.remove_node_ns_cache(node_path)
+
+                        self.remove_node_ns_cache(self._get_node_path_joined((XmlResource.RE_NODE_POSITIONS.sub("\\2", node_path) if (len(node_segments) > 1) else ""),
+                                                                             node_name
+                                                                            ))
+
                         _return = True
                     #
                 #
@@ -554,6 +1204,30 @@ Update the mtree counter or remove it if applicable.
         return _return
     #
 
+    def _remove_node_from_attribute_indexes(self, index_node_path, node_ptr):
+        """
+Removes the given node and its descendants from the attribute indexes.
+
+:param index_node_path: Path to the node without positions
+:param node_ptr: XML node removed
+
+:since: v1.1.0
+        """
+
+        if (isinstance(node_ptr, Mapping)):
+            index_node_path_prefix = index_node_path + " "
+
+            for attribute_node_path in self._attribute_indexes:
+                if (attribute_node_path == index_node_path): nodes = [ node_ptr ]
+                elif (attribute_node_path.startswith(index_node_path_prefix) and "xml.item" in node_ptr):
+                    nodes = list(self._iter_index_nodes(node_ptr, self.compile_path(attribute_node_path[len(index_node_path_prefix):]).segments))
+                else: nodes = [ ]
+
+                for node in nodes: self._update_attribute_indexes(attribute_node_path, node, node, None)
+            #
+        #
+    #
+
     def remove_node_ns_cache(self, node_path):
         """
 Removes cached XML namespace data of the given XML node.
@@ -569,11 +1243,46 @@ Removes cached XML namespace data of the given XML node.
         #
     #
 
+    def reset(self):
+        """
+Resets this instance to parse a new XML document. Registered namespaces
+and declared attribute indexes are kept.
+
+:since: v1.1.0
+        """
+
+        XmlParser.reset(self)
+        self._reset_attribute_indexes()
+    #
+
+    def _reset_attribute_indexes(self):
+        """
+Marks all attribute indexes as outdated.
+
+:since: v1.1.0
+        """
+
+        for attribute_indexes in self._attribute_indexes.values():
+            for attribute in attribute_indexes: attribute_indexes[attribute] = None
+        #
+    #
+
+    def _reset_node_paths_cache(self):
+        """
+Invalidates all compiled node paths.
+
+:since: v1.1.0
+        """
+
+        self._node_paths_cache.clear()
+        self._ns_version += 1
+    #
+
     def set_cached_node(self, node_path):
         """
-Set the cache pointer to a specific node.
+Adds the pointer to a specific node to the LRU cache of node pointers.
 
-:param node_path: Path to the node - delimiter is space
+:param node_path: Path to the node - delimiter is space; or a compiled path
 
 :return: (bool) True on success
 :since:  v1.0.0
@@ -586,20 +1295,59 @@ Set the cache pointer to a specific node.
         if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.set_cached_node({0})- (#echo(__LINE__)#)", node_path)
         _return = False
 
-        if (type(node_path) is str):
-            node_path = self._translate_ns_path(node_path)
+        node_path = self.compile_path(node_path)
 
-            if (node_path == self.data_cache_node): _return = True
-            else:
-                node_ptr = self._get_node_ptr(node_path)
+        if (node_path is not None):
+            node_path, node_segments = node_path.get_segments(self.data_ns_predefined_default, self.data_ns)
+            node_ptr = self._get_node_ptr_walker(node_path, node_segments)
 
-                if (isinstance(node_ptr, dict)):
-                    self.data_cache_node = node_path
-                    self.data_cache_ptr = node_ptr
-                    _return = True
-                #
+            if (isinstance(node_ptr, Mapping)):
+                self._cache_node_ptr(node_path, node_ptr)
+                _return = True
+            #
+        #
+
+        return _return
+    #
+
+    def set_configuration(self, configuration):
+        """
+Restores the configuration returned by "get_configuration()". Attribute
+indexes declared afterwards are removed.
+
+:param configuration: Configuration
+
+:since: v1.1.0
+        """
+
+        configuration = configuration.copy()
+        attribute_indexes = configuration.pop("attribute_indexes", None)
+
+        XmlParser.set_configuration(self, configuration)
+
+        if (attribute_indexes is not None):
+            self._attribute_indexes = { }
+
+            for index_node_path, attribute in attribute_indexes:
+                if (index_node_path not in self._attribute_indexes): self._attribute_indexes[index_node_path] = { }
+                self._attribute_indexes[index_node_path][attribute] = None
             #
         #
+    #
+
+    def set_xml_tree(self, data_dict, overwrite = False):
+        """
+Sets the Python representation data of this "XmlResource" instance.
+
+:param data_dict: Python representation data
+:param overwrite: True to overwrite the current (non-empty) cache
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        _return = XmlParser.set_xml_tree(self, data_dict, overwrite)
+        if (_return and len(self._attribute_indexes) > 0): self._reset_attribute_indexes()
 
         return _return
     #
@@ -618,33 +1366,112 @@ node.
 
         _return = name
 
-        re_result = XmlResource.RE_NODE_NAME_XMLNS.match(name)
-
-        if (re_result is not None and re_result.group(1) in self.data_ns and re_result.group(2) in node):
-            translated_name = re_result.group(2)
-
-            if ("xml.mtree" in node[translated_name]):
-                if ("xml.item" in node[translated_name][0]
-                    and "@" in node[translated_name][0]['xml.item']['xmlns']
-                    and node[translated_name][0]['xml.item']['xmlns']['@'] in self.data_ns_compact
-                    and self.data_ns_compact[node[translated_name][0]['xml.item']['xmlns']['@']] == self.data_ns[re_result.group(1)]
-                   ): _return = translated_name
-                elif ("xmlns" in node[translated_name][0]
-                      and "@" in node[translated_name][0]['xmlns']
-                      and node[translated_name][0]['xmlns']['@'] in self.data_ns_compact
-                      and self.data_ns_compact[node[translated_name][0]['xmlns']['@']] == self.data_ns[re_result.group(1)]
-                     ): _return = translated_name
-            elif ("xml.item" in node[translated_name]
-                  and "@" in node[translated_name]['xml.item']['xmlns']
-                  and node[translated_name]['xml.item']['xmlns']['@'] in self.data_ns_compact
-                  and self.data_ns_compact[node[translated_name]['xml.item']['xmlns']['@']] == self.data_ns[re_result.group(1)]
-                 ): _return = translated_name
-            elif ("xmlns" in node[translated_name]
-                  and "@" in node[translated_name]['xmlns']
-                  and node[translated_name]['xmlns']['@'] in self.data_ns_compact
-                  and self.data_ns_compact[node[translated_name]['xmlns']['@']] == self.data_ns[re_result.group(1)]
-                 ): _return = translated_name
+        name_data = self._get_ns_name_data(name)
+
+        if (name_data is not None and name_data[0] in self.data_ns and name_data[1] in node):
+            translated_name = name_data[1]
+            ns_compact = self.data_ns_default.get(self.data_ns[name_data[0]])
+
+            node_ptr = node[translated_name]
+            if ("xml.mtree" in node_ptr): node_ptr = node_ptr[0]
+            if ("xml.item" in node_ptr): node_ptr = node_ptr['xml.item']
+
+            if (ns_compact is not None
+                and "xmlns" in node_ptr
+                and node_ptr['xmlns'].get("@") == ns_compact
+               ): _return = translated_name
+        #
+
+        return _return
+    #
+
+    def _update_attribute_indexes(self, index_node_path, node_ptr, old_node, new_node):
+        """
+Updates the attribute indexes of the given node path for a node added,
+replaced or removed.
+
+:param index_node_path: Path to the node without positions
+:param node_ptr: XML node providing the attributes
+:param old_node: XML node to remove or replace if indexed; None to add
+                 "new_node"
+:param new_node: XML node to add or replace "old_node" with; None to
+                 remove "old_node"
+
+:since: v1.1.0
+        """
+
+        node_attributes = (node_ptr['xml.item'] if ("xml.item" in node_ptr) else node_ptr).get("attributes")
+
+        if (isinstance(node_attributes, dict)):
+            attribute_indexes = self._attribute_indexes[index_node_path]
+
+            for attribute in attribute_indexes:
+                attribute_index = attribute_indexes[attribute]
+
+                if (attribute_index is not None and attribute in node_attributes):
+                    value = node_attributes[attribute]
+                    nodes = attribute_index.get(value, [ ])
+
+                    node_position = -1
+
+                    if (old_node is not None):
+                        for position, node in enumerate(nodes):
+                            if (node is old_node):
+                                node_position = position
+                                break
+                            #
+                        #
+                    #
+
+                    if (new_node is None):
+                        if (node_position >= 0): del(nodes[node_position])
+                    elif (node_position >= 0): nodes[node_position] = new_node
+                    elif (old_node is None): nodes.append(new_node)
+
+                    if (len(nodes) > 0): attribute_index[value] = nodes
+                    elif (value in attribute_index): del(attribute_index[value])
+                #
+            #
         #
+    #
+
+    def unregister_ns(self, ns = ""):
+        """
+Unregisters a namespace or clears the cache (if ns is empty).
+
+:param ns: Output relevant namespace definition
+
+:since: v1.1.0
+        """
+
+        XmlParser.unregister_ns(self, ns)
+        self._reset_node_paths_cache()
+    #
+
+    def xml_to_columnar(self, data, strict_standard_mode = True, encoding = None):
+        """
+Converts XML data into a read-only columnar document. The XML tree of this
+instance is not changed.
+
+:param data: Input XML data
+:param strict_standard_mode: True to be standard compliant
+:param encoding: Encoding of raw XML data overriding the declared one
+
+:return: (object) XmlColumnarDocument instance; None on error
+:since:  v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        if (self._log_handler is not None): self._log_handler.debug("#echo(__FILEPATH__)# -xml.xml_to_columnar()- (#echo(__LINE__)#)")
+        _return = None
+
+        try:
+            self._prepare_parser_instance(False, encoding = encoding)
+            self.parser_instance.strict_standard_mode = strict_standard_mode
+
+            _return = self.parser_instance.parse_columnar(data, XmlColumnarDocument(self))
+        except Exception: pass
 
         return _return
     #
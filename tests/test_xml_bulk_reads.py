@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlResource
+
+NODE_PATHS = [ "r", "r a", "r a#1", "r a#1 b", "r a b", "r c d", "r c d#2", "r c d#3", "r x y", "r ff:e", "r f:e" ]
+"""
+Node paths read in bulk
+"""
+
+XML_DATA = "<r xmlns:f='urn:f'><a><b>1</b></a><a><b>2</b></a><c><d>1</d><d>2</d><d>3</d></c><f:e>4</f:e></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlBulkReads(TestCase):
+    """
+Tests "get_node_values()" and "get_nodes()" against single node reads.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Parses "XML_DATA".
+
+:since: v1.1.0
+        """
+
+        self.xml_resource = XmlResource()
+        self.xml_resource.register_ns("ff", "urn:f")
+        self.xml_resource.parse(XML_DATA)
+    #
+
+    def test_compiled_paths(self):
+        """
+Tests bulk reads with compiled node paths.
+
+:since: v1.1.0
+        """
+
+        node_paths = [ self.xml_resource.compile_path(node_path) for node_path in NODE_PATHS ]
+        values = self.xml_resource.get_node_values(node_paths)
+
+        self.assertEqual(set(node_paths), set(values))
+
+        for node_path in node_paths: self.assertEqual(self.xml_resource.get_node_value(node_path.node_path), values[node_path])
+    #
+
+    def test_get_node_values(self):
+        """
+Tests "get_node_values()".
+
+:since: v1.1.0
+        """
+
+        values = self.xml_resource.get_node_values(NODE_PATHS)
+
+        self.assertEqual(set(NODE_PATHS), set(values))
+        for node_path in NODE_PATHS: self.assertEqual(self.xml_resource.get_node_value(node_path), values[node_path])
+    #
+
+    def test_get_nodes(self):
+        """
+Tests "get_nodes()" with and without the metadata removed.
+
+:since: v1.1.0
+        """
+
+        for remove_metadata in ( True, False ):
+            nodes = self.xml_resource.get_nodes(NODE_PATHS, remove_metadata)
+
+            self.assertEqual(set(NODE_PATHS), set(nodes))
+            for node_path in NODE_PATHS: self.assertEqual(self.xml_resource.get_node(node_path, remove_metadata), nodes[node_path])
+        #
+    #
+#
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlColumnarDocument, XmlResource
+
+NODE_PATHS = [ "r", "r#0", "r#1", "r a", "r a#0", "r a#2", "r a#3", "r a#1 b", "r a b",
+               "r c", "r c d", "r c f:e", "r c#0 d#0", "r x", "r x y"
+             ]
+"""
+Node paths read from the XML tree and the columnar document
+"""
+
+XML_DATA = ("<r xmlns:f='urn:f'><a id='1'>1</a><a id='2'><b>x</b>2</a><a>3</a>"
+            + "<c><d>t &amp; u</d><f:e f:k='v'>w</f:e></c>"
+            + "</r>"
+           )
+"""
+XML document used for all tests
+"""
+
+class TestXmlColumnarDocument(TestCase):
+    """
+Tests lookups in "XmlColumnarDocument" against the ones in the XML tree.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def assert_lookups(self, strict_standard_mode):
+        """
+Asserts that all "NODE_PATHS" return the same results.
+
+:param strict_standard_mode: True to be standard compliant
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA, strict_standard_mode)
+
+        columnar_document = XmlResource().xml_to_columnar(XML_DATA, strict_standard_mode)
+
+        self.assertIsInstance(columnar_document, XmlColumnarDocument)
+
+        for node_path in NODE_PATHS:
+            self.assertEqual(xml_resource.count_node(node_path), columnar_document.count_node(node_path))
+            self.assertEqual(xml_resource.get_node(node_path), columnar_document.get_node(node_path))
+            self.assertEqual(xml_resource.get_node(node_path, False), columnar_document.get_node(node_path, False))
+            self.assertEqual(xml_resource.get_node_attributes(node_path), columnar_document.get_node_attributes(node_path))
+            self.assertEqual(xml_resource.get_node_value(node_path), columnar_document.get_node_value(node_path))
+        #
+    #
+
+    def test_invalid_data(self):
+        """
+Tests that invalid XML data returns None.
+
+:since: v1.1.0
+        """
+
+        self.assertIsNone(XmlResource().xml_to_columnar("<r><a></r>"))
+    #
+
+    def test_lookups(self):
+        """
+Tests lookups in strict standard mode.
+
+:since: v1.1.0
+        """
+
+        self.assert_lookups(True)
+    #
+
+    def test_lookups_non_strict(self):
+        """
+Tests lookups with lowercased node names.
+
+:since: v1.1.0
+        """
+
+        self.assert_lookups(False)
+    #
+
+    def test_positional_count(self):
+        """
+Tests that a node position in the last segment does not match any node.
+
+:since: v1.1.0
+        """
+
+        columnar_document = XmlResource().xml_to_columnar(XML_DATA)
+
+        self.assertEqual(0, columnar_document.count_node("r a#0"))
+        self.assertEqual(3, columnar_document.count_node("r#0 a"))
+    #
+#
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from copy import deepcopy
+from pickle import dumps, loads
+from unittest import TestCase
+
+from dpt_xml import XmlEmptyMapping, XmlResource
+
+XML_DATA = "<r><a/><b x='1'/><c><d/><d/></c></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlEmptyMapping(TestCase):
+    """
+Tests XML trees sharing "XmlEmptyMapping" for nodes without attributes
+against the ones using dicts.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def get_xml_resource(self, shared_empty_attributes):
+        """
+Returns a XmlResource instance with "XML_DATA" parsed.
+
+:param shared_empty_attributes: True to share "XmlEmptyMapping"
+
+:return: (object) XmlResource instance
+:since:  v1.1.0
+        """
+
+        _return = XmlResource()
+        _return.shared_empty_attributes = shared_empty_attributes
+        _return.parse(XML_DATA)
+
+        return _return
+    #
+
+    def test_changes(self):
+        """
+Tests that written attributes replace the shared instance with a dict
+owned by the node.
+
+:since: v1.1.0
+        """
+
+        empty_mapping = XmlEmptyMapping.get_instance()
+
+        dict_resource = self.get_xml_resource(False)
+        xml_resource = self.get_xml_resource(True)
+
+        for xml_resource_instance in ( dict_resource, xml_resource ):
+            xml_resource_instance.change_node_attributes("r a", { "y": "2" })
+            xml_resource_instance.add_node("r e", "", { "z": "3" })
+            xml_resource_instance.add_node("r f")
+            xml_resource_instance.get_node_attributes("r c d#1")['w'] = "4"
+        #
+
+        data = xml_resource.data
+
+        self.assertIs(dict, type(data['r']['a']['attributes']))
+        self.assertIs(dict, type(data['r']['e']['attributes']))
+        self.assertIs(dict, type(data['r']['c']['d'][1]['attributes']))
+        self.assertIs(empty_mapping, data['r']['f']['attributes'])
+        self.assertIs(empty_mapping, data['r']['c']['d'][0]['attributes'])
+
+        self.assertEqual(0, len(empty_mapping))
+        self.assertEqual(dict_resource.data, data)
+        self.assertEqual({ "w": "4" }, xml_resource.get_node_attributes("r c d#1"))
+    #
+
+    def test_copy(self):
+        """
+Tests that copies of the shared instance are empty as well.
+
+:since: v1.1.0
+        """
+
+        empty_mapping = XmlEmptyMapping.get_instance()
+
+        self.assertIs(empty_mapping, XmlEmptyMapping.get_instance())
+        self.assertRaises(TypeError, empty_mapping.__setitem__, "x", "1")
+
+        for copied_mapping in ( loads(dumps(empty_mapping)), loads(dumps(empty_mapping, 2)), deepcopy(empty_mapping) ):
+            self.assertIsInstance(copied_mapping, XmlEmptyMapping)
+            self.assertEqual({ }, copied_mapping)
+        #
+
+        self.assertIs(dict, type(empty_mapping.copy()))
+    #
+
+    def test_get_node_attributes(self):
+        """
+Tests that the returned attributes are writable.
+
+:since: v1.1.0
+        """
+
+        xml_resource = self.get_xml_resource(True)
+        attributes = xml_resource.get_node_attributes("r a")
+
+        self.assertIs(dict, type(attributes))
+        self.assertEqual({ }, attributes)
+
+        attributes['y'] = "2"
+        self.assertEqual({ "y": "2" }, xml_resource.get_node_attributes("r a"))
+        self.assertEqual({ }, XmlEmptyMapping.get_instance())
+    #
+
+    def test_tree(self):
+        """
+Tests that nodes share the instance only if "shared_empty_attributes" is
+set and that the XML trees are equal.
+
+:since: v1.1.0
+        """
+
+        empty_mapping = XmlEmptyMapping.get_instance()
+
+        dict_resource = self.get_xml_resource(False)
+        dict_data = dict_resource.data
+
+        for attributes in ( dict_data['r']['xml.item']['attributes'], dict_data['r']['a']['attributes'], dict_data['r']['c']['d'][0]['attributes'] ):
+            self.assertIs(dict, type(attributes))
+        #
+
+        self.assertIsNot(dict_data['r']['a']['attributes'], dict_data['r']['c']['d'][0]['attributes'])
+
+        xml_resource = self.get_xml_resource(True)
+        data = xml_resource.data
+
+        for attributes in ( data['r']['xml.item']['attributes'], data['r']['a']['attributes'], data['r']['c']['d'][0]['attributes'] ):
+            self.assertIs(empty_mapping, attributes)
+        #
+
+        self.assertIs(dict, type(data['r']['b']['attributes']))
+
+        self.assertEqual(dict_data, data)
+        self.assertEqual(dict_data, loads(dumps(data)))
+        self.assertEqual(dict_resource.export_data(), xml_resource.export_data())
+        self.assertEqual(dict_resource.get_node("r c d#1"), xml_resource.get_node("r c d#1"))
+    #
+#
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+from xml.parsers.expat import ExpatError
+
+from dpt_xml import XmlParser, XmlResource
+
+XML_DATA = (b"<doc xmlns:f='urn:f'><a x='1'>v\xc3\xa4</a>"
+            + b"<b><c>1</c><c>2</c></b>"
+            + b"<f:d>t<![CDATA[<e/>]]></f:d>"
+            + b"</doc>"
+           )
+"""
+XML document used for all tests
+"""
+
+class TestXmlFeed(TestCase):
+    """
+Tests the XML tree of "feed()" and "close()" against the one of "parse()".
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def feed_chunks(self, xml_resource, chunk_size, treemode = True, strict_standard_mode = True):
+        """
+Feeds "XML_DATA" in chunks of the given size and returns the result of
+"close()".
+
+:param xml_resource: XmlResource instance
+:param chunk_size: Size of each chunk
+:param treemode: Create a multi-dimensional result
+:param strict_standard_mode: True to be standard compliant
+
+:return: (dict) Multi-dimensional XML tree or merged one
+:since:  v1.1.0
+        """
+
+        for offset in range(0, len(XML_DATA), chunk_size):
+            xml_resource.feed(XML_DATA[offset:offset + chunk_size], treemode, strict_standard_mode)
+        #
+
+        return xml_resource.close()
+    #
+
+    def test_close_without_feed(self):
+        """
+Tests that "close()" without "feed()" fails like parsing an empty document.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+
+        self.assertRaises(ExpatError, xml_resource.close)
+        self.assertFalse(xml_resource.parser_instance.is_parsing)
+
+        self.feed_chunks(xml_resource, 5)
+        self.assertEqual("2", xml_resource.get_node_value("doc b c#1"))
+    #
+
+    def test_error(self):
+        """
+Tests that a new document can be fed after an error mid-stream.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.feed("<a><b>1</b>")
+
+        self.assertTrue(xml_resource.parser_instance.is_parsing)
+        self.assertRaises(ExpatError, xml_resource.feed, "<c></a>")
+        self.assertFalse(xml_resource.parser_instance.is_parsing)
+        self.assertIsNone(xml_resource.data_view)
+
+        expected_resource = XmlResource()
+        expected_resource.parse(XML_DATA)
+
+        self.feed_chunks(xml_resource, 5)
+        self.assertEqual(expected_resource.data, xml_resource.data)
+    #
+
+    def test_feed(self):
+        """
+Tests that the XML tree equals the one of "parse()" for different chunk
+sizes including ones splitting multi-byte characters.
+
+:since: v1.1.0
+        """
+
+        for strict_standard_mode in ( True, False ):
+            expected_resource = XmlResource()
+            expected_resource.parse(XML_DATA, strict_standard_mode)
+
+            for chunk_size in ( 1, 2, 7, len(XML_DATA) ):
+                xml_resource = XmlResource()
+                data = self.feed_chunks(xml_resource, chunk_size, strict_standard_mode = strict_standard_mode)
+
+                self.assertEqual(expected_resource.data, data)
+                self.assertEqual(expected_resource.data, xml_resource.data)
+                self.assertFalse(xml_resource.parser_instance.is_parsing)
+            #
+        #
+    #
+
+    def test_feed_merged(self):
+        """
+Tests that the merged result equals the one of "xml_to_dict()".
+
+:since: v1.1.0
+        """
+
+        expected_data = XmlParser.xml_to_dict(XML_DATA, False)
+
+        for chunk_size in ( 1, 7 ):
+            self.assertEqual(expected_data, self.feed_chunks(XmlParser(), chunk_size, False))
+        #
+    #
+#
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlResource
+
+XML_DATA = ("<r><items><item id='1'><name>a</name></item><item id='2'><name>b</name></item></items>"
+            + "<other><item id='3'/></other><item id='4'/>"
+            + "</r>"
+           )
+"""
+XML document used for all tests
+"""
+
+class TestXmlIndexes(TestCase):
+    """
+Tests lookups using indexes against the ones searching the XML tree.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def assert_attribute_lookups(self, xml_resource, unindexed_resource, values):
+        """
+Asserts that "find_by_attribute()" returns the same nodes with and without
+the attribute index.
+
+:param xml_resource: XmlResource instance with an attribute index
+:param unindexed_resource: XmlResource instance without one
+:param values: Attribute values to look up
+
+:since: v1.1.0
+        """
+
+        for value in values:
+            self.assertEqual(unindexed_resource.find_by_attribute("r items item", "id", value),
+                             xml_resource.find_by_attribute("r items item", "id", value)
+                            )
+        #
+    #
+
+    def assert_tag_lookups(self, xml_resource, tag):
+        """
+Asserts that "find_all()" returns the nodes found by walking the XML tree
+and that each node path returned leads to the node.
+
+:param xml_resource: XmlResource instance
+:param tag: XML tag
+
+:since: v1.1.0
+        """
+
+        node_entries = xml_resource.find_all(tag, True)
+
+        self.assertEqual(sorted(repr(node) for node in self.get_tag_nodes(xml_resource.data, tag)),
+                         sorted(repr(node_entry[1]) for node_entry in node_entries)
+                        )
+
+        for node_path, node in node_entries:
+            node_ptr = xml_resource.get_node(node_path, False)
+            self.assertEqual((node_ptr['xml.item'] if ("xml.item" in node_ptr) else node_ptr), node)
+        #
+    #
+
+    def get_tag_nodes(self, node_ptr, tag):
+        """
+Returns all nodes with the given tag by walking the XML tree.
+
+:param node_ptr: XML node
+:param tag: XML tag
+
+:return: (list) XML nodes (without children)
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        if ("xml.mtree" in node_ptr):
+            for key in node_ptr:
+                if (key != "xml.mtree"): _return += self.get_tag_nodes(node_ptr[key], tag)
+            #
+        elif ("tag" in node_ptr):
+            if (node_ptr['tag'] == tag): _return.append(node_ptr)
+        else:
+            for key in node_ptr:
+                if (key == "xml.item"):
+                    if (node_ptr[key]['tag'] == tag): _return.append(node_ptr[key])
+                else: _return += self.get_tag_nodes(node_ptr[key], tag)
+            #
+        #
+
+        return _return
+    #
+
+    def test_attribute_index(self):
+        """
+Tests "find_by_attribute()" with an attribute index while the XML tree is
+changed.
+
+:since: v1.1.0
+        """
+
+        changes = [ ( "add_node", "r items item", "", { "id": "5" } ),
+                    ( "change_node_attributes", "r items item#0", { "id": "6" } ),
+                    ( "remove_node", "r items item#1" ),
+                    ( "parse", XML_DATA )
+                  ]
+
+        values = [ "1", "2", "3", "4", "5", "6" ]
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+        self.assertTrue(xml_resource.create_index("r items#0 item", "id"))
+
+        unindexed_resource = XmlResource()
+        unindexed_resource.parse(XML_DATA)
+
+        self.assert_attribute_lookups(xml_resource, unindexed_resource, values)
+        self.assertEqual("a", xml_resource.find_by_attribute("r items item", "id", "1")['name']['value'])
+
+        for change in changes:
+            getattr(xml_resource, change[0])(*change[1:])
+            getattr(unindexed_resource, change[0])(*change[1:])
+
+            self.assert_attribute_lookups(xml_resource, unindexed_resource, values)
+        #
+    #
+
+    def test_tag_index(self):
+        """
+Tests "find_all()" while the XML tree is changed.
+
+:since: v1.1.0
+        """
+
+        changes = [ ( "add_node", "r other item", "", { "id": "5" } ),
+                    ( "add_node", "r other name", "c" ),
+                    ( "remove_node", "r items item#1" ),
+                    ( "parse", XML_DATA )
+                  ]
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+
+        self.assert_tag_lookups(xml_resource, "item")
+        self.assert_tag_lookups(xml_resource, "name")
+
+        for change in changes:
+            getattr(xml_resource, change[0])(*change[1:])
+
+            self.assert_tag_lookups(xml_resource, "item")
+            self.assert_tag_lookups(xml_resource, "name")
+        #
+
+        self.assertEqual([ ], xml_resource.find_all("unknown"))
+    #
+
+    def test_tag_index_on_parse(self):
+        """
+Tests "find_all()" with the tag index built while parsing.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.tag_index_on_parse = True
+        xml_resource.parse(XML_DATA)
+
+        self.assert_tag_lookups(xml_resource, "item")
+        self.assertEqual(4, len(xml_resource.find_all("item")))
+    #
+#
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from operator import setitem
+from unittest import TestCase
+
+try: from types import MappingProxyType
+except ImportError: MappingProxyType = None
+
+from dpt_xml import XmlNodeList, XmlResource
+
+XML_DATA = ("<r><a>0</a><b>b</b>"
+            + "".join("<a>{0:d}</a>".format(position) for position in range(1, 12))
+            + "<c><d>d</d></c><a>12</a>"
+            + "</r>"
+           )
+"""
+XML document used for all tests
+"""
+
+class TestXmlIterChildren(TestCase):
+    """
+Tests "iter_children()", "iter_mtree()" and "data_view" against the nodes
+read with node paths.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def assert_read_only(self, xml_resource, views):
+        """
+Asserts that writing to the given views does not change the XML tree.
+
+:param xml_resource: XmlResource instance with "XML_DATA" parsed
+:param views: Read-only views of XML nodes
+
+:since: v1.1.0
+        """
+
+        expected_resource = XmlResource()
+        expected_resource.parse(XML_DATA)
+
+        for view in views:
+            if (MappingProxyType is not None):
+                self.assertIsInstance(view, MappingProxyType)
+                self.assertRaises(TypeError, setitem, view, "x", "changed")
+            else: view['x'] = "changed"
+        #
+
+        self.assertEqual(expected_resource.data, xml_resource.data)
+    #
+
+    def get_a_values(self, xml_resource):
+        """
+Returns the values of all "r a" nodes read with node paths.
+
+:param xml_resource: XmlResource instance
+
+:return: (list) Node values
+:since:  v1.1.0
+        """
+
+        return [ xml_resource.get_node_value("r a#{0:d}".format(position)) for position in range(xml_resource.count_node("r a")) ]
+    #
+
+    def get_xml_resources(self):
+        """
+Returns XmlResource instances with "XML_DATA" parsed using dicts and
+"XmlNodeList" for repeated nodes.
+
+:return: (list) XmlResource instances
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        for mtree_type in ( None, XmlNodeList ):
+            xml_resource = XmlResource()
+            xml_resource.mtree_type = mtree_type
+            xml_resource.parse(XML_DATA)
+
+            _return.append(xml_resource)
+        #
+
+        return _return
+    #
+
+    def test_data_view(self):
+        """
+Tests that "data_view" rejects writes without copying the XML tree.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        self.assertIsNone(xml_resource.data_view)
+
+        xml_resource.parse(XML_DATA)
+
+        data_view = xml_resource.data_view
+
+        self.assertEqual(xml_resource.data, dict(data_view))
+        self.assertIs(xml_resource.data['r'], data_view['r'])
+
+        self.assert_read_only(xml_resource, [ data_view ])
+    #
+
+    def test_iter_children(self):
+        """
+Tests that repeated child nodes are yielded by position and other child
+nodes once.
+
+:since: v1.1.0
+        """
+
+        for xml_resource in self.get_xml_resources():
+            for _ in range(2):
+                nodes = list(xml_resource.iter_children("r"))
+
+                self.assertEqual(sorted([ "a" ] * xml_resource.count_node("r a") + [ "b", "c" ]),
+                                 sorted((node['xml.item'] if ("xml.item" in node) else node)['tag'] for node in nodes)
+                                )
+
+                self.assertEqual(self.get_a_values(xml_resource), [ node['value'] for node in nodes if node.get("tag") == "a" ])
+                self.assertEqual([ "d" ], [ node['value'] for node in xml_resource.iter_children("r c") ])
+
+                xml_resource.remove_node("r a#3")
+                xml_resource.remove_node("r a#0")
+            #
+
+            self.assertEqual([ "r" ], [ node['xml.item']['tag'] for node in xml_resource.iter_children("") ])
+            self.assertEqual([ ], list(xml_resource.iter_children("r b")))
+            self.assertEqual([ ], list(xml_resource.iter_children("r x")))
+        #
+    #
+
+    def test_iter_mtree(self):
+        """
+Tests that repeated nodes are yielded by position.
+
+:since: v1.1.0
+        """
+
+        for xml_resource in self.get_xml_resources():
+            for _ in range(2):
+                self.assertEqual(self.get_a_values(xml_resource), [ node['value'] for node in xml_resource.iter_mtree("r a") ])
+                self.assertEqual(self.get_a_values(xml_resource), [ node['value'] for node in xml_resource.iter_mtree("r a#5") ])
+
+                xml_resource.remove_node("r a#3")
+                xml_resource.remove_node("r a#0")
+            #
+
+            self.assertEqual([ "b" ], [ node['value'] for node in xml_resource.iter_mtree("r b") ])
+            self.assertEqual([ ], list(xml_resource.iter_mtree("r x")))
+        #
+    #
+
+    def test_read_only(self):
+        """
+Tests that yielded nodes are read-only views.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+
+        self.assert_read_only(xml_resource, xml_resource.iter_children("r"))
+        self.assert_read_only(xml_resource, xml_resource.iter_mtree("r a"))
+    #
+#
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from io import BytesIO
+from unittest import TestCase
+
+from dpt_xml import XmlResource
+
+XML_DATA = (b"<r><item id='1'><n>a</n></item><x/>"
+            + b"<item id='2'><n>b</n></item><Item id='3'/>"
+            + b"</r>"
+           )
+"""
+XML document used for all tests
+"""
+
+class TestXmlIterNodes(TestCase):
+    """
+Tests the nodes yielded by "iter_nodes()" against the XML tree.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_closed_iterator(self):
+        """
+Tests that a new document can be fed after the generator has been closed
+before the document was complete.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+
+        nodes = xml_resource.iter_nodes(BytesIO(XML_DATA), "r item")
+        self.assertEqual("1", next(nodes)['xml.item']['attributes']['id'])
+        nodes.close()
+
+        xml_resource.feed("<x><y>1</y></x>")
+        xml_resource.close()
+
+        self.assertEqual("1", xml_resource.get_node_value("x y"))
+        self.assertEqual(0, xml_resource.count_node("r"))
+    #
+
+    def test_iter_nodes(self):
+        """
+Tests that the streamed nodes equal the ones of the XML tree and are not
+added to it.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+
+        expected_nodes = [ xml_resource.get_node("r item#0", False), xml_resource.get_node("r item#1", False) ]
+
+        xml_resource = XmlResource()
+        nodes = list(xml_resource.iter_nodes(BytesIO(XML_DATA), "r item"))
+
+        self.assertEqual(expected_nodes, nodes)
+        self.assertEqual(0, xml_resource.count_node("r item"))
+        self.assertEqual(1, xml_resource.count_node("r x"))
+    #
+
+    def test_iter_nodes_non_strict(self):
+        """
+Tests that the node path is lowercased in non-strict mode.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA, False)
+
+        expected_nodes = [ xml_resource.get_node("r item#0", False),
+                           xml_resource.get_node("r item#1", False),
+                           xml_resource.get_node("r item#2", False)
+                         ]
+
+        xml_resource = XmlResource()
+        nodes = list(xml_resource.iter_nodes(BytesIO(XML_DATA), "R Item", False))
+
+        self.assertEqual(expected_nodes, nodes)
+    #
+#
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlNamesTable, XmlResource
+
+XML_DATA = "<Doc><Entry ID='1'>a</Entry><Entry ID='2'>b</Entry><Other>c</Other></Doc>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlNamesTable(TestCase):
+    """
+Tests interning names with "XmlNamesTable".
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_clear(self):
+        """
+Tests that "clear()" removes all names and resets the statistics.
+
+:since: v1.1.0
+        """
+
+        names_table = XmlNamesTable()
+        names_table.get("a")
+        names_table.get("a")
+        names_table.get_lowercase("B")
+
+        self.assertEqual({ "hits": 1, "misses": 2, "size": 2, "max_size": None }, names_table.stats)
+
+        names_table.clear()
+        self.assertEqual({ "hits": 0, "misses": 0, "size": 0, "max_size": None }, names_table.stats)
+    #
+
+    def test_eviction(self):
+        """
+Tests that a full table is emptied before the next name is added.
+
+:since: v1.1.0
+        """
+
+        names_table = XmlNamesTable(2)
+        names_table.get("a")
+        names_table.get("b")
+        names_table.get("b")
+
+        self.assertEqual(2, names_table.stats['size'])
+
+        self.assertEqual("c", names_table.get("c"))
+        self.assertEqual(1, names_table.stats['size'])
+
+        names_table.get("a")
+        self.assertEqual(2, names_table.stats['size'])
+        self.assertEqual(4, names_table.stats['misses'])
+    #
+
+    def test_get(self):
+        """
+Tests that equal names are returned as the same instance.
+
+:since: v1.1.0
+        """
+
+        names_table = XmlNamesTable()
+
+        name = "".join([ "ta", "g" ])
+        equal_name = "".join([ "t", "ag" ])
+
+        self.assertIsNot(name, equal_name)
+        self.assertIs(name, names_table.get(name))
+        self.assertIs(name, names_table.get(equal_name))
+    #
+
+    def test_get_lowercase(self):
+        """
+Tests that lowercased names are interned as well.
+
+:since: v1.1.0
+        """
+
+        names_table = XmlNamesTable()
+        name = names_table.get("tag")
+
+        self.assertIs(name, names_table.get_lowercase("TAG"))
+        self.assertIs(name, names_table.get_lowercase("Tag"))
+        self.assertIs(name, names_table.get_lowercase("TAG"))
+    #
+
+    def test_parser_names_table(self):
+        """
+Tests that a names table of its own results in the same XML tree as the
+shared one.
+
+:since: v1.1.0
+        """
+
+        names_table = XmlNamesTable(4)
+
+        for strict_standard_mode in ( True, False ):
+            xml_resource = XmlResource()
+            xml_resource.parse(XML_DATA, strict_standard_mode)
+
+            scoped_resource = XmlResource()
+            scoped_resource.names_table = names_table
+            scoped_resource.parse(XML_DATA, strict_standard_mode)
+
+            self.assertEqual(xml_resource.data, scoped_resource.data)
+        #
+
+        self.assertIs(XmlNamesTable.get_instance(), XmlResource().names_table)
+        self.assertGreater(names_table.stats['misses'], 0)
+    #
+#
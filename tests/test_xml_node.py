@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from pickle import dumps, loads
+from unittest import TestCase
+
+from dpt_xml import XmlNode, XmlNodeChildren, XmlNodeList, XmlResource
+
+NODE_PATHS = [ "doc", "doc a", "doc b", "doc b c", "doc b c#1", "doc f:d", "doc x" ]
+"""
+Node paths read from both XML trees
+"""
+
+XML_DATA = "<doc xmlns:f='urn:f'><a x='1'>v</a><b><c>1</c><c y='2'>2</c></b><f:d>t</f:d></doc>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlNode(TestCase):
+    """
+Tests XML trees using "XmlNode" and "XmlNodeChildren" against the ones
+using dicts.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def get_xml_resource(self, mtree_type = None):
+        """
+Returns a XmlResource instance using "XmlNode" with "XML_DATA" parsed.
+
+:param mtree_type: Container type for repeated XML nodes
+
+:return: (object) XmlResource instance
+:since:  v1.1.0
+        """
+
+        _return = XmlResource(node_type = XmlNode)
+        _return.children_type = XmlNodeChildren
+        _return.mtree_type = mtree_type
+        _return.parse(XML_DATA)
+
+        return _return
+    #
+
+    def test_mapping(self):
+        """
+Tests the mapping interface against the one of a dict.
+
+:since: v1.1.0
+        """
+
+        data = { "tag": "a", "value": "v", "attributes": { "x": "1" }, "xmlns": { }, "tag_ns": "f" }
+        node = XmlNode(**data)
+
+        self.assertEqual(data, node)
+        self.assertEqual(data, dict(node))
+        self.assertEqual(len(data), len(node))
+        self.assertEqual("f", node['tag_ns'])
+        self.assertIsNone(node.get("unknown"))
+
+        del(node['tag_ns'])
+        del(node['value'])
+        self.assertNotIn("value", node)
+        self.assertRaises(KeyError, node.__getitem__, "value")
+
+        node['value'] = "w"
+        self.assertEqual("w", node.value)
+
+        self.assertEqual(dict(node), node.copy())
+        self.assertEqual(node, loads(dumps(node)))
+    #
+
+    def test_node_without_tag(self):
+        """
+Tests that nodes without a tag are XML nodes as well.
+
+:since: v1.1.0
+        """
+
+        node = XmlNode([ ( "xml.item", { "tag": "a" } ) ])
+
+        self.assertIsInstance(node, XmlNode)
+        self.assertEqual({ "xml.item": { "tag": "a" } }, node)
+    #
+
+    def test_tree(self):
+        """
+Tests that the XML tree and lookups equal the ones using dicts.
+
+:since: v1.1.0
+        """
+
+        dict_resource = XmlResource()
+        dict_resource.parse(XML_DATA)
+
+        for mtree_type in ( None, XmlNodeList ):
+            xml_resource = self.get_xml_resource(mtree_type)
+
+            self.assertIsInstance(xml_resource.data['doc'], XmlNodeChildren)
+            self.assertIsInstance(xml_resource.data['doc']['a'], XmlNode)
+
+            for node_path in NODE_PATHS:
+                self.assertEqual(dict_resource.count_node(node_path), xml_resource.count_node(node_path))
+                self.assertEqual(dict_resource.get_node(node_path), xml_resource.get_node(node_path))
+                self.assertEqual(dict_resource.get_node_attributes(node_path), xml_resource.get_node_attributes(node_path))
+                self.assertEqual(dict_resource.get_node_value(node_path), xml_resource.get_node_value(node_path))
+            #
+
+            self.assertEqual(dict_resource.export_data(), xml_resource.export_data())
+        #
+
+        self.assertEqual(dict_resource.data, self.get_xml_resource().data)
+    #
+
+    def test_tree_changes(self):
+        """
+Tests adding and changing nodes.
+
+:since: v1.1.0
+        """
+
+        dict_resource = XmlResource()
+        dict_resource.parse(XML_DATA)
+
+        xml_resource = self.get_xml_resource()
+
+        for xml_resource_instance in ( dict_resource, xml_resource ):
+            xml_resource_instance.add_node("doc e g", "new", { "z": "1" })
+            xml_resource_instance.change_node_value("doc a", "changed")
+            xml_resource_instance.remove_node("doc b c#1")
+        #
+
+        self.assertIsInstance(xml_resource.data['doc']['e'], XmlNodeChildren)
+        self.assertEqual(dict_resource.data, xml_resource.data)
+    #
+#
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlNodeList, XmlResource
+
+NODE_PATHS = [ "r a", "r a#0", "r a#1", "r a#2", "r a#3", "r b", "r b c", "r b c#1" ]
+"""
+Node paths read after each change
+"""
+
+XML_DATA = "<r><a>1</a><a id='2'>2</a><a>3</a><b><c>1</c><c>2</c></b></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlNodeList(TestCase):
+    """
+Tests XML trees using "XmlNodeList" for repeated nodes against the ones
+using dicts.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def assert_equal_trees(self, xml_resource, dict_resource):
+        """
+Asserts that both XML trees return the same results.
+
+:param xml_resource: XmlResource instance using "XmlNodeList"
+:param dict_resource: XmlResource instance using dicts
+
+:since: v1.1.0
+        """
+
+        for node_path in NODE_PATHS:
+            self.assertEqual(dict_resource.count_node(node_path), xml_resource.count_node(node_path))
+            self.assertEqual(dict_resource.get_node_attributes(node_path), xml_resource.get_node_attributes(node_path))
+            self.assertEqual(dict_resource.get_node_value(node_path), xml_resource.get_node_value(node_path))
+        #
+
+        for node_path in ( "r a", "r b c" ):
+            self.assertEqual([ dict(node) for node in dict_resource.iter_mtree(node_path) ],
+                             [ dict(node) for node in xml_resource.iter_mtree(node_path) ]
+                            )
+        #
+    #
+
+    def test_changes(self):
+        """
+Tests both XML trees after each change.
+
+:since: v1.1.0
+        """
+
+        changes = [ ( "add_node", "r a", "4" ),
+                    ( "change_node_value", "r a#1", "changed" ),
+                    ( "remove_node", "r a#0" ),
+                    ( "remove_node", "r b c#1" ),
+                    ( "add_node", "r b c", "3" ),
+                    ( "remove_node", "r a#2" ),
+                    ( "remove_node", "r a#1" ),
+                    ( "remove_node", "r a" )
+                  ]
+
+        xml_resource = XmlResource()
+        xml_resource.mtree_type = XmlNodeList
+        xml_resource.parse(XML_DATA)
+
+        dict_resource = XmlResource()
+        dict_resource.parse(XML_DATA)
+
+        self.assertIsInstance(xml_resource.data['r']['a'], XmlNodeList)
+        self.assert_equal_trees(xml_resource, dict_resource)
+
+        for change in changes:
+            getattr(xml_resource, change[0])(*change[1:])
+            getattr(dict_resource, change[0])(*change[1:])
+
+            self.assert_equal_trees(xml_resource, dict_resource)
+        #
+    #
+
+    def test_mapping(self):
+        """
+Tests the mapping interface against the one of a dict.
+
+:since: v1.1.0
+        """
+
+        nodes = [ { "tag": "a", "value": str(position) } for position in range(3) ]
+        node_list = XmlNodeList(nodes)
+
+        self.assertEqual(dict(enumerate(nodes), **{ "xml.mtree": 2 }), dict(node_list))
+        self.assertEqual(4, len(node_list))
+        self.assertEqual(nodes[1], node_list[1])
+        self.assertEqual(2, node_list['xml.mtree'])
+
+        node_list.append({ "tag": "a", "value": "3" })
+        self.assertEqual(3, node_list['xml.mtree'])
+
+        del(node_list[0])
+        self.assertEqual([ "1", "2", "3" ], [ node_list[position]['value'] for position in range(node_list['xml.mtree'] + 1) ])
+
+        copied_node_list = node_list.copy()
+        self.assertIsInstance(copied_node_list, XmlNodeList)
+        self.assertEqual(dict(node_list), dict(copied_node_list))
+    #
+#
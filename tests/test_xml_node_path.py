@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlNodePath, XmlResource
+
+NODE_PATHS = [ "doc", "doc a", "doc b", "doc b c", "doc b c#1", "doc b#0 c#0", "doc f:d", "doc ff:d", "doc x" ]
+"""
+Node paths used for all tests
+"""
+
+XML_DATA = "<doc xmlns:f='urn:f'><a x='1'>v</a><b><c>1</c><c y='2'>2</c></b><f:d>t</f:d></doc>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlNodePath(TestCase):
+    """
+Tests lookups with compiled node paths against the ones with node path
+strings.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Parses "XML_DATA".
+
+:since: v1.1.0
+        """
+
+        self.xml_resource = XmlResource()
+        self.xml_resource.register_ns("ff", "urn:f")
+        self.xml_resource.parse(XML_DATA)
+    #
+
+    def test_cache(self):
+        """
+Tests that compiled node paths are cached.
+
+:since: v1.1.0
+        """
+
+        node_path = self.xml_resource.compile_path("doc b c")
+
+        self.assertIsInstance(node_path, XmlNodePath)
+        self.assertIs(node_path, self.xml_resource.compile_path("doc b c"))
+        self.assertIs(node_path, self.xml_resource.compile_path(node_path))
+    #
+
+    def test_lookups(self):
+        """
+Tests that compiled node paths return the same results as strings.
+
+:since: v1.1.0
+        """
+
+        for node_path in NODE_PATHS:
+            compiled_node_path = self.xml_resource.compile_path(node_path)
+
+            self.assertEqual(self.xml_resource.count_node(node_path), self.xml_resource.count_node(compiled_node_path))
+            self.assertEqual(self.xml_resource.get_node(node_path), self.xml_resource.get_node(compiled_node_path))
+            self.assertEqual(self.xml_resource.get_node_attributes(node_path), self.xml_resource.get_node_attributes(compiled_node_path))
+            self.assertEqual(self.xml_resource.get_node_value(node_path), self.xml_resource.get_node_value(compiled_node_path))
+        #
+
+        self.assertEqual(self.xml_resource.data['doc']['b']['c'][1]['value'], self.xml_resource.get_node_value(self.xml_resource.compile_path("doc b c#1")))
+    #
+
+    def test_ns_registered_later(self):
+        """
+Tests that compiled node paths are recompiled if a namespace is registered
+afterwards.
+
+:since: v1.1.0
+        """
+
+        node_path = self.xml_resource.compile_path("doc gg:d")
+        self.assertIsNone(self.xml_resource.get_node_value(node_path))
+
+        self.xml_resource.register_ns("gg", "urn:f")
+
+        self.assertEqual("t", self.xml_resource.get_node_value(node_path))
+        self.assertIsNot(node_path, self.xml_resource.compile_path(node_path))
+    #
+#
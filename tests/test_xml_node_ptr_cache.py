@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlResource
+
+NODE_PATHS = [ "r", "r a", "r a#1", "r a#1 b", "r a b", "r c", "r c d", "r c d#2", "r x" ]
+"""
+Node paths read after each change
+"""
+
+XML_DATA = "<r><a><b>1</b></a><a><b>2</b></a><c><d>1</d><d>2</d><d>3</d></c></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlNodePtrCache(TestCase):
+    """
+Tests lookups with the node pointer cache against the ones without it while
+the XML tree is changed.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def assert_equal_lookups(self, xml_resource, uncached_resource):
+        """
+Asserts that all "NODE_PATHS" return the same results.
+
+:param xml_resource: XmlResource instance with a node pointer cache
+:param uncached_resource: XmlResource instance without one
+
+:since: v1.1.0
+        """
+
+        for node_path in NODE_PATHS:
+            self.assertEqual(uncached_resource.count_node(node_path), xml_resource.count_node(node_path))
+            self.assertEqual(uncached_resource.get_node(node_path), xml_resource.get_node(node_path))
+            self.assertEqual(uncached_resource.get_node_value(node_path), xml_resource.get_node_value(node_path))
+        #
+    #
+
+    def test_changes(self):
+        """
+Tests lookups after each change of the XML tree.
+
+:since: v1.1.0
+        """
+
+        changes = [ ( "add_node", "r a#1 b2", "new" ),
+                    ( "change_node_value", "r c d#1", "changed" ),
+                    ( "remove_node", "r a#1" ),
+                    ( "remove_node", "r c d#0" ),
+                    ( "add_node", "r c d", "4" ),
+                    ( "remove_node", "r c" ),
+                    ( "add_node", "r c d", "5" )
+                  ]
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+
+        uncached_resource = XmlResource()
+        uncached_resource.node_ptr_cache_size = 0
+        uncached_resource.parse(XML_DATA)
+
+        self.assert_equal_lookups(xml_resource, uncached_resource)
+
+        for change in changes:
+            getattr(xml_resource, change[0])(*change[1:])
+            getattr(uncached_resource, change[0])(*change[1:])
+
+            self.assertEqual(uncached_resource.data, xml_resource.data)
+            self.assert_equal_lookups(xml_resource, uncached_resource)
+        #
+
+        self.assertGreater(xml_resource.node_ptr_cache_stats['hits'], 0)
+        self.assertEqual(0, uncached_resource.node_ptr_cache_stats['size'])
+    #
+
+    def test_size(self):
+        """
+Tests that the number of cached node pointers is limited.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.node_ptr_cache_size = 2
+        xml_resource.parse(XML_DATA)
+
+        for node_path in NODE_PATHS: xml_resource.get_node_value(node_path)
+
+        self.assertEqual(2, xml_resource.node_ptr_cache_stats['size'])
+    #
+#
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlResource
+
+NODE_PATHS = [ ( "r a", "r a" ),
+               ( "r ff:b", "r f:b" ),
+               ( "r ff:b ff:c", "r f:b f:c" ),
+               ( "r ff:b d", "r f:b d" ),
+               ( "r ff:x", "r f:x" )
+             ]
+"""
+Node paths using the registered namespace prefix and the ones using the
+prefix of the document
+"""
+
+XML_DATA = "<r xmlns:f='urn:f'><a>1</a><f:b><f:c>2</f:c><d>3</d></f:b><f:b><f:c>4</f:c><d>5</d></f:b></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlNsCache(TestCase):
+    """
+Tests node paths using registered namespace prefixes against the ones using
+the prefixes of the document.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def assert_lookups(self, xml_resource):
+        """
+Asserts that all "NODE_PATHS" return the same results.
+
+:param xml_resource: XmlResource instance
+
+:since: v1.1.0
+        """
+
+        for ns_node_path, node_path in NODE_PATHS:
+            self.assertEqual(xml_resource.count_node(node_path), xml_resource.count_node(ns_node_path))
+            self.assertEqual(xml_resource.get_node_value(node_path), xml_resource.get_node_value(ns_node_path))
+        #
+    #
+
+    def test_changes(self):
+        """
+Tests lookups after nodes are added and removed.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.register_ns("ff", "urn:f")
+        xml_resource.parse(XML_DATA)
+
+        self.assert_lookups(xml_resource)
+        self.assertEqual("4", xml_resource.get_node_value("r ff:b ff:c"))
+
+        xml_resource.remove_node("r f:b#1")
+        self.assert_lookups(xml_resource)
+        self.assertEqual("3", xml_resource.get_node_value("r ff:b d"))
+
+        xml_resource.add_node("r f:b f:c", "6")
+        self.assert_lookups(xml_resource)
+        self.assertEqual("6", xml_resource.get_node_value("r ff:b ff:c"))
+    #
+
+    def test_without_ns(self):
+        """
+Tests that node paths of documents without XML namespaces are not cached.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse("<r><a>1</a><b><c>2</c></b></r>")
+
+        self.assertEqual({ }, xml_resource.data_ns_predefined_compact)
+        self.assertEqual({ }, xml_resource.data_ns_predefined_default)
+        self.assertEqual("2", xml_resource.get_node_value("r b c"))
+    #
+#
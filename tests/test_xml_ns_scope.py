@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from copy import copy, deepcopy
+from pickle import dumps, loads
+from unittest import TestCase
+
+from dpt_xml import XmlImmutableDict, XmlNsScope, XmlResource
+
+XML_DATA = "<r xmlns:f='urn:f'><a/><f:b xmlns:g='urn:g'><c/><c/></f:b><d xmlns:f='urn:f'/></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlNsScope(TestCase):
+    """
+Tests "XmlNsScope" and XML trees sharing them against the ones using dicts.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_copy(self):
+        """
+Tests pickle and copy round-trips.
+
+:since: v1.1.0
+        """
+
+        ns_scope = XmlNsScope.get_instance({ "f": 1, "@": 2 })
+
+        for copied_ns_scope in ( loads(dumps(ns_scope)), loads(dumps(ns_scope, 2)), copy(ns_scope), deepcopy(ns_scope) ):
+            self.assertIsInstance(copied_ns_scope, XmlNsScope)
+            self.assertEqual(ns_scope, copied_ns_scope)
+            self.assertEqual(hash(ns_scope), hash(copied_ns_scope))
+        #
+
+        immutable_dict = XmlImmutableDict({ "a": 1 })
+
+        for copied_dict in ( loads(dumps(immutable_dict)), loads(dumps(immutable_dict, 2)), deepcopy(immutable_dict) ):
+            self.assertIsInstance(copied_dict, XmlImmutableDict)
+            self.assertEqual(immutable_dict, copied_dict)
+        #
+
+        self.assertIs(dict, type(ns_scope.copy()))
+    #
+
+    def test_derive(self):
+        """
+Tests deriving scopes with changed namespace bindings.
+
+:since: v1.1.0
+        """
+
+        ns_scope = XmlNsScope.get_instance({ "f": 1 })
+
+        self.assertIs(ns_scope, ns_scope.derive({ "f": 1 }))
+        self.assertIs(ns_scope, ns_scope.derive({ "g": None }))
+
+        derived_ns_scope = ns_scope.derive({ "g": 2 })
+
+        self.assertEqual({ "f": 1, "g": 2 }, derived_ns_scope)
+        self.assertIs(XmlNsScope.get_instance({ "f": 1, "g": 2 }), derived_ns_scope)
+        self.assertIs(derived_ns_scope, ns_scope.derive({ "g": 2 }))
+        self.assertIs(ns_scope, derived_ns_scope.derive({ "g": None }))
+    #
+
+    def test_get_instance(self):
+        """
+Tests that equal scopes are returned as the same instance.
+
+:since: v1.1.0
+        """
+
+        ns_scope = XmlNsScope.get_instance({ "f": 1, "@": 2 })
+
+        self.assertIs(ns_scope, XmlNsScope.get_instance({ "@": 2, "f": 1 }))
+        self.assertIs(ns_scope, XmlNsScope.get_instance(ns_scope))
+        self.assertIsNot(ns_scope, XmlNsScope.get_instance({ "f": 1 }))
+        self.assertEqual({ "f": 1, "@": 2 }, ns_scope)
+        self.assertIsInstance(ns_scope, dict)
+    #
+
+    def test_immutable(self):
+        """
+Tests that write operations raise a TypeError.
+
+:since: v1.1.0
+        """
+
+        ns_scope = XmlNsScope.get_instance({ "f": 1 })
+
+        self.assertRaises(TypeError, ns_scope.__setitem__, "g", 2)
+        self.assertRaises(TypeError, ns_scope.__delitem__, "f")
+        self.assertRaises(TypeError, ns_scope.clear)
+        self.assertRaises(TypeError, ns_scope.pop, "f")
+        self.assertRaises(TypeError, ns_scope.popitem)
+        self.assertRaises(TypeError, ns_scope.setdefault, "g", 2)
+        self.assertRaises(TypeError, ns_scope.update, { "g": 2 })
+
+        self.assertEqual({ "f": 1 }, ns_scope)
+    #
+
+    def test_tree(self):
+        """
+Tests that XML trees sharing scopes equal the ones using dicts and that
+dicts are used by default.
+
+:since: v1.1.0
+        """
+
+        dict_resource = XmlResource()
+        dict_resource.parse(XML_DATA)
+
+        self.assertIs(dict, type(dict_resource.data['r']['a']['xmlns']))
+        self.assertIsNot(dict_resource.data['r']['xml.item']['xmlns'], dict_resource.data['r']['a']['xmlns'])
+
+        xml_resource = XmlResource()
+        xml_resource.shared_ns_scopes = True
+        xml_resource.parse(XML_DATA)
+
+        data = xml_resource.data
+
+        self.assertIsInstance(data['r']['a']['xmlns'], XmlNsScope)
+        self.assertIs(data['r']['xml.item']['xmlns'], data['r']['a']['xmlns'])
+        self.assertIs(data['r']['xml.item']['xmlns'], data['r']['d']['xmlns'])
+        self.assertIs(data['r']['f:b']['xml.item']['xmlns'], data['r']['f:b']['c'][1]['xmlns'])
+
+        self.assertEqual(dict_resource.data, data)
+        self.assertEqual(dict_resource.data, deepcopy(data))
+        self.assertEqual(dict_resource.data, loads(dumps(data)))
+        self.assertEqual(dict_resource.export_data(), xml_resource.export_data())
+
+        for xml_resource_instance in ( dict_resource, xml_resource ):
+            xml_resource_instance.add_node("r f:b e", "new")
+            xml_resource_instance.change_node_attributes("r a", { "xmlns:h": "urn:h" })
+        #
+
+        self.assertEqual(dict_resource.data, xml_resource.data)
+    #
+#
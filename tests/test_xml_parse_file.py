@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from io import BytesIO
+from os import fdopen, remove
+from tempfile import mkstemp
+from unittest import TestCase
+from xml.parsers.expat import ExpatError
+
+from dpt_xml import XmlParser, XmlResource
+
+XML_DATA = b"<r><a x='\xc3\xa4'>v\xc3\xa4</a><b><c>1</c><c>2</c></b></r>"
+"""
+UTF-8 encoded XML document
+"""
+
+XML_DATA_LATIN1 = b"<r><a x='\xe4'>v\xe4</a><b><c>1</c><c>2</c></b></r>"
+"""
+ISO-8859-1 encoded XML document without XML declaration
+"""
+
+class TestXmlParseFile(TestCase):
+    """
+Tests "parse_file()" and raw XML data in other encodings against the XML
+tree of UTF-8 encoded data.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Parses "XML_DATA".
+
+:since: v1.1.0
+        """
+
+        self.expected_resource = XmlResource()
+        self.expected_resource.parse(XML_DATA)
+
+        self.file_path_name = None
+    #
+
+    def tearDown(self):
+        """
+Removes the file written by "write_file()".
+
+:since: v1.1.0
+        """
+
+        if (self.file_path_name is not None): remove(self.file_path_name)
+    #
+
+    def write_file(self, data):
+        """
+Writes the given data to a temporary file.
+
+:param data: File data
+
+:return: (str) File path and name
+:since:  v1.1.0
+        """
+
+        file_descriptor, self.file_path_name = mkstemp(".xml")
+
+        with fdopen(file_descriptor, "wb") as file_obj: file_obj.write(data)
+        return self.file_path_name
+    #
+
+    def test_declared_encoding(self):
+        """
+Tests raw XML data with a declared encoding other than UTF-8.
+
+:since: v1.1.0
+        """
+
+        xml_data = b"<?xml version='1.0' encoding='ISO-8859-1'?>" + XML_DATA_LATIN1
+
+        xml_resource = XmlResource()
+        xml_resource.parse(xml_data)
+        self.assertEqual(self.expected_resource.data, xml_resource.data)
+
+        self.assertEqual(self.expected_resource.data, XmlParser.xml_to_dict(xml_data))
+        self.assertEqual(self.expected_resource.data, XmlResource().parse_file(BytesIO(xml_data)))
+    #
+
+    def test_encoding(self):
+        """
+Tests the "encoding" overriding the declared one.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        self.assertRaises(ExpatError, xml_resource.parse, XML_DATA_LATIN1)
+
+        xml_resource.parse(XML_DATA_LATIN1, encoding = "ISO-8859-1")
+        self.assertEqual(self.expected_resource.data, xml_resource.data)
+
+        xml_data = b"<?xml version='1.0' encoding='UTF-8'?>" + XML_DATA_LATIN1
+        self.assertEqual(self.expected_resource.data, XmlParser.xml_to_dict(xml_data, encoding = "ISO-8859-1"))
+
+        xml_resource = XmlResource()
+        xml_resource.feed(XML_DATA_LATIN1[:10], encoding = "ISO-8859-1")
+        xml_resource.feed(XML_DATA_LATIN1[10:])
+        xml_resource.close()
+        self.assertEqual(self.expected_resource.data, xml_resource.data)
+
+        self.assertEqual(self.expected_resource.data, XmlResource().parse_file(self.write_file(XML_DATA_LATIN1), encoding = "ISO-8859-1"))
+    #
+
+    def test_file_object(self):
+        """
+Tests "parse_file()" with a file object.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+
+        self.assertEqual(self.expected_resource.data, xml_resource.parse_file(BytesIO(XML_DATA)))
+        self.assertEqual(self.expected_resource.data, xml_resource.data)
+
+        merged_data = XmlResource().parse_file(BytesIO(XML_DATA), False)
+        self.assertEqual(XmlParser.xml_to_dict(XML_DATA, False), merged_data)
+    #
+
+    def test_file_path(self):
+        """
+Tests "parse_file()" with a file path.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+
+        self.assertEqual(self.expected_resource.data, xml_resource.parse_file(self.write_file(XML_DATA)))
+        self.assertEqual(self.expected_resource.data, xml_resource.data)
+    #
+
+    def test_large_file(self):
+        """
+Tests files larger than "FILE_CHUNK_SIZE" with a multi-byte character
+split between two chunks.
+
+:since: v1.1.0
+        """
+
+        prefix_data = b"<r><a>"
+        value = b"x" * (XmlParser.FILE_CHUNK_SIZE - len(prefix_data) - 1) + b"\xc3\xa4" + b"y" * 16
+        xml_data = prefix_data + value + b"</a><b>z</b></r>"
+
+        expected_resource = XmlResource()
+        expected_resource.parse(xml_data)
+
+        for source in ( self.write_file(xml_data), BytesIO(xml_data) ):
+            xml_resource = XmlResource()
+            xml_resource.parse_file(source)
+
+            self.assertEqual(expected_resource.get_node_value("r a"), xml_resource.get_node_value("r a"))
+            self.assertEqual("z", xml_resource.get_node_value("r b"))
+        #
+    #
+#
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from threading import Lock
+from unittest import TestCase
+
+from dpt_xml import XmlParser
+
+XML_DOCUMENTS = [ "<r><a id='{0:d}'>{0:d}</a><a>x</a><b/></r>".format(i) for i in range(6) ]
+"""
+XML documents used for all tests
+"""
+
+class TestXmlParseMany(TestCase):
+    """
+Tests the results of "XmlParser.parse_many()" against the ones of
+"XmlParser.xml_to_dict()".
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_merged_unordered(self):
+        """
+Tests merged results yielded as soon as they are complete.
+
+:since: v1.1.0
+        """
+
+        results = sorted(XmlParser.parse_many(XML_DOCUMENTS, 2, False, ordered = False, file_paths = False))
+        self.assertEqual([ ( index, XmlParser.xml_to_dict(data, False) ) for index, data in enumerate(XML_DOCUMENTS) ], results)
+    #
+
+    def test_tree(self):
+        """
+Tests compact XML trees in input order.
+
+:since: v1.1.0
+        """
+
+        results = list(XmlParser.parse_many(XML_DOCUMENTS + [ "<invalid>" ], 2, file_paths = False))
+        self.assertEqual(list(range(len(XML_DOCUMENTS) + 1)), [ index for index, _ in results ])
+
+        for index, data in results[:-1]: self.assertEqual(XmlParser.xml_to_dict(XML_DOCUMENTS[index]), XmlParser().import_compact(data))
+        self.assertIsNone(results[-1][1])
+    #
+
+    def test_unpicklable_source(self):
+        """
+Tests that exceptions raised for a task are re-raised.
+
+:since: v1.1.0
+        """
+
+        sources = XML_DOCUMENTS[:2] + [ Lock() ]
+
+        for ordered in ( True, False ):
+            self.assertRaises(TypeError, list, XmlParser.parse_many(sources, 2, ordered = ordered, file_paths = False))
+        #
+    #
+#
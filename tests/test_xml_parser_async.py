@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name,undefined-variable
+
+from sys import version_info
+from unittest import TestCase, skipIf
+
+try: import asyncio
+except ImportError: asyncio = None
+
+from dpt_xml import XmlResource
+
+XML_DATA = (b"<r><item id='1'><n>a</n></item><x/>"
+            + b"<item id='2'><n>b</n></item><Item id='3'/>"
+            + b"</r>"
+           )
+"""
+XML document used for all tests
+"""
+
+class _ChunkReader(object):
+    """
+Stream reader returning the given XML data in chunks of at most 7 bytes.
+    """
+
+    def __init__(self, data):
+        """
+Constructor __init__(_ChunkReader)
+
+:param data: XML data
+
+:since: v1.1.0
+        """
+
+        self.data = data
+        """
+XML data not yet read
+        """
+    #
+
+    def read(self, size):
+        """
+Reads the next chunk.
+
+:param size: Maximum size to read
+
+:return: (object) Awaitable returning the chunk read
+:since:  v1.1.0
+        """
+
+        size = min(size, 7)
+
+        data = self.data[:size]
+        self.data = self.data[size:]
+
+        return asyncio.sleep(0, data)
+    #
+#
+
+class _FailingChunkReader(_ChunkReader):
+    """
+Stream reader raising an IOError instead of signaling the end of the XML
+data.
+    """
+
+    def read(self, size):
+        """
+Reads the next chunk.
+
+:param size: Maximum size to read
+
+:return: (object) Awaitable returning the chunk read
+:since:  v1.1.0
+        """
+
+        if (len(self.data) < 1): raise IOError("Connection lost")
+        return _ChunkReader.read(self, size)
+    #
+#
+
+@skipIf(version_info[:2] < ( 3, 6 ), "asyncio parsing requires Python 3.6 or newer")
+class TestXmlParserAsync(TestCase):
+    """
+Tests "parse_async()" and "iter_nodes_async()" against the XML tree parsed
+synchronously.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Creates the event loop.
+
+:since: v1.1.0
+        """
+
+        self.loop = asyncio.new_event_loop()
+    #
+
+    def tearDown(self):
+        """
+Closes the event loop.
+
+:since: v1.1.0
+        """
+
+        self.loop.close()
+    #
+
+    def assert_new_document(self, xml_resource):
+        """
+Asserts that a new document can be fed to the given instance.
+
+:param xml_resource: XmlResource instance
+
+:since: v1.1.0
+        """
+
+        xml_resource.feed("<x><y>1</y></x>")
+        xml_resource.close()
+
+        self.assertEqual("1", xml_resource.get_node_value("x y"))
+        self.assertEqual(0, xml_resource.count_node("r"))
+    #
+
+    def get_nodes(self, xml_resource, node_path, strict_standard_mode = True):
+        """
+Returns all nodes yielded by "iter_nodes_async()".
+
+:param xml_resource: XmlResource instance
+:param node_path: Path of the nodes to yield
+:param strict_standard_mode: True to be standard compliant
+
+:return: (list) XML nodes
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+        iterator = xml_resource.iter_nodes_async(_ChunkReader(XML_DATA), node_path, strict_standard_mode)
+
+        try:
+            while True: _return.append(self.loop.run_until_complete(iterator.__anext__()))
+        except StopAsyncIteration: pass
+
+        return _return
+    #
+
+    def test_closed_iter_nodes_async(self):
+        """
+Tests that the parser is reset if the generator is closed before the
+document is complete.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        iterator = xml_resource.iter_nodes_async(_ChunkReader(XML_DATA), "r item")
+
+        self.assertEqual("1", self.loop.run_until_complete(iterator.__anext__())['xml.item']['attributes']['id'])
+        self.loop.run_until_complete(iterator.aclose())
+
+        self.assert_new_document(xml_resource)
+    #
+
+    def test_iter_nodes_async(self):
+        """
+Tests that the streamed nodes equal the ones of the XML tree.
+
+:since: v1.1.0
+        """
+
+        expected_resource = XmlResource()
+        expected_resource.parse(XML_DATA)
+
+        expected_nodes = [ expected_resource.get_node("r item#0", False), expected_resource.get_node("r item#1", False) ]
+
+        self.assertEqual(expected_nodes, self.get_nodes(XmlResource(), "r item"))
+    #
+
+    def test_iter_nodes_async_non_strict(self):
+        """
+Tests that the node path is lowercased in non-strict mode.
+
+:since: v1.1.0
+        """
+
+        expected_resource = XmlResource()
+        expected_resource.parse(XML_DATA, False)
+
+        self.assertEqual(3, len(self.get_nodes(XmlResource(), "R Item", False)))
+        self.assertEqual(expected_resource.get_node("r item#2", False), self.get_nodes(XmlResource(), "r item", False)[2])
+    #
+
+    def test_parse_async(self):
+        """
+Tests that the XML tree equals the one parsed synchronously.
+
+:since: v1.1.0
+        """
+
+        expected_resource = XmlResource()
+        expected_resource.parse(XML_DATA)
+
+        xml_resource = XmlResource()
+        self.loop.run_until_complete(xml_resource.parse_async(_ChunkReader(XML_DATA)))
+
+        self.assertEqual(expected_resource.data, xml_resource.data)
+    #
+
+    def test_parse_async_error(self):
+        """
+Tests that the parser is reset if reading the stream fails.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        self.assertRaises(IOError, self.loop.run_until_complete, xml_resource.parse_async(_FailingChunkReader(XML_DATA[:20])))
+
+        self.assert_new_document(xml_resource)
+    #
+#
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlNodeList, XmlParserPool, XmlResource
+
+XML_DATA = "<r><a id='1'>x</a><a id='2'>y</a><b/></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlParserPool(TestCase):
+    """
+Tests that parser instances of "XmlParserPool" behave like new ones.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def test_configuration_restored(self):
+        """
+Tests that the configuration changed while acquired is restored.
+
+:since: v1.1.0
+        """
+
+        xml_parser_pool = XmlParserPool(1, XmlResource)
+
+        with xml_parser_pool.acquire() as xml_resource:
+            expected_configuration = xml_resource.get_configuration()
+
+            xml_resource.mtree_type = XmlNodeList
+            xml_resource.node_ptr_cache_size = 1
+            xml_resource.set_cdata_encoding(False)
+            xml_resource.create_index("r a", "id")
+        #
+
+        with xml_parser_pool.acquire() as xml_resource:
+            self.assertEqual(expected_configuration, xml_resource.get_configuration())
+        #
+    #
+
+    def test_reused_instance(self):
+        """
+Tests that a reused instance returns the same XML tree as a new one.
+
+:since: v1.1.0
+        """
+
+        expected_resource = XmlResource()
+        expected_resource.parse(XML_DATA)
+
+        xml_parser_pool = XmlParserPool(1, XmlResource)
+
+        with xml_parser_pool.acquire() as xml_resource:
+            first_instance = xml_resource
+            xml_resource.parse("<other><c/></other>")
+        #
+
+        with xml_parser_pool.acquire() as xml_resource:
+            self.assertIs(first_instance, xml_resource)
+            self.assertIsNone(xml_resource.get_node("other"))
+
+            xml_resource.parse(XML_DATA)
+            self.assertEqual(expected_resource.data, xml_resource.data)
+        #
+    #
+#
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlResource
+
+XML_DATA = "<r><a id='1'><x>1</x></a><b><c>2</c><d/></b><a id='2'/></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlProjection(TestCase):
+    """
+Tests XML trees parsed with "include_paths" and "exclude_paths" against the
+full XML tree with the nodes not requested removed.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def assert_projection(self, removed_node_paths, include_paths = None, exclude_paths = None):
+        """
+Asserts that the projected XML tree equals the full one without the given
+nodes.
+
+:param removed_node_paths: List of node paths to remove from the full tree
+:param include_paths: List of node paths the XML tree is limited to
+:param exclude_paths: List of node paths excluded from the XML tree
+
+:since: v1.1.0
+        """
+
+        expected_resource = XmlResource()
+        expected_resource.parse(XML_DATA)
+
+        for node_path in removed_node_paths: expected_resource.remove_node(node_path)
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA, include_paths = include_paths, exclude_paths = exclude_paths)
+
+        self.assertEqual(expected_resource.data, xml_resource.data)
+    #
+
+    def test_exclude_paths(self):
+        """
+Tests "exclude_paths".
+
+:since: v1.1.0
+        """
+
+        self.assert_projection([ "r b c" ], exclude_paths = [ "r b c" ])
+    #
+
+    def test_include_and_exclude_paths(self):
+        """
+Tests "include_paths" combined with "exclude_paths".
+
+:since: v1.1.0
+        """
+
+        self.assert_projection([ "r a#1", "r a", "r b d" ], include_paths = [ "r b" ], exclude_paths = [ "r b d" ])
+    #
+
+    def test_include_paths(self):
+        """
+Tests "include_paths".
+
+:since: v1.1.0
+        """
+
+        self.assert_projection([ "r b" ], include_paths = [ "r a" ])
+    #
+
+    def test_node_positions(self):
+        """
+Tests that node positions in projected node paths raise a ValueError.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+
+        self.assertRaises(ValueError, xml_resource.parse, XML_DATA, include_paths = [ "r a#1" ])
+        self.assertRaises(ValueError, xml_resource.parse, XML_DATA, exclude_paths = [ "r#0 b" ])
+    #
+#
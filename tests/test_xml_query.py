@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlResource
+
+XML_DATA = ("<doc xmlns:f='urn:f'>"
+            + "<section type='x'><entry id='1'>a</entry><entry id='2'>b</entry></section>"
+            + "<section type='y'><entry id='3'>c</entry><sub><entry id='4'>d</entry></sub></section>"
+            + "<other><section type='x'><entry id='5'>e</entry></section></other>"
+            + "<f:meta>m</f:meta>"
+            + "</doc>"
+           )
+"""
+XML document used for all tests
+"""
+
+class TestXmlQuery(TestCase):
+    """
+Tests "XmlResource.query()" against the nodes read with node paths.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def setUp(self):
+        """
+Parses "XML_DATA".
+
+:since: v1.1.0
+        """
+
+        self.xml_resource = XmlResource()
+        self.xml_resource.register_ns("ff", "urn:f")
+        self.xml_resource.parse(XML_DATA)
+    #
+
+    def get_ids(self, expression):
+        """
+Returns the sorted "id" attribute values of the nodes matched. Sibling
+nodes with different names are not ordered in Python versions before 3.7.
+
+:param expression: Query expression
+
+:return: (list) Attribute values
+:since:  v1.1.0
+        """
+
+        return sorted((node['xml.item'] if ("xml.item" in node) else node)['attributes'].get("id")
+                      for node in self.xml_resource.query(expression)
+                     )
+    #
+
+    def test_child_axis(self):
+        """
+Tests queries using the child axis against the nodes read with node paths.
+
+:since: v1.1.0
+        """
+
+        expected_nodes = [ self.xml_resource.get_node("doc section#0 entry#0", False), self.xml_resource.get_node("doc section#1 entry", False) ]
+        self.assertEqual(expected_nodes, list(self.xml_resource.query("/doc/section/entry[1]")))
+
+        self.assertEqual([ "1", "2", "3" ], self.get_ids("/doc/*/entry"))
+        self.assertEqual([ "3" ], self.get_ids("/doc/section[@type='y']/entry"))
+    #
+
+    def test_compile_query(self):
+        """
+Tests that compiled queries are cached.
+
+:since: v1.1.0
+        """
+
+        query = self.xml_resource.compile_query("//entry")
+
+        self.assertIs(query, self.xml_resource.compile_query("//entry"))
+        self.assertEqual(self.get_ids("//entry"), sorted(node['attributes']['id'] for node in self.xml_resource.query(query)))
+    #
+
+    def test_descendant_axis(self):
+        """
+Tests queries using the descendant axis.
+
+:since: v1.1.0
+        """
+
+        self.assertEqual([ "1", "2", "3", "4", "5" ], self.get_ids("//entry"))
+        self.assertEqual([ "1", "2", "5" ], self.get_ids("//section[@type='x']/entry"))
+        self.assertEqual([ "2" ], self.get_ids("//section[@type='x']/entry[2]"))
+        self.assertEqual([ "1", "2", "4", "5" ], self.get_ids("//section//entry[@id!='3']"))
+    #
+
+    def test_invalid_queries(self):
+        """
+Tests that invalid queries raise a ValueError.
+
+:since: v1.1.0
+        """
+
+        for expression in ( "", "/doc/[", "/doc/text()/a", "doc section" ):
+            self.assertRaises(ValueError, self.xml_resource.query, expression)
+        #
+    #
+
+    def test_text(self):
+        """
+Tests "text()" against the node values read with node paths.
+
+:since: v1.1.0
+        """
+
+        expected_values = [ self.xml_resource.get_node_value("doc section#1 entry"), self.xml_resource.get_node_value("doc section#1 sub entry") ]
+        self.assertEqual(sorted(expected_values), sorted(self.xml_resource.query("/doc/section[2]//entry/text()")))
+
+        self.assertEqual([ self.xml_resource.get_node_value("doc ff:meta") ], list(self.xml_resource.query("/doc/ff:meta/text()")))
+        self.assertEqual([ "m" ], list(self.xml_resource.query("/doc/f:meta/text()")))
+    #
+#
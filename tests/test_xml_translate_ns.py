@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+
+from dpt_xml import XmlParser, XmlResource
+
+XML_DATA = "<r xmlns:f='urn:f' xmlns:g='urn:g'><f:a f:k='1' g:l='2' j='3'>v</f:a><b/><ff:c xmlns:ff='urn:f'/></r>"
+"""
+XML document used for all tests
+"""
+
+class TestXmlTranslateNs(TestCase):
+    """
+Tests "translate_ns()" and the caches of registered prefixes.
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def get_xml_resource(self, *ns_list):
+        """
+Returns a XmlResource instance with the given namespaces registered and
+"XML_DATA" parsed.
+
+:param ns_list: Namespaces registered for "urn:f"
+
+:return: (object) XmlResource instance
+:since:  v1.1.0
+        """
+
+        _return = XmlResource()
+        for ns in ns_list: _return.register_ns(ns, "urn:f")
+        _return.parse(XML_DATA)
+
+        return _return
+    #
+
+    def test_first_registered_prefix(self):
+        """
+Tests that the first prefix registered for an URI is used.
+
+:since: v1.1.0
+        """
+
+        for ns_list in ( ( "ff", "aa" ), ( "aa", "ff" ), ( "zz", "ff", "aa" ) ):
+            xml_resource = self.get_xml_resource(*ns_list)
+            node = xml_resource.translate_ns(xml_resource.get_node("r f:a"))
+
+            self.assertEqual(ns_list[0], node['tag_ns'])
+            self.assertEqual("{0}:a".format(ns_list[0]), node['tag_parsed'])
+            self.assertEqual({ "urn:f": ns_list[0] }, xml_resource.data_ns_prefix)
+        #
+    #
+
+    def test_search_dict(self):
+        """
+Tests that "_search_dict()" searches the values.
+
+:since: v1.1.0
+        """
+
+        self.assertEqual("ff", XmlParser._search_dict("urn:f", { "ff": "urn:f", "gg": "urn:g" }))
+        self.assertIsNone(XmlParser._search_dict("ff", { "ff": "urn:f" }))
+    #
+
+    def test_translate_ns(self):
+        """
+Tests the translated tag and attribute names.
+
+:since: v1.1.0
+        """
+
+        xml_resource = self.get_xml_resource("ff")
+        node = xml_resource.translate_ns(xml_resource.get_node("r f:a"))
+
+        self.assertEqual("ff", node['tag_ns'])
+        self.assertEqual("ff:a", node['tag_parsed'])
+        self.assertEqual({ "ff:k": "1", "g:l": "2", "j": "3" }, node['attributes'])
+
+        node = xml_resource.translate_ns(xml_resource.get_node("r b"))
+
+        self.assertEqual("", node['tag_ns'])
+        self.assertEqual("b", node['tag_parsed'])
+
+        node = xml_resource.translate_ns(xml_resource.get_node("r ff:c"))
+
+        self.assertEqual("ff", node['tag_ns'])
+        self.assertEqual("ff:c", node['tag_parsed'])
+    #
+
+    def test_translate_ns_unregistered(self):
+        """
+Tests that names are not translated without registered namespaces.
+
+:since: v1.1.0
+        """
+
+        xml_resource = self.get_xml_resource()
+        node = xml_resource.translate_ns(xml_resource.get_node("r f:a"))
+
+        self.assertEqual("", node['tag_ns'])
+        self.assertEqual("f:a", node['tag_parsed'])
+        self.assertEqual({ "f:k": "1", "g:l": "2", "j": "3" }, node['attributes'])
+    #
+
+    def test_unregister_ns(self):
+        """
+Tests that the caches of registered prefixes are rebuilt after
+"unregister_ns()".
+
+:since: v1.1.0
+        """
+
+        xml_resource = self.get_xml_resource("ff", "aa")
+        xml_resource.register_ns("gg", "urn:g")
+
+        ns_compact = xml_resource.data_ns_default['urn:f']
+        self.assertEqual({ ns_compact: "ff", xml_resource.data_ns_default['urn:g']: "gg" }, xml_resource.data_ns_compact_prefix)
+
+        xml_resource.unregister_ns("ff")
+
+        self.assertEqual({ "urn:f": "aa", "urn:g": "gg" }, xml_resource.data_ns_prefix)
+        self.assertEqual("aa", xml_resource.data_ns_compact_prefix[ns_compact])
+        self.assertEqual("aa:a", xml_resource.translate_ns(xml_resource.get_node("r f:a"))['tag_parsed'])
+
+        xml_resource.unregister_ns("aa")
+
+        self.assertEqual({ "urn:g": "gg" }, xml_resource.data_ns_prefix)
+        self.assertNotIn(ns_compact, xml_resource.data_ns_compact_prefix)
+        self.assertEqual("f:a", xml_resource.translate_ns(xml_resource.get_node("r f:a"))['tag_parsed'])
+
+        xml_resource.unregister_ns()
+
+        self.assertEqual({ }, xml_resource.data_ns_prefix)
+        self.assertEqual({ }, xml_resource.data_ns_compact_prefix)
+    #
+#
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;xml
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptXmlVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from unittest import TestCase
+from xml.parsers.expat import ExpatError
+
+from dpt_xml import XmlParser, XmlResource
+
+XML_DATA = ("<doc xmlns:f='urn:f'><a x='1'>v</a>"
+            + "<b><c>1</c><c>2</c></b>"
+            + "<f:d>t<![CDATA[<e/>]]></f:d>"
+            + "</doc>"
+           )
+"""
+XML document used for all tests
+"""
+
+class TestXmlTree(TestCase):
+    """
+Tests the XML tree built by the expat handlers against the one created with
+"add_node()".
+
+:author:     direct Netware Group
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: xml
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    def get_add_node_tree(self):
+        """
+Returns the XML tree of "XML_DATA" created with "add_node()".
+
+:return: (dict) XML tree
+:since:  v1.1.0
+        """
+
+        xml_resource = XmlResource()
+
+        xml_resource.add_node("doc", "", { "xmlns:f": "urn:f" })
+        xml_resource.add_node("doc a", "v", { "x": "1" })
+        xml_resource.add_node("doc b")
+        xml_resource.add_node("doc b c", "1")
+        xml_resource.add_node("doc b c", "2")
+        xml_resource.add_node("doc f:d", "t<e/>")
+
+        return xml_resource.data
+    #
+
+    def test_export_data(self):
+        """
+Tests that exported XML data results in the same XML tree.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+
+        xml_data = xml_resource.export_data()
+
+        xml_resource = XmlResource()
+        xml_resource.parse(xml_data)
+
+        self.assertEqual(self.get_add_node_tree(), xml_resource.data)
+    #
+
+    def test_merged_dict(self):
+        """
+Tests the merged result.
+
+:since: v1.1.0
+        """
+
+        data = XmlParser.xml_to_dict(XML_DATA, False)
+
+        self.assertEqual({ "tag": "doc", "value": "", "attributes": { "xmlns:f": "urn:f" } }, data['doc'])
+        self.assertEqual({ "tag": "a", "value": "v", "attributes": { "x": "1" } }, data['doc_a'])
+        self.assertEqual([ "1", "2" ], [ node['value'] for node in data['doc_b_c'] ])
+        self.assertEqual("t<e/>", data['doc_f:d']['value'])
+    #
+
+    def test_parse(self):
+        """
+Tests the XML tree of "XmlResource.parse()".
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+
+        self.assertEqual(self.get_add_node_tree(), xml_resource.data)
+        self.assertEqual(2, xml_resource.count_node("doc b c"))
+        self.assertEqual("2", xml_resource.get_node_value("doc b c#1"))
+    #
+
+    def test_parse_error(self):
+        """
+Tests that no partial XML tree is left behind if parsing fails.
+
+:since: v1.1.0
+        """
+
+        xml_parser = XmlParser()
+        self.assertRaises(ExpatError, xml_parser.parse, "<a><b>1</b><c>")
+        self.assertIsNone(xml_parser.data_view)
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA)
+        self.assertEqual("2", xml_resource.get_node_value("doc b c#1"))
+
+        self.assertRaises(ExpatError, xml_resource.parse, "<a><b>1</b><c>")
+        self.assertIsNone(xml_resource.data_view)
+        self.assertEqual(0, xml_resource.node_ptr_cache_stats['size'])
+        self.assertIsNone(xml_resource.get_node_value("a b"))
+
+        xml_resource.parse(XML_DATA)
+        self.assertEqual(self.get_add_node_tree(), xml_resource.data)
+    #
+
+    def test_parse_non_strict(self):
+        """
+Tests that node names are lowercased in non-strict mode.
+
+:since: v1.1.0
+        """
+
+        xml_resource = XmlResource()
+        xml_resource.parse(XML_DATA.replace("<a ", "<A ").replace("</a>", "</A>"), False)
+
+        self.assertEqual(self.get_add_node_tree(), xml_resource.data)
+    #
+
+    def test_xml_to_dict(self):
+        """
+Tests the XML tree of "XmlParser.xml_to_dict()".
+
+:since: v1.1.0
+        """
+
+        self.assertEqual(self.get_add_node_tree(), XmlParser.xml_to_dict(XML_DATA))
+    #
+#